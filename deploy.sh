@@ -48,6 +48,8 @@ fi
 
 # Deploy with source (builds automatically)
 # Increased memory for ADK agents (5 agents + coordinator = ~1GB recommended)
+# CPU stays allocated between requests so the background thread that batches
+# patient history writes to Firestore keeps flushing them (--no-cpu-throttling)
 gcloud run deploy $SERVICE_NAME \
     --source . \
     --region $REGION \
@@ -55,6 +57,8 @@ gcloud run deploy $SERVICE_NAME \
     --memory 1Gi \
     --cpu 2 \
     --timeout 300 \
+    --concurrency 80 \
+    --no-cpu-throttling \
     --max-instances 10 \
     --set-env-vars="GOOGLE_CLOUD_PROJECT=$PROJECT_ID,GEMINI_API_KEY=$GEMINI_API_KEY" \
     --platform managed
@@ -6,12 +6,20 @@ This package contains the four specialized agents for transplant medication adhe
 - MedicationAdvisor: Analyzes missed medication doses
 - SymptomMonitor: Detects transplant rejection symptoms
 - DrugInteractionChecker: Validates medication safety
+
+Agent classes are imported on first attribute access, so importing a
+lightweight submodule (response_parser, prompt_cache) does not pull in
+google.adk and google.genai.
 """
 
-from services.agents.coordinator_agent import TransplantCoordinatorAgent
-from services.agents.drug_interaction_agent import DrugInteractionCheckerAgent
-from services.agents.medication_advisor_agent import MedicationAdvisorAgent
-from services.agents.symptom_monitor_agent import SymptomMonitorAgent
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from services.agents.coordinator_agent import TransplantCoordinatorAgent
+    from services.agents.drug_interaction_agent import DrugInteractionCheckerAgent
+    from services.agents.medication_advisor_agent import MedicationAdvisorAgent
+    from services.agents.symptom_monitor_agent import SymptomMonitorAgent
 
 __version__ = "2.0.0"
 
@@ -21,3 +29,24 @@ __all__ = [
     "SymptomMonitorAgent",
     "DrugInteractionCheckerAgent",
 ]
+
+# Public name -> defining submodule
+_LAZY_EXPORTS = {
+    "TransplantCoordinatorAgent": "services.agents.coordinator_agent",
+    "MedicationAdvisorAgent": "services.agents.medication_advisor_agent",
+    "SymptomMonitorAgent": "services.agents.symptom_monitor_agent",
+    "DrugInteractionCheckerAgent": "services.agents.drug_interaction_agent",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -6,16 +6,91 @@ Handles agent initialization, session management, and async execution patterns.
 """
 
 import asyncio
+import threading
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Coroutine, Iterable
 from typing import Any
 
 from google.adk.agents import Agent  # type: ignore[import-untyped]
+from google.adk.agents.context_cache_config import (
+    ContextCacheConfig,  # type: ignore[import-untyped]
+)
+from google.adk.apps import App  # type: ignore[import-untyped]
 from google.adk.runners import Runner  # type: ignore[import-untyped]
 from google.adk.sessions.in_memory_session_service import (
     InMemorySessionService,  # type: ignore[import-untyped]
 )
 from google.genai import types  # type: ignore[import-untyped]
 
-from services.config.adk_config import DEFAULT_GENERATION_CONFIG, GEMINI_API_KEY
+from services.agents.rate_limiter import get_rate_limiter
+from services.agents.response_parser import extract_response_text
+from services.agents.retry import retry_llm
+from services.config.adk_config import (
+    AGENT_CALL_DEADLINE,
+    AGENT_MAX_CONCURRENCY,
+    CONTEXT_CACHE_CONFIG,
+    DEFAULT_GENERATION_CONFIG,
+    DEFAULT_REQUEST_TIMEOUT,
+    GEMINI_API_KEY,
+)
+
+# Persistent event loop shared by all agents' synchronous entry points.
+# asyncio.run() builds and tears down a loop (plus selector and executor) per
+# call; reusing one loop on a daemon thread removes that fixed overhead.
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting it on first use."""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None or _background_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="adk-agent-loop", daemon=True).start()
+            _background_loop = loop
+    return _background_loop
+
+
+def run_sync[T](coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    The coroutine is scheduled on a persistent background event loop, so
+    this is safe to call whether or not the calling thread has a running loop.
+
+    Args:
+        coro: Coroutine to execute
+
+    Returns:
+        The coroutine's result
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_background_loop()).result()
+
+
+async def gather_limited[T](
+    aws: Iterable[Awaitable[T]], concurrency: int = AGENT_MAX_CONCURRENCY
+) -> list[T]:
+    """
+    Await several awaitables concurrently with a cap on how many run at once.
+
+    Unbounded asyncio.gather over a large batch fires every model call at once
+    and runs into provider rate limits; a semaphore keeps the rest queued.
+
+    Args:
+        aws: Awaitables to run
+        concurrency: Maximum number awaited at the same time
+
+    Returns:
+        Results in input order
+    """
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def _bounded(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return list(await asyncio.gather(*(_bounded(aw) for aw in aws)))
 
 
 class BaseADKAgent:
@@ -29,47 +104,132 @@ class BaseADKAgent:
     - Response parsing interface
     """
 
+    # Shared Agent instances keyed by (app_name, agent name), built on first use
+    _shared_agents: dict[tuple[str, str], Any] = {}
+    _shared_agents_lock = threading.Lock()
+
+    @staticmethod
+    def _generation_settings(agent_config: dict[str, Any]) -> dict[str, Any]:
+        """
+        Return the sampling settings an agent generates with.
+
+        Args:
+            agent_config: Dict with optionally max_output_tokens
+
+        Returns:
+            temperature, top_p, top_k, and max_output_tokens keyword arguments
+        """
+        return {
+            "temperature": DEFAULT_GENERATION_CONFIG["temperature"],
+            "max_output_tokens": int(
+                agent_config.get(
+                    "max_output_tokens", DEFAULT_GENERATION_CONFIG["max_output_tokens"]
+                )
+            ),
+            "top_p": DEFAULT_GENERATION_CONFIG["top_p"],
+            "top_k": DEFAULT_GENERATION_CONFIG["top_k"],
+        }
+
+    @classmethod
+    def _get_shared_agent(
+        cls,
+        agent_config: dict[str, Any],
+        app_name: str,
+        json_output: bool,
+    ) -> Any:
+        """
+        Return the ADK Agent for this app, constructing it on first use.
+
+        Args:
+            agent_config: Dict with name, model, description, instruction, and
+                optionally max_output_tokens
+            app_name: Application name for Runner
+            json_output: Request a JSON response (application/json MIME type)
+
+        Returns:
+            Agent shared by every instance with the same app and agent name
+        """
+        key = (app_name, agent_config["name"])
+        with cls._shared_agents_lock:
+            agent = cls._shared_agents.get(key)
+            if agent is None:
+                # JSON mode only: ADK's LlmAgent rejects a response_schema in
+                # generate_content_config (it must come through output_schema),
+                # so the fields are described in the agent instruction instead
+                structured_output: dict[str, Any] = (
+                    {"response_mime_type": "application/json"} if json_output else {}
+                )
+
+                # Create ADK agent instance with generation config
+                generate_config = types.GenerateContentConfig(
+                    **cls._generation_settings(agent_config), **structured_output
+                )
+
+                agent = Agent(
+                    name=agent_config["name"],
+                    model=agent_config["model"],
+                    description=agent_config["description"],
+                    instruction=agent_config["instruction"],
+                    generate_content_config=generate_config,
+                )
+                cls._shared_agents[key] = agent
+        return agent
+
     def __init__(
         self,
         agent_config: dict[str, Any],
         app_name: str,
         session_id_prefix: str,
         api_key: str | None = None,
+        context_cache: bool = False,
+        json_output: bool = False,
     ):
         """
         Initialize base ADK agent.
 
         Args:
-            agent_config: Dict with name, model, description, instruction
+            agent_config: Dict with name, model, description, instruction, and
+                optionally max_output_tokens
             app_name: Application name for Runner
             session_id_prefix: Prefix for session IDs (e.g., "medication_analysis")
             api_key: Gemini API key (defaults to config if not provided)
+            context_cache: Cache the static instruction prefix with Gemini context
+                caching when enabled in CONTEXT_CACHE_CONFIG
+            json_output: Have the model respond with JSON (application/json MIME type)
         """
         self.api_key = api_key or GEMINI_API_KEY
         self.session_id_prefix = session_id_prefix
 
-        # Create ADK agent instance with generation config
-        generate_config = types.GenerateContentConfig(
-            temperature=DEFAULT_GENERATION_CONFIG["temperature"],
-            max_output_tokens=int(DEFAULT_GENERATION_CONFIG["max_output_tokens"]),
-            top_p=DEFAULT_GENERATION_CONFIG["top_p"],
-            top_k=DEFAULT_GENERATION_CONFIG["top_k"],
-        )
-
-        self.agent = Agent(
-            name=agent_config["name"],
-            model=agent_config["model"],
-            description=agent_config["description"],
-            instruction=agent_config["instruction"],
-            generate_content_config=generate_config,
-        )
+        # Agents hold no per-run state (sessions live in each Runner), so
+        # instances of the same app share one Agent and generation config
+        self.agent = self._get_shared_agent(agent_config, app_name, json_output)
 
         # Create Runner with in-memory session service
-        self.runner = Runner(
-            app_name=app_name,
-            agent=self.agent,
-            session_service=InMemorySessionService(),
-        )
+        if context_cache and CONTEXT_CACHE_CONFIG["enabled"]:
+            # Wrap the agent in an App so ADK caches the static instruction
+            # prefix and each call only sends the per-request prompt
+            app = App(
+                name=app_name,
+                root_agent=self.agent,
+                context_cache_config=ContextCacheConfig(
+                    min_tokens=CONTEXT_CACHE_CONFIG["min_tokens"],
+                    ttl_seconds=CONTEXT_CACHE_CONFIG["ttl_seconds"],
+                    cache_intervals=CONTEXT_CACHE_CONFIG["cache_intervals"],
+                ),
+            )
+            self.runner = Runner(app=app, session_service=InMemorySessionService())
+        else:
+            self.runner = Runner(
+                app_name=app_name,
+                agent=self.agent,
+                session_service=InMemorySessionService(),
+            )
+
+        # Shared per-model throttle (no-op unless GEMINI_RPM_LIMIT is set)
+        self._rate_limiter = get_rate_limiter(agent_config["model"])
+
+        # Upper bound on one call; a stalled call times out and is retried
+        self.request_timeout = float(agent_config.get("request_timeout", DEFAULT_REQUEST_TIMEOUT))
 
     def _invoke_agent(self, prompt: str) -> str:
         """
@@ -81,36 +241,75 @@ class BaseADKAgent:
         Returns:
             Agent response text
         """
+        return run_sync(self._invoke_agent_async(prompt))
 
-        async def _run_agent() -> str:
-            response_text = ""
-            user_message = types.Content(role="user", parts=[types.Part(text=prompt)])
+    @retry_llm(deadline=AGENT_CALL_DEADLINE)
+    async def _invoke_agent_async(self, prompt: str, session_prefix: str | None = None) -> str:
+        """
+        Invoke agent with a prompt on the caller's event loop.
 
-            # Create session if it doesn't exist
-            session = await self.runner.session_service.get_session(  # type: ignore[attr-defined]
-                app_name=self.runner.app_name,  # type: ignore[attr-defined]
-                user_id="system",
-                session_id=self.session_id_prefix,
-            )
-            if not session:
-                await self.runner.session_service.create_session(  # type: ignore[attr-defined]
-                    app_name=self.runner.app_name,  # type: ignore[attr-defined]
-                    user_id="system",
-                    session_id=self.session_id_prefix,
-                )
+        Args:
+            prompt: User prompt for the agent
+            session_prefix: Session ID prefix for this call (defaults to session_id_prefix)
 
+        Calls exceeding request_timeout are abandoned; they and other transient
+        failures (429, 5xx) are retried with backoff, for at most
+        AGENT_CALL_DEADLINE seconds in total.
+
+        Returns:
+            Agent response text
+        """
+        return await asyncio.wait_for(
+            self._collect_response(prompt, session_prefix), timeout=self.request_timeout
+        )
+
+    async def _collect_response(self, prompt: str, session_prefix: str | None = None) -> str:
+        """Run the agent and join the streamed response text."""
+        return "".join([chunk async for chunk in self._stream_agent_async(prompt, session_prefix)])
+
+    async def _stream_agent_async(
+        self, prompt: str, session_prefix: str | None = None
+    ) -> AsyncIterator[str]:
+        """
+        Invoke agent with a prompt and yield response text as it streams in.
+
+        Agent instances are shared across request threads, and a shared session
+        would replay every earlier caller's prompt (and patient data) to the model
+        on each call. Each call therefore runs in its own session, deleted once the
+        response is complete; concurrent calls never share history.
+
+        Args:
+            prompt: User prompt for the agent
+            session_prefix: Session ID prefix for this call (defaults to session_id_prefix)
+
+        Yields:
+            Text of each response part, in arrival order
+        """
+        user_message = types.Content(role="user", parts=[types.Part(text=prompt)])
+        session_id = f"{session_prefix or self.session_id_prefix}_{uuid.uuid4().hex}"
+
+        await self.runner.session_service.create_session(  # type: ignore[attr-defined]
+            app_name=self.runner.app_name,  # type: ignore[attr-defined]
+            user_id="system",
+            session_id=session_id,
+        )
+        try:
+            await self._rate_limiter.acquire()
             async for event in self.runner.run_async(  # type: ignore[attr-defined]
                 user_id="system",
-                session_id=self.session_id_prefix,
+                session_id=session_id,
                 new_message=user_message,
             ):
                 if hasattr(event, "content") and event.content and event.content.parts:
                     for part in event.content.parts:
                         if part.text:
-                            response_text += part.text
-            return response_text
-
-        return asyncio.run(_run_agent())
+                            yield part.text
+        finally:
+            await self.runner.session_service.delete_session(  # type: ignore[attr-defined]
+                app_name=self.runner.app_name,  # type: ignore[attr-defined]
+                user_id="system",
+                session_id=session_id,
+            )
 
     def _parse_agent_response(self, response: Any) -> dict[str, Any]:
         """
@@ -125,7 +324,7 @@ class BaseADKAgent:
             Structured dict with agent response data
         """
         # Default implementation - subclasses should override
-        response_text = str(response)
+        response_text = extract_response_text(response)
 
         return {
             "agent_name": self.agent.name,
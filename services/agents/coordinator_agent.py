@@ -6,23 +6,119 @@ specialist agents and synthesizes their responses.
 """
 
 import asyncio
+import functools
+import json
+import logging
+import re
+from collections.abc import AsyncIterator
 from typing import Any
 
-from google.adk.agents import Agent  # type: ignore[import-untyped]
-from google.adk.runners import Runner  # type: ignore[import-untyped]
-from google.adk.sessions.in_memory_session_service import (
-    InMemorySessionService,  # type: ignore[import-untyped]
+from services.agents.base_adk_agent import BaseADKAgent, run_sync
+from services.agents.prompt_cache import LRUCache, prompt_key
+from services.config.adk_config import COORDINATOR_CONFIG, SYNTHESIS_CACHE_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+# Keyword routing: one compiled case-insensitive alternation per specialist,
+# matched as substrings and checked in this order
+_ROUTING_KEYWORD_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = tuple(
+    (agent_name, re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE))
+    for agent_name, keywords in (
+        ("MedicationAdvisor", ("missed", "late", "dose", "timing", "forgot")),
+        ("SymptomMonitor", ("symptom", "feeling", "fever", "pain", "rejection", "urine", "weight")),
+        (
+            "DrugInteractionChecker",
+            (
+                "interaction",
+                "taking",
+                "new medication",
+                "food",
+                "grapefruit",
+                "ibuprofen",
+                "supplement",
+            ),
+        ),
+    )
 )
-from google.genai import types  # type: ignore[import-untyped]
 
-from services.config.adk_config import (
-    COORDINATOR_CONFIG,
-    DEFAULT_GENERATION_CONFIG,
-    GEMINI_API_KEY,
+# Static parts of the routing and synthesis prompts, built once at import.
+# Only the patient request (and specialist output) varies per call.
+_ROUTING_PROMPT_PREFIX = """Analyze this patient request and determine which specialist agents to consult:
+
+Request: """
+
+_ROUTING_PROMPT_SUFFIX = """
+
+Available agents:
+- MedicationAdvisor: For missed doses, medication timing questions
+- SymptomMonitor: For symptoms, side effects, rejection concerns
+- DrugInteractionChecker: For drug interactions, new medications, food/supplement questions
+
+Respond with JSON: {
+    "agents_needed": ["agent_name1", "agent_name2"],
+    "reasoning": "explanation of why these agents are needed",
+    "request_type": "missed_dose|symptom_check|interaction_check|multi_concern"
+}"""
+
+_SYNTHESIS_PROMPT_FOOTER = (
+    "\nSynthesize a comprehensive response that integrates all specialist recommendations. "
+    "Prioritize patient safety and provide clear, actionable guidance."
 )
 
+_FALLBACK_ROUTING_REASONING = "Routing analysis unavailable; routed by request keywords."
+
+
+@functools.lru_cache(maxsize=16)
+def _classify_agents(agents_needed: frozenset[str]) -> str:
+    """Classify request type for a set of agents (only 2^3 possible inputs)."""
+    if len(agents_needed) > 1:
+        return "multi_concern"
+    if "MedicationAdvisor" in agents_needed:
+        return "missed_dose"
+    if "SymptomMonitor" in agents_needed:
+        return "symptom_check"
+    if "DrugInteractionChecker" in agents_needed:
+        return "interaction_check"
+    return "general_inquiry"
+
+
+def _synthesis_cache_key(
+    request: str, routing_decision: dict[str, Any], specialist_responses: dict[str, Any]
+) -> str:
+    """
+    Compute the synthesis cache key from the inputs that determine the answer.
+
+    The synthesis prompt also embeds the routing analysis, which is free-form
+    model output that differs between otherwise identical requests, so keying
+    on the prompt would almost never hit. The key covers the request (case and
+    whitespace normalized), the selected agents, and each specialist's
+    agent/status/response fields instead.
+
+    Args:
+        request: Patient request text
+        routing_decision: Routing decision with agents_needed
+        specialist_responses: Responses from specialist agents
 
-class TransplantCoordinatorAgent:
+    Returns:
+        Stable cache key
+    """
+    specialists = {
+        name: [data.get("agent", name), data.get("status"), " ".join(str(data["response"]).split())]
+        for name, data in specialist_responses.items()
+    }
+    return prompt_key(
+        json.dumps(
+            [
+                " ".join(request.split()).casefold(),
+                sorted(routing_decision.get("agents_needed", [])),
+                specialists,
+            ],
+            sort_keys=True,
+        )
+    )
+
+
+class TransplantCoordinatorAgent(BaseADKAgent):
     """
     ADK Coordinator Agent for routing and orchestrating specialist agents.
 
@@ -39,6 +135,7 @@ class TransplantCoordinatorAgent:
         medication_advisor: Any | None = None,
         symptom_monitor: Any | None = None,
         drug_interaction_checker: Any | None = None,
+        synthesis_cache_size: int = SYNTHESIS_CACHE_SIZE,
     ):
         """
         Initialize the TransplantCoordinator agent.
@@ -48,30 +145,13 @@ class TransplantCoordinatorAgent:
             medication_advisor: MedicationAdvisorAgent instance (for delegation)
             symptom_monitor: SymptomMonitorAgent instance (for delegation)
             drug_interaction_checker: DrugInteractionCheckerAgent instance (for delegation)
+            synthesis_cache_size: Max cached synthesis responses (0 disables caching)
         """
-        self.api_key = api_key or GEMINI_API_KEY
-
-        # Create ADK agent instance with generation config
-        generate_config = types.GenerateContentConfig(
-            temperature=DEFAULT_GENERATION_CONFIG["temperature"],
-            max_output_tokens=int(DEFAULT_GENERATION_CONFIG["max_output_tokens"]),
-            top_p=DEFAULT_GENERATION_CONFIG["top_p"],
-            top_k=DEFAULT_GENERATION_CONFIG["top_k"],
-        )
-
-        self.agent = Agent(
-            name=COORDINATOR_CONFIG["name"],
-            model=COORDINATOR_CONFIG["model"],
-            description=COORDINATOR_CONFIG["description"],
-            instruction=COORDINATOR_CONFIG["instruction"],
-            generate_content_config=generate_config,
-        )
-
-        # Create Runner with in-memory session service
-        self.runner = Runner(
+        super().__init__(
+            agent_config=COORDINATOR_CONFIG,
             app_name="TransplantCoordinator",
-            agent=self.agent,
-            session_service=InMemorySessionService(),
+            session_id_prefix="coordinator",
+            api_key=api_key,
         )
 
         # Store specialist agent references
@@ -79,6 +159,10 @@ class TransplantCoordinatorAgent:
         self.symptom_monitor = symptom_monitor
         self.drug_interaction_checker = drug_interaction_checker
 
+        # Synthesis depends on the request, the routed agents, and what the
+        # specialists said, so repeats of all three reuse the previous LLM response
+        self._synth_cache = LRUCache(maxsize=synthesis_cache_size)
+
     def route_request(
         self,
         request: str,
@@ -133,86 +217,35 @@ class TransplantCoordinatorAgent:
             Dict with routing decisions and reasoning
         """
         # Use coordinator agent to determine routing
-        prompt = f"""Analyze this patient request and determine which specialist agents to consult:
+        prompt = _ROUTING_PROMPT_PREFIX + request + _ROUTING_PROMPT_SUFFIX
 
-Request: {request}
+        try:
+            response = run_sync(self._invoke_agent_async(prompt, "routing_analysis"))
+        except Exception as e:
+            # Keyword routing below does not depend on the LLM analysis
+            _LOGGER.warning("Routing analysis error: %s, using fallback", e)
+            response = _FALLBACK_ROUTING_REASONING
 
-Available agents:
-- MedicationAdvisor: For missed doses, medication timing questions
-- SymptomMonitor: For symptoms, side effects, rejection concerns
-- DrugInteractionChecker: For drug interactions, new medications, food/supplement questions
+        return self._build_routing_decision(request, response)
 
-Respond with JSON: {{
-    "agents_needed": ["agent_name1", "agent_name2"],
-    "reasoning": "explanation of why these agents are needed",
-    "request_type": "missed_dose|symptom_check|interaction_check|multi_concern"
-}}"""
-
-        # Use Runner.run_async() with proper session/user context
-        async def _run_agent():
-            response_text = ""
-            user_message = types.Content(role="user", parts=[types.Part(text=prompt)])
-
-            # Create session if it doesn't exist
-            session = await self.runner.session_service.get_session(  # type: ignore[attr-defined]
-                app_name=self.runner.app_name,  # type: ignore[attr-defined]
-                user_id="system",
-                session_id="routing_analysis",
-            )
-            if not session:
-                await self.runner.session_service.create_session(  # type: ignore[attr-defined]
-                    app_name=self.runner.app_name,  # type: ignore[attr-defined]
-                    user_id="system",
-                    session_id="routing_analysis",
-                )
-
-            async for event in self.runner.run_async(  # type: ignore[attr-defined]
-                user_id="system",
-                session_id="routing_analysis",
-                new_message=user_message,
-            ):
-                # Collect text from events
-                if hasattr(event, "content") and event.content and event.content.parts:
-                    for part in event.content.parts:
-                        if part.text:
-                            response_text += part.text
-            return response_text
-
-        response = asyncio.run(_run_agent())
+    def _build_routing_decision(self, request: str, response: str) -> dict[str, Any]:
+        """
+        Build routing decision from the request text and routing analysis.
+
+        Args:
+            request: Patient request text
+            response: Coordinator routing analysis text
 
+        Returns:
+            Dict with routing decisions and reasoning
+        """
         # Parse routing decision (simplified for now)
         # In real implementation, parse JSON from response
-        request_lower = request.lower()
-
-        agents_needed = []
-        if any(word in request_lower for word in ["missed", "late", "dose", "timing", "forgot"]):
-            agents_needed.append("MedicationAdvisor")
-        if any(
-            word in request_lower
-            for word in [
-                "symptom",
-                "feeling",
-                "fever",
-                "pain",
-                "rejection",
-                "urine",
-                "weight",
-            ]
-        ):
-            agents_needed.append("SymptomMonitor")
-        if any(
-            word in request_lower
-            for word in [
-                "interaction",
-                "taking",
-                "new medication",
-                "food",
-                "grapefruit",
-                "ibuprofen",
-                "supplement",
-            ]
-        ):
-            agents_needed.append("DrugInteractionChecker")
+        agents_needed = [
+            agent_name
+            for agent_name, pattern in _ROUTING_KEYWORD_PATTERNS
+            if pattern.search(request)
+        ]
 
         # Default to MedicationAdvisor if unclear
         if not agents_needed:
@@ -226,15 +259,7 @@ Respond with JSON: {{
 
     def _classify_request_type(self, agents_needed: list[str]) -> str:
         """Classify request type based on agents needed."""
-        if len(agents_needed) > 1:
-            return "multi_concern"
-        if "MedicationAdvisor" in agents_needed:
-            return "missed_dose"
-        if "SymptomMonitor" in agents_needed:
-            return "symptom_check"
-        if "DrugInteractionChecker" in agents_needed:
-            return "interaction_check"
-        return "general_inquiry"
+        return _classify_agents(frozenset(agents_needed))
 
     def _consult_specialists(
         self,
@@ -261,7 +286,7 @@ Respond with JSON: {{
 
         if parallel:
             # Parallel execution using asyncio.gather()
-            return asyncio.run(self._consult_specialists_parallel(agents_needed))
+            return run_sync(self._consult_specialists_parallel(agents_needed))
         else:
             # Sequential execution
             return self._consult_specialists_sequential(agents_needed)
@@ -375,7 +400,35 @@ Respond with JSON: {{
         Returns:
             Synthesized response with comprehensive recommendations
         """
-        # Build synthesis prompt
+        cache_key = _synthesis_cache_key(request, routing_decision, specialist_responses)
+        coordinator_response = self._synth_cache.get(cache_key)
+        if coordinator_response is None:
+            synthesis_prompt = self._build_synthesis_prompt(
+                request=request,
+                routing_decision=routing_decision,
+                specialist_responses=specialist_responses,
+            )
+            coordinator_response = run_sync(self._invoke_agent_async(synthesis_prompt, "synthesis"))
+            self._synth_cache[cache_key] = coordinator_response
+
+        return {
+            "agents_consulted": list(specialist_responses.keys()),
+            "recommendations": str(coordinator_response),
+            "specialist_responses": specialist_responses,
+            "coordinator_analysis": routing_decision["reasoning"],
+            "request_type": routing_decision["request_type"],
+            "confidence": 0.85,
+            "agent_name": self.agent.name,
+            "raw_response": str(coordinator_response),
+        }
+
+    def _build_synthesis_prompt(
+        self,
+        request: str,
+        routing_decision: dict[str, Any],
+        specialist_responses: dict[str, Any],
+    ) -> str:
+        """Build prompt asking the coordinator to synthesize specialist responses."""
         prompt_parts = [
             f"Original request: {request}",
             f"\nRouting decision: {routing_decision['reasoning']}",
@@ -385,55 +438,54 @@ Respond with JSON: {{
         for agent_name, response_data in specialist_responses.items():
             prompt_parts.append(f"- {agent_name}: {response_data['response']}")
 
-        prompt_parts.append(
-            "\nSynthesize a comprehensive response that integrates all specialist recommendations. "
-            "Prioritize patient safety and provide clear, actionable guidance."
-        )
+        prompt_parts.append(_SYNTHESIS_PROMPT_FOOTER)
 
-        synthesis_prompt = "\n".join(prompt_parts)
+        return "\n".join(prompt_parts)
 
-        # Use Runner.run_async() with proper session/user context
-        async def _run_agent():
-            synthesis_text = ""
-            user_message = types.Content(role="user", parts=[types.Part(text=synthesis_prompt)])
+    async def aroute_request_stream(self, request: str) -> AsyncIterator[str]:
+        """
+        Route a patient request and stream the synthesized recommendation.
 
-            # Create session if it doesn't exist
-            session = await self.runner.session_service.get_session(  # type: ignore[attr-defined]
-                app_name=self.runner.app_name,  # type: ignore[attr-defined]
-                user_id="system",
-                session_id="synthesis",
-            )
-            if not session:
-                await self.runner.session_service.create_session(  # type: ignore[attr-defined]
-                    app_name=self.runner.app_name,  # type: ignore[attr-defined]
-                    user_id="system",
-                    session_id="synthesis",
-                )
-
-            async for event in self.runner.run_async(  # type: ignore[attr-defined]
-                user_id="system",
-                session_id="synthesis",
-                new_message=user_message,
-            ):
-                # Collect text from events
-                if hasattr(event, "content") and event.content and event.content.parts:
-                    for part in event.content.parts:
-                        if part.text:
-                            synthesis_text += part.text
-            return synthesis_text
-
-        coordinator_response = asyncio.run(_run_agent())
+        Routing and specialist consultation complete before anything is yielded;
+        the final synthesis is then yielded chunk by chunk as the model generates
+        it, so callers can start forwarding output before generation finishes.
+        Specialists are consulted on the request text alone (route_request accepts
+        patient_id and patient_context but doesn't forward them to specialists yet).
 
-        return {
-            "agents_consulted": list(specialist_responses.keys()),
-            "recommendations": str(coordinator_response),
-            "specialist_responses": specialist_responses,
-            "coordinator_analysis": routing_decision["reasoning"],
-            "request_type": routing_decision["request_type"],
-            "confidence": 0.85,
-            "agent_name": self.agent.name,
-            "raw_response": str(coordinator_response),
-        }
+        Args:
+            request: Patient request text
+
+        Yields:
+            Chunks of the synthesized recommendation text
+        """
+        routing_prompt = _ROUTING_PROMPT_PREFIX + request + _ROUTING_PROMPT_SUFFIX
+        try:
+            routing_response = await self._invoke_agent_async(routing_prompt, "routing_analysis")
+        except Exception as e:
+            _LOGGER.warning("Routing analysis error: %s, using fallback", e)
+            routing_response = _FALLBACK_ROUTING_REASONING
+        routing_decision = self._build_routing_decision(request, routing_response)
+
+        specialist_responses = await self._consult_specialists_parallel(
+            routing_decision.get("agents_needed", [])
+        )
+
+        cache_key = _synthesis_cache_key(request, routing_decision, specialist_responses)
+        cached = self._synth_cache.get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        synthesis_prompt = self._build_synthesis_prompt(
+            request=request,
+            routing_decision=routing_decision,
+            specialist_responses=specialist_responses,
+        )
+        chunks = []
+        async for chunk in self._stream_agent_async(synthesis_prompt, "synthesis"):
+            chunks.append(chunk)
+            yield chunk
+        self._synth_cache[cache_key] = "".join(chunks)
 
     def get_agent_capabilities(self) -> dict[str, Any]:
         """
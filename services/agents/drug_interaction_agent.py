@@ -5,11 +5,201 @@ Specialized ADK agent for validating medication safety and identifying
 drug-drug, drug-food, and drug-supplement interactions for transplant patients.
 """
 
+import copy
+import itertools
+import json
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from services.agents.base_adk_agent import BaseADKAgent
-from services.agents.response_parser import extract_json_from_response
-from services.config.adk_config import DRUG_INTERACTION_CONFIG
+from services.agents.prompt_cache import LRUCache
+from services.agents.response_parser import (
+    extract_json_from_response,
+    extract_json_list_from_response,
+    extract_response_text,
+)
+from services.config.adk_config import DRUG_INTERACTION_CONFIG, INTERACTION_CACHE_SIZE
+
+# Static prompt text; only the substance lists and patient details vary per call
+_INTERACTION_PROMPT_HEADER = "Check for interactions between these substances:\n- Medications: "
+
+# Batches return one object per scenario, so they get a larger output budget
+_BATCH_MAX_OUTPUT_TOKENS = 4096
+_BATCH_PROMPT_HEADER = (
+    "For each scenario below, check for interactions and return a JSON array "
+    "with exactly one result per scenario, in scenario order."
+)
+
+# Static reference table, built once at import and shared read-only
+_KNOWN_INTERACTIONS_REFERENCE: Mapping[str, Any] = MappingProxyType(
+    {
+        "contraindicated": {
+            "tacrolimus_cyclosporine": {
+                "combination": ["Tacrolimus", "Cyclosporine"],
+                "mechanism": "Both are calcineurin inhibitors",
+                "effect": "Severe nephrotoxicity, contraindicated",
+                "action": "Never use together",
+            },
+            "tacrolimus_st_johns_wort": {
+                "combination": ["Tacrolimus", "St. John's Wort"],
+                "mechanism": "Strong CYP3A4 induction",
+                "effect": "Therapeutic failure, rejection risk",
+                "action": "Avoid St. John's Wort",
+            },
+        },
+        "severe": {
+            "tacrolimus_grapefruit": {
+                "combination": ["Tacrolimus", "Grapefruit"],
+                "mechanism": "CYP3A4 inhibition",
+                "effect": "2-3x increase in levels, toxicity risk",
+                "action": "Avoid grapefruit and grapefruit juice",
+            },
+            "tacrolimus_ketoconazole": {
+                "combination": ["Tacrolimus", "Ketoconazole"],
+                "mechanism": "Strong CYP3A4 inhibition",
+                "effect": "Significantly increased tacrolimus levels",
+                "action": "Dose reduction required, close monitoring",
+            },
+        },
+        "moderate": {
+            "tacrolimus_nsaids": {
+                "combination": ["Tacrolimus", "NSAIDs (ibuprofen, naproxen)"],
+                "mechanism": "Additive nephrotoxicity",
+                "effect": "Increased kidney damage risk",
+                "action": "Use acetaminophen instead",
+            },
+            "mycophenolate_antacids": {
+                "combination": ["Mycophenolate", "Antacids (calcium, magnesium)"],
+                "mechanism": "Decreased absorption",
+                "effect": "Reduced immunosuppression effectiveness",
+                "action": "Separate by 2 hours",
+            },
+        },
+        "mild": {
+            "prednisone_caffeine": {
+                "combination": ["Prednisone", "Caffeine"],
+                "mechanism": "Additive CNS stimulation",
+                "effect": "Increased anxiety, insomnia",
+                "action": "Limit caffeine intake",
+            },
+        },
+        "cyp3a4_interactions": {
+            "strong_inhibitors": [
+                "Ketoconazole",
+                "Itraconazole",
+                "Clarithromycin",
+                "Erythromycin",
+                "Grapefruit juice",
+            ],
+            "strong_inducers": [
+                "Rifampin",
+                "Phenytoin",
+                "Carbamazepine",
+                "St. John's Wort",
+            ],
+            "effect_on_tacrolimus": "Inhibitors increase levels, inducers decrease levels",
+        },
+    }
+)
+
+# Static fields of the result returned when the model output cannot be parsed;
+# None entries are filled per call (key order matches the parsed result)
+_PARSE_FAILURE_RESULT: Mapping[str, Any] = MappingProxyType(
+    {
+        "has_interaction": False,
+        "severity": "unknown",
+        "interactions": None,
+        "mechanism": None,
+        "clinical_effect": "Unable to parse AI response",
+        "recommendation": "Please review full analysis and consult pharmacist",
+        "confidence": 0.50,
+        "agent_name": None,
+        "raw_response": None,
+    }
+)
+
+# Results for queries with nothing to combine; no model call is needed
+_NO_MEDICATIONS_RESULT: Mapping[str, Any] = MappingProxyType(
+    {
+        "has_interaction": False,
+        "severity": "none",
+        "interactions": None,
+        "mechanism": "",
+        "clinical_effect": "No medications provided",
+        "recommendation": "Provide at least one medication to check for interactions",
+        "confidence": 1.0,
+        "agent_name": None,
+        "raw_response": "",
+    }
+)
+_SINGLE_MEDICATION_RESULT: Mapping[str, Any] = MappingProxyType(
+    {
+        **_NO_MEDICATIONS_RESULT,
+        "clinical_effect": "No significant interactions detected",
+        "recommendation": "Continue current regimen as prescribed",
+    }
+)
+
+# Severity levels by priority (higher = more severe)
+_SEVERITY_PRIORITY: Mapping[str, int] = MappingProxyType(
+    {"contraindicated": 5, "severe": 4, "moderate": 3, "mild": 2, "none": 1}
+)
+
+
+def _index_known_pairs() -> tuple[dict[str, str], dict[frozenset[str], dict[str, Any]]]:
+    """
+    Index the reference table by unordered substance pair.
+
+    Returns:
+        (aliases, index): aliases maps lowercase names such as "ibuprofen" to the
+        canonical name "nsaids"; index maps frozensets of canonical names to
+        interaction details
+    """
+    aliases = {"grapefruit juice": "grapefruit"}
+    index = {}
+    for severity in ("contraindicated", "severe", "moderate", "mild"):
+        for entry in _KNOWN_INTERACTIONS_REFERENCE[severity].values():
+            names = []
+            for substance in entry["combination"]:
+                # "NSAIDs (ibuprofen, naproxen)" -> "nsaids" plus example aliases
+                base, _, examples = substance.lower().partition(" (")
+                for example in examples.rstrip(")").split(","):
+                    if example.strip():
+                        aliases[example.strip()] = base
+                names.append(base)
+            index[frozenset(names)] = {
+                "substances": tuple(entry["combination"]),
+                "severity": severity,
+                "mechanism": entry["mechanism"],
+                "clinical_effect": entry["effect"],
+                "recommendation": entry["action"],
+            }
+    return aliases, index
+
+
+_SUBSTANCE_ALIASES, _PAIR_INDEX = _index_known_pairs()
+
+
+def _answer_cache_key(
+    medications: list[str],
+    foods: list[str] | None,
+    supplements: list[str] | None,
+    patient_id: str | None,
+    patient_context: dict[str, Any] | None,
+) -> str:
+    """Build an order- and case-insensitive cache key for an interaction query."""
+    return json.dumps(
+        [
+            sorted(m.strip().lower() for m in medications),
+            sorted(f.strip().lower() for f in foods or ()),
+            sorted(s.strip().lower() for s in supplements or ()),
+            patient_id,
+            patient_context,
+        ],
+        sort_keys=True,
+        default=str,
+    )
 
 
 class DrugInteractionCheckerAgent(BaseADKAgent):
@@ -23,19 +213,24 @@ class DrugInteractionCheckerAgent(BaseADKAgent):
     - Providing specific safety recommendations
     """
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(self, api_key: str | None = None, cache_size: int = INTERACTION_CACHE_SIZE):
         """
         Initialize the DrugInteractionChecker agent.
 
         Args:
             api_key: Gemini API key (defaults to config if not provided)
+            cache_size: Max cached interaction answers (0 disables caching)
         """
         super().__init__(
             agent_config=DRUG_INTERACTION_CONFIG,
             app_name="DrugInteractionChecker",
             session_id_prefix="interaction_check",
             api_key=api_key,
+            context_cache=True,
+            json_output=True,
         )
+        self._batch_agent: BaseADKAgent | None = None
+        self._answer_cache = LRUCache(maxsize=cache_size)
 
     def check_interaction(
         self,
@@ -65,6 +260,12 @@ class DrugInteractionCheckerAgent(BaseADKAgent):
                 - recommendation: Specific safety guidance
                 - confidence: Confidence score (0.0-1.0)
         """
+        answered, cache_key = self._answer_without_model(
+            medications, foods, supplements, patient_id, patient_context
+        )
+        if answered is not None:
+            return answered
+
         # Build prompt with interaction context
         prompt = self._build_interaction_check_prompt(
             medications=medications,
@@ -78,40 +279,251 @@ class DrugInteractionCheckerAgent(BaseADKAgent):
         response = self._invoke_agent(prompt)
 
         # Parse agent response
-        return self._parse_agent_response(response)
+        return self._remember(cache_key, self._parse_agent_response(response))
 
-    def _build_interaction_check_prompt(
+    async def check_interaction_async(
+        self,
+        medications: list[str],
+        foods: list[str] | None = None,
+        supplements: list[str] | None = None,
+        patient_id: str | None = None,
+        patient_context: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Async variant of check_interaction for callers with a running event loop.
+
+        Args and return value match check_interaction.
+        """
+        answered, cache_key = self._answer_without_model(
+            medications, foods, supplements, patient_id, patient_context
+        )
+        if answered is not None:
+            return answered
+
+        prompt = self._build_interaction_check_prompt(
+            medications=medications,
+            foods=foods,
+            supplements=supplements,
+            patient_id=patient_id,
+            patient_context=patient_context,
+        )
+
+        response = await self._invoke_agent_async(prompt)
+
+        return self._remember(cache_key, self._parse_agent_response(response))
+
+    def check_interactions_batch(self, scenarios: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Check several interaction scenarios with a single model call.
+
+        Args:
+            scenarios: List of dicts with check_interaction keyword arguments
+                (medications, and optionally foods, supplements, patient_id,
+                patient_context)
+
+        Returns:
+            One result dict per scenario, in order, shaped like check_interaction's
+        """
+        # Scenarios check_interaction answers without the model (nothing to combine,
+        # reference table, answer cache) are answered the same way here
+        results: list[dict[str, Any] | None] = []
+        pending: list[tuple[int, dict[str, Any], str]] = []
+        for i, scenario in enumerate(scenarios):
+            answered, cache_key = self._answer_without_model(
+                scenario["medications"],
+                scenario.get("foods"),
+                scenario.get("supplements"),
+                scenario.get("patient_id"),
+                scenario.get("patient_context"),
+            )
+            results.append(answered)
+            if answered is None:
+                pending.append((i, scenario, cache_key))
+
+        if len(pending) == 1:
+            i, scenario, _ = pending[0]
+            results[i] = self.check_interaction(**scenario)
+        elif pending:
+            self._check_pending_batch(pending, results)
+
+        return [result for result in results if result is not None]
+
+    def _check_pending_batch(
+        self,
+        pending: list[tuple[int, dict[str, Any], str]],
+        results: list[dict[str, Any] | None],
+    ) -> None:
+        """
+        Answer the scenarios that need the model with one call, filling results in place.
+
+        Args:
+            pending: (position in results, scenario, answer cache key) per scenario
+            results: Batch results, with None at each pending position
+        """
+        prompt_parts = [_BATCH_PROMPT_HEADER]
+        for number, (_, scenario, _) in enumerate(pending, 1):
+            scenario_prompt = self._build_interaction_check_prompt(
+                medications=scenario["medications"],
+                foods=scenario.get("foods"),
+                supplements=scenario.get("supplements"),
+                patient_id=scenario.get("patient_id"),
+                patient_context=scenario.get("patient_context"),
+            )
+            prompt_parts.append(f"Scenario {number}:\n{scenario_prompt}")
+
+        response_text = self._get_batch_agent()._invoke_agent("\n\n".join(prompt_parts))
+        parsed = extract_json_list_from_response(response_text)
+
+        if parsed is None or len(parsed) != len(pending):
+            # Misaligned or unparseable batch output; check each scenario on its own
+            for i, scenario, _ in pending:
+                results[i] = self.check_interaction(**scenario)
+            return
+
+        for item, (i, scenario, cache_key) in zip(parsed, pending, strict=True):
+            results[i] = (
+                self._remember(cache_key, self._build_result(item, json.dumps(item)))
+                if isinstance(item, dict)
+                else self.check_interaction(**scenario)
+            )
+
+    def _answer_without_model(
         self,
         medications: list[str],
         foods: list[str] | None,
         supplements: list[str] | None,
         patient_id: str | None,
         patient_context: dict[str, Any] | None,
-    ) -> str:
-        """Build structured prompt for interaction checking."""
-        prompt_parts = [
-            "Check for interactions between these substances:",
-            f"- Medications: {', '.join(medications)}",
-        ]
+    ) -> tuple[dict[str, Any] | None, str]:
+        """
+        Answer from the no-combination rules, the reference table, or the answer cache.
+
+        Returns:
+            (result, cache_key): result is None when the model is needed; cache_key
+            is the answer cache key to store the model's answer under
+        """
+        trivial = self._no_combination_result(medications, foods, supplements, patient_context)
+        if trivial is not None:
+            return trivial, ""
+
+        known = self._lookup_known_interactions(medications, foods, supplements, patient_context)
+        if known is not None:
+            return known, ""
+
+        cache_key = _answer_cache_key(medications, foods, supplements, patient_id, patient_context)
+        cached = self._answer_cache.get(cache_key)
+        return (None if cached is None else copy.deepcopy(cached)), cache_key
+
+    def _remember(self, cache_key: str, result: dict[str, Any]) -> dict[str, Any]:
+        """Cache a parsed answer (unless parsing failed) and return it to the caller."""
+        if result["severity"] != "unknown":
+            self._answer_cache[cache_key] = copy.deepcopy(result)
+        return result
+
+    def _get_batch_agent(self) -> BaseADKAgent:
+        """Lazily build the agent that answers several scenarios as one JSON array."""
+        if self._batch_agent is None:
+            self._batch_agent = BaseADKAgent(
+                agent_config={
+                    **DRUG_INTERACTION_CONFIG,
+                    "max_output_tokens": _BATCH_MAX_OUTPUT_TOKENS,
+                },
+                app_name="DrugInteractionCheckerBatch",
+                session_id_prefix="interaction_batch",
+                api_key=self.api_key,
+                context_cache=True,
+                json_output=True,
+            )
+        return self._batch_agent
+
+    def _no_combination_result(
+        self,
+        medications: list[str],
+        foods: list[str] | None,
+        supplements: list[str] | None,
+        patient_context: dict[str, Any] | None,
+    ) -> dict[str, Any] | None:
+        """
+        Answer queries with no medication, or a lone medication and nothing to combine.
 
-        if foods:
-            prompt_parts.append(f"- Foods/Beverages: {', '.join(foods)}")
+        Returns:
+            Result dict shaped like check_interaction's, or None if the model is needed
+        """
+        if not medications:
+            template = _NO_MEDICATIONS_RESULT
+        elif len(medications) == 1 and not foods and not supplements and not patient_context:
+            template = _SINGLE_MEDICATION_RESULT
+        else:
+            return None
+        return {**template, "interactions": [], "agent_name": self.agent.name}
 
-        if supplements:
-            prompt_parts.append(f"- Supplements: {', '.join(supplements)}")
+    def _lookup_known_interactions(
+        self,
+        medications: list[str],
+        foods: list[str] | None,
+        supplements: list[str] | None,
+        patient_context: dict[str, Any] | None,
+    ) -> dict[str, Any] | None:
+        """
+        Answer from the reference table when every substance pair is a known interaction.
 
-        if patient_id:
-            prompt_parts.append(f"- Patient ID: {patient_id}")
+        Patient-specific context always goes to the model, as does any query with
+        a pair the table does not cover.
 
+        Returns:
+            Result dict shaped like check_interaction's, or None if the model is needed
+        """
         if patient_context:
-            prompt_parts.append(f"- Patient context: {patient_context}")
+            return None
 
-        prompt_parts.append(
-            "\nProvide a JSON response with: has_interaction (boolean), severity, "
-            "interactions (list), mechanism, clinical_effect, recommendation, confidence (0.0-1.0)."
+        names = (
+            s.strip().lower() for s in itertools.chain(medications, foods or (), supplements or ())
         )
+        substances = {_SUBSTANCE_ALIASES.get(name, name) for name in names}
+        if len(substances) < 2:
+            return None
+
+        hits = []
+        for pair in itertools.combinations(substances, 2):
+            hit = _PAIR_INDEX.get(frozenset(pair))
+            if hit is None:
+                return None
+            hits.append(hit)
+
+        top = max(hits, key=lambda h: _SEVERITY_PRIORITY[h["severity"]])
+        return {
+            "has_interaction": True,
+            "severity": top["severity"],
+            "interactions": [{**hit, "substances": list(hit["substances"])} for hit in hits],
+            "mechanism": top["mechanism"],
+            "clinical_effect": top["clinical_effect"],
+            "recommendation": top["recommendation"],
+            "confidence": 0.95,
+            "agent_name": self.agent.name,
+            "raw_response": "",
+        }
 
-        return "\n".join(prompt_parts)
+    def _build_interaction_check_prompt(
+        self,
+        medications: list[str],
+        foods: list[str] | None,
+        supplements: list[str] | None,
+        patient_id: str | None,
+        patient_context: dict[str, Any] | None,
+    ) -> str:
+        """Build structured prompt for interaction checking."""
+        return "\n".join(
+            filter(
+                None,
+                (
+                    _INTERACTION_PROMPT_HEADER + ", ".join(medications),
+                    f"- Foods/Beverages: {', '.join(foods)}" if foods else None,
+                    f"- Supplements: {', '.join(supplements)}" if supplements else None,
+                    f"- Patient ID: {patient_id}" if patient_id else None,
+                    f"- Patient context: {patient_context}" if patient_context else None,
+                ),
+            )
+        )
 
     def _parse_agent_response(self, response: Any) -> dict[str, Any]:
         """
@@ -123,139 +535,71 @@ class DrugInteractionCheckerAgent(BaseADKAgent):
         Returns:
             Structured dict with interaction data
         """
-        response_text = str(response)
+        response_text = extract_response_text(response)
 
         # Try to extract and parse JSON from the response
         parsed_json = extract_json_from_response(response_text)
 
         if parsed_json:
-            interactions = parsed_json.get("interactions", [])
-
-            # Determine severity: use top-level if present, otherwise get highest from interactions
-            severity = parsed_json.get("severity")
-            if not severity and interactions:
-                # Map severity levels to priority (higher = more severe)
-                severity_priority = {
-                    "contraindicated": 5,
-                    "severe": 4,
-                    "moderate": 3,
-                    "mild": 2,
-                    "none": 1,
-                }
-                highest = max(
-                    (i.get("severity", "none").lower() for i in interactions),
-                    key=lambda s: severity_priority.get(s, 0),
-                )
-                severity = highest
-            elif not severity:
-                severity = "none"
-
-            # Use first interaction's details if top-level fields missing
-            first_interaction = interactions[0] if interactions else {}
-
-            # Use parsed values from AI
-            return {
-                "has_interaction": parsed_json.get("has_interaction", False),
-                "severity": severity,
-                "interactions": interactions,
-                "mechanism": parsed_json.get("mechanism") or first_interaction.get("mechanism", ""),
-                "clinical_effect": parsed_json.get("clinical_effect")
-                or first_interaction.get("clinical_effect", "No significant interactions detected"),
-                "recommendation": parsed_json.get("recommendation")
-                or first_interaction.get(
-                    "recommendation", "Continue current regimen as prescribed"
-                ),
-                "confidence": parsed_json.get("confidence")
-                or first_interaction.get("confidence", 0.90),
-                "agent_name": self.agent.name,
-                "raw_response": response_text,
-            }
-        else:
-            # Fallback if JSON parsing fails
-            return {
-                "has_interaction": False,
-                "severity": "unknown",
-                "interactions": [],
-                "mechanism": response_text,
-                "clinical_effect": "Unable to parse AI response",
-                "recommendation": "Please review full analysis and consult pharmacist",
-                "confidence": 0.50,
-                "agent_name": self.agent.name,
-                "raw_response": response_text,
-            }
+            return self._build_result(parsed_json, response_text)
+
+        # Fallback if JSON parsing fails
+        return {
+            **_PARSE_FAILURE_RESULT,
+            "interactions": [],
+            "mechanism": response_text,
+            "agent_name": self.agent.name,
+            "raw_response": response_text,
+        }
 
-    def get_known_interactions_reference(self) -> dict[str, Any]:
+    def _build_result(self, parsed_json: dict[str, Any], response_text: str) -> dict[str, Any]:
         """
-        Get reference information about common transplant medication interactions.
+        Normalize a parsed interaction JSON object into the result format.
+
+        Args:
+            parsed_json: Interaction object decoded from the model output
+            response_text: Raw text to expose as raw_response
 
         Returns:
-            Dict with known interactions categorized by severity
+            Structured dict with interaction data
         """
+        interactions = parsed_json.get("interactions", [])
+
+        # Determine severity: use top-level if present, otherwise get highest from interactions
+        severity = parsed_json.get("severity")
+        if not severity and interactions:
+            highest = max(
+                (i.get("severity", "none").lower() for i in interactions),
+                key=lambda s: _SEVERITY_PRIORITY.get(s, 0),
+            )
+            severity = highest
+        elif not severity:
+            severity = "none"
+
+        # Use first interaction's details if top-level fields missing
+        first_interaction = interactions[0] if interactions else {}
+
+        # Use parsed values from AI
         return {
-            "contraindicated": {
-                "tacrolimus_cyclosporine": {
-                    "combination": ["Tacrolimus", "Cyclosporine"],
-                    "mechanism": "Both are calcineurin inhibitors",
-                    "effect": "Severe nephrotoxicity, contraindicated",
-                    "action": "Never use together",
-                },
-                "tacrolimus_st_johns_wort": {
-                    "combination": ["Tacrolimus", "St. John's Wort"],
-                    "mechanism": "Strong CYP3A4 induction",
-                    "effect": "Therapeutic failure, rejection risk",
-                    "action": "Avoid St. John's Wort",
-                },
-            },
-            "severe": {
-                "tacrolimus_grapefruit": {
-                    "combination": ["Tacrolimus", "Grapefruit"],
-                    "mechanism": "CYP3A4 inhibition",
-                    "effect": "2-3x increase in levels, toxicity risk",
-                    "action": "Avoid grapefruit and grapefruit juice",
-                },
-                "tacrolimus_ketoconazole": {
-                    "combination": ["Tacrolimus", "Ketoconazole"],
-                    "mechanism": "Strong CYP3A4 inhibition",
-                    "effect": "Significantly increased tacrolimus levels",
-                    "action": "Dose reduction required, close monitoring",
-                },
-            },
-            "moderate": {
-                "tacrolimus_nsaids": {
-                    "combination": ["Tacrolimus", "NSAIDs (ibuprofen, naproxen)"],
-                    "mechanism": "Additive nephrotoxicity",
-                    "effect": "Increased kidney damage risk",
-                    "action": "Use acetaminophen instead",
-                },
-                "mycophenolate_antacids": {
-                    "combination": ["Mycophenolate", "Antacids (calcium, magnesium)"],
-                    "mechanism": "Decreased absorption",
-                    "effect": "Reduced immunosuppression effectiveness",
-                    "action": "Separate by 2 hours",
-                },
-            },
-            "mild": {
-                "prednisone_caffeine": {
-                    "combination": ["Prednisone", "Caffeine"],
-                    "mechanism": "Additive CNS stimulation",
-                    "effect": "Increased anxiety, insomnia",
-                    "action": "Limit caffeine intake",
-                },
-            },
-            "cyp3a4_interactions": {
-                "strong_inhibitors": [
-                    "Ketoconazole",
-                    "Itraconazole",
-                    "Clarithromycin",
-                    "Erythromycin",
-                    "Grapefruit juice",
-                ],
-                "strong_inducers": [
-                    "Rifampin",
-                    "Phenytoin",
-                    "Carbamazepine",
-                    "St. John's Wort",
-                ],
-                "effect_on_tacrolimus": "Inhibitors increase levels, inducers decrease levels",
-            },
+            "has_interaction": parsed_json.get("has_interaction", False),
+            "severity": severity,
+            "interactions": interactions,
+            "mechanism": parsed_json.get("mechanism") or first_interaction.get("mechanism", ""),
+            "clinical_effect": parsed_json.get("clinical_effect")
+            or first_interaction.get("clinical_effect", "No significant interactions detected"),
+            "recommendation": parsed_json.get("recommendation")
+            or first_interaction.get("recommendation", "Continue current regimen as prescribed"),
+            "confidence": parsed_json.get("confidence")
+            or first_interaction.get("confidence", 0.90),
+            "agent_name": self.agent.name,
+            "raw_response": response_text,
         }
+
+    def get_known_interactions_reference(self) -> Mapping[str, Any]:
+        """
+        Get reference information about common transplant medication interactions.
+
+        Returns:
+            Read-only mapping with known interactions categorized by severity
+        """
+        return _KNOWN_INTERACTIONS_REFERENCE
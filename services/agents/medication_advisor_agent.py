@@ -8,12 +8,98 @@ Integrates real clinical outcomes data from SRTR (Scientific Registry of
 Transplant Recipients) to provide population-based risk assessments.
 """
 
+import copy
+import functools
+from collections.abc import AsyncIterator, Mapping
+from types import MappingProxyType
 from typing import Any
 
-from services.agents.base_adk_agent import BaseADKAgent
-from services.agents.response_parser import extract_json_from_response
-from services.config.adk_config import MEDICATION_ADVISOR_CONFIG
-from services.data.srtr_outcomes import get_srtr_data
+from services.agents.base_adk_agent import BaseADKAgent, gather_limited
+from services.agents.prompt_cache import LRUCache, prompt_key
+from services.agents.response_parser import extract_json_from_response, extract_response_text
+from services.config.adk_config import (
+    MEDICATION_ADVISOR_CONFIG,
+    RESPONSE_CACHE_SIZE,
+    RESPONSE_CACHE_TTL,
+)
+from services.data.srtr_outcomes import SRTROutcomesData, get_srtr_data
+
+# Therapeutic windows keyed by lowercase medication name, built once at import
+_THERAPEUTIC_WINDOWS: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        "tacrolimus": MappingProxyType(
+            {
+                "window_hours": 12,
+                "critical_period": 4,  # Most critical within 4 hours
+                "guidance": "Critical immunosuppressant - contact doctor if >12h late",
+            }
+        ),
+        "mycophenolate": MappingProxyType(
+            {
+                "window_hours": 12,
+                "critical_period": 6,
+                "guidance": "Important antiproliferative immunosuppressant - can be flexible within window",
+            }
+        ),
+        "prednisone": MappingProxyType(
+            {
+                "window_hours": 24,
+                "critical_period": 12,
+                "guidance": "Daily corticosteroid - take as soon as remembered same day",
+            }
+        ),
+    }
+)
+
+_DEFAULT_THERAPEUTIC_WINDOW: Mapping[str, Any] = MappingProxyType(
+    {
+        "window_hours": 24,
+        "critical_period": 12,
+        "guidance": "Consult prescribing information",
+    }
+)
+
+# Static prompt text for missed dose analysis
+_MISSED_DOSE_PROMPT_TAIL = (
+    "\nProvide a JSON response with: recommendation, reasoning_steps (list), "
+    "risk_level, confidence (0.0-1.0), next_steps (list)."
+)
+_MISSED_DOSE_PROMPT_TAIL_WITH_SRTR = (
+    "\nProvide a JSON response with: recommendation, reasoning_steps (list), "
+    "risk_level, confidence (0.0-1.0), next_steps (list), srtr_data_source "
+    "(dict with source, organ, age_group, baseline_rejection_rate, total_records)."
+)
+_SRTR_UNAVAILABLE_NOTICE = "\n--- WARNING: SRTR data unavailable (demo mode) ---"
+# Reasoning step of the fallback result returned when the model's JSON can't be parsed
+_PARSE_FAILURE_STEP = "See recommendation for full AI analysis"
+
+
+@functools.lru_cache(maxsize=256)
+def _format_srtr_context(
+    srtr: SRTROutcomesData, organ: str, age_group: str, months_post_tx: int
+) -> str:
+    """
+    Build the SRTR population-statistics section of the missed dose prompt.
+
+    Organ, age group and whole-month combinations are few, so the formatted
+    block is cached per SRTR data instance.
+    """
+    population_stats = srtr.format_for_prompt(age_group, months_post_tx)
+    rejection_rate = srtr.get_acute_rejection_rate(age_group)
+
+    return "\n".join(
+        [
+            "\n--- Real Clinical Outcomes Data (SRTR 2023) ---",
+            population_stats,
+            "\nUse these population statistics to contextualize your risk assessment.",
+            "\nIMPORTANT: Include a 'srtr_data_source' section in your response showing:",
+            "- Source: SRTR 2023 Annual Data Report",
+            f"- Organ: {organ.capitalize()}",
+            f"- Age Group: {age_group}",
+            f"- Baseline Rejection Rate: {rejection_rate}%",
+            f"- Total Records in Database: {srtr.total_records or 'N/A'} {organ} transplant recipients",
+        ]
+    )
 
 
 class MedicationAdvisorAgent(BaseADKAgent):
@@ -39,7 +125,10 @@ class MedicationAdvisorAgent(BaseADKAgent):
             app_name="MedicationAdvisor",
             session_id_prefix="medication_analysis",
             api_key=api_key,
+            context_cache=True,
         )
+        # Parsed results keyed by hash of the prompt; repeat scenarios skip the model call
+        self._response_cache = LRUCache(maxsize=RESPONSE_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL)
 
     def analyze_missed_dose(
         self,
@@ -48,6 +137,7 @@ class MedicationAdvisorAgent(BaseADKAgent):
         current_time: str,
         patient_id: str | None = None,
         patient_context: dict[str, Any] | None = None,
+        cache_bust: bool = False,
     ) -> dict[str, Any]:
         """
         Analyze a missed medication dose and provide recommendations.
@@ -58,6 +148,7 @@ class MedicationAdvisorAgent(BaseADKAgent):
             current_time: Current time (e.g., "2:00 PM")
             patient_id: Optional patient identifier for context
             patient_context: Optional dict with patient history, adherence patterns
+            cache_bust: Skip the cached result for an identical scenario and ask the model again
 
         Returns:
             Dict with:
@@ -76,11 +167,116 @@ class MedicationAdvisorAgent(BaseADKAgent):
             patient_context=patient_context,
         )
 
+        cache_key = prompt_key(prompt)
+        cached = None if cache_bust else self._response_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
         # Invoke agent using base class method
         response = self._invoke_agent(prompt)
 
         # Parse agent response
-        return self._parse_agent_response(response)
+        return self._remember(cache_key, self._parse_agent_response(response))
+
+    async def analyze_missed_dose_async(
+        self,
+        medication: str,
+        scheduled_time: str,
+        current_time: str,
+        patient_id: str | None = None,
+        patient_context: dict[str, Any] | None = None,
+        cache_bust: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Async variant of analyze_missed_dose for callers with a running event loop.
+
+        Args and return value match analyze_missed_dose.
+        """
+        prompt = self._build_missed_dose_prompt(
+            medication=medication,
+            scheduled_time=scheduled_time,
+            current_time=current_time,
+            patient_id=patient_id,
+            patient_context=patient_context,
+        )
+
+        cache_key = prompt_key(prompt)
+        cached = None if cache_bust else self._response_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        response = await self._invoke_agent_async(prompt)
+
+        return self._remember(cache_key, self._parse_agent_response(response))
+
+    async def analyze_missed_dose_stream(
+        self,
+        medication: str,
+        scheduled_time: str,
+        current_time: str,
+        patient_id: str | None = None,
+        patient_context: dict[str, Any] | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Analyze a missed dose and yield the response text as the model generates it.
+
+        Lets SSE or WebSocket endpoints forward output before generation finishes.
+        Callers that also need the structured result can join the chunks and pass
+        the text to _parse_agent_response.
+
+        Args match analyze_missed_dose.
+
+        Yields:
+            Chunks of the agent response text, in arrival order
+        """
+        prompt = self._build_missed_dose_prompt(
+            medication=medication,
+            scheduled_time=scheduled_time,
+            current_time=current_time,
+            patient_id=patient_id,
+            patient_context=patient_context,
+        )
+
+        async for chunk in self._stream_agent_async(prompt):
+            yield chunk
+
+    async def analyze_missed_dose_batch(
+        self, requests: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """
+        Analyze several missed doses concurrently.
+
+        Each request runs in its own session so concurrent runs don't share
+        conversation history; at most AGENT_MAX_CONCURRENCY run at once.
+
+        Args:
+            requests: List of dicts with analyze_missed_dose keyword arguments
+                (medication, scheduled_time, current_time, and optionally
+                patient_id, patient_context)
+
+        Returns:
+            One result dict per request, in order
+        """
+        prompts = [
+            self._build_missed_dose_prompt(
+                medication=request["medication"],
+                scheduled_time=request["scheduled_time"],
+                current_time=request["current_time"],
+                patient_id=request.get("patient_id"),
+                patient_context=request.get("patient_context"),
+            )
+            for request in requests
+        ]
+
+        responses = await gather_limited(self._invoke_agent_async(prompt) for prompt in prompts)
+
+        return [self._parse_agent_response(response) for response in responses]
+
+    def _remember(self, cache_key: str, result: dict[str, Any]) -> dict[str, Any]:
+        """Cache a parsed result (unless parsing failed) and return it to the caller."""
+        if result["reasoning_steps"] != [_PARSE_FAILURE_STEP]:
+            self._response_cache[cache_key] = copy.deepcopy(result)
+        return result
 
     def _build_missed_dose_prompt(
         self,
@@ -91,65 +287,49 @@ class MedicationAdvisorAgent(BaseADKAgent):
         patient_context: dict[str, Any] | None,
     ) -> str:
         """Build structured prompt for missed dose analysis with SRTR population data."""
-        prompt_parts = [
-            "Analyze this missed dose scenario:",
-            f"- Medication: {medication}",
-            f"- Scheduled time: {scheduled_time}",
-            f"- Current time: {current_time}",
-        ]
-
-        if patient_id:
-            prompt_parts.append(f"- Patient ID: {patient_id}")
-
-        if patient_context:
-            prompt_parts.append(f"- Patient context: {patient_context}")
-
         # Add SRTR population statistics if patient context includes required fields
+        srtr_section: str | None = None
         srtr_data_available = False
         if patient_context:
             # Support both organ_type (from frontend) and transplant_type (internal)
-            organ = patient_context.get("organ_type") or patient_context.get(
-                "transplant_type", "kidney"
+            # (either may be present but null, e.g. from a Firestore doc)
+            organ = (
+                patient_context.get("organ_type")
+                or patient_context.get("transplant_type")
+                or "kidney"
             )
             age_group = patient_context.get("age_group", "50-64")
             months_post_tx = patient_context.get("months_post_transplant", 6)
 
-            try:
-                srtr = get_srtr_data(organ)
-                population_stats = srtr.format_for_prompt(age_group, months_post_tx)
-                rejection_rate = srtr.get_acute_rejection_rate(age_group)
-
-                prompt_parts.extend(
-                    [
-                        "\n--- Real Clinical Outcomes Data (SRTR 2023) ---",
-                        population_stats,
-                        "\nUse these population statistics to contextualize your risk assessment.",
-                        "\nIMPORTANT: Include a 'srtr_data_source' section in your response showing:",
-                        "- Source: SRTR 2023 Annual Data Report",
-                        f"- Organ: {organ.capitalize()}",
-                        f"- Age Group: {age_group}",
-                        f"- Baseline Rejection Rate: {rejection_rate}%",
-                        f"- Total Records in Database: {srtr._summary.get('total_records', 'N/A')} {organ} transplant recipients",  # type: ignore[union-attr]
-                    ]
-                )
-                srtr_data_available = True
-            except Exception:
-                # If SRTR data unavailable, continue without it
-                prompt_parts.append("\n--- WARNING: SRTR data unavailable (demo mode) ---")
-
-        prompt_parts.append(
-            "\nProvide a JSON response with: recommendation, reasoning_steps (list), "
-            "risk_level, confidence (0.0-1.0), next_steps (list)"
-            + (
-                ", srtr_data_source (dict with source, organ, age_group, baseline_rejection_rate, total_records)"
-                if srtr_data_available
-                else ""
+            # If SRTR data unavailable, continue without it
+            srtr_section = _SRTR_UNAVAILABLE_NOTICE
+            if organ.lower() in SRTROutcomesData.SUPPORTED_ORGANS:
+                try:
+                    srtr = get_srtr_data(organ)
+                    if srtr.has_data:
+                        srtr_section = _format_srtr_context(
+                            srtr, organ, age_group, int(months_post_tx)
+                        )
+                        srtr_data_available = True
+                except (OSError, KeyError, TypeError, ValueError):
+                    pass
+
+        return "\n".join(
+            filter(
+                None,
+                (
+                    f"Analyze this missed dose scenario:\n- Medication: {medication}\n"
+                    f"- Scheduled time: {scheduled_time}\n- Current time: {current_time}",
+                    f"- Patient ID: {patient_id}" if patient_id else None,
+                    f"- Patient context: {patient_context}" if patient_context else None,
+                    srtr_section,
+                    _MISSED_DOSE_PROMPT_TAIL_WITH_SRTR
+                    if srtr_data_available
+                    else _MISSED_DOSE_PROMPT_TAIL,
+                ),
             )
-            + "."
         )
 
-        return "\n".join(prompt_parts)
-
     def _parse_agent_response(self, response: Any) -> dict[str, Any]:
         """
         Parse ADK agent response into structured format.
@@ -160,7 +340,7 @@ class MedicationAdvisorAgent(BaseADKAgent):
         Returns:
             Structured dict with recommendation data
         """
-        response_text = str(response)
+        response_text = extract_response_text(response)
 
         # Try to extract and parse JSON from the response
         parsed_json = extract_json_from_response(response_text)
@@ -181,7 +361,7 @@ class MedicationAdvisorAgent(BaseADKAgent):
             # Fallback if JSON parsing fails - return full response as recommendation
             return {
                 "recommendation": response_text,
-                "reasoning_steps": ["See recommendation for full AI analysis"],
+                "reasoning_steps": [_PARSE_FAILURE_STEP],
                 "risk_level": "medium",
                 "confidence": 0.85,
                 "next_steps": ["Review AI recommendation"],
@@ -189,7 +369,7 @@ class MedicationAdvisorAgent(BaseADKAgent):
                 "raw_response": response_text,
             }
 
-    def get_therapeutic_window(self, medication: str) -> dict[str, Any]:
+    def get_therapeutic_window(self, medication: str) -> Mapping[str, Any]:
         """
         Get therapeutic window information for a medication.
 
@@ -197,31 +377,10 @@ class MedicationAdvisorAgent(BaseADKAgent):
             medication: Medication name
 
         Returns:
-            Dict with window_hours, critical_period, and guidance
+            Read-only mapping with window_hours, critical_period, and guidance
         """
-        windows = {
-            "tacrolimus": {
-                "window_hours": 12,
-                "critical_period": 4,  # Most critical within 4 hours
-                "guidance": "Critical immunosuppressant - contact doctor if >12h late",
-            },
-            "mycophenolate": {
-                "window_hours": 12,
-                "critical_period": 6,
-                "guidance": "Important antiproliferative immunosuppressant - can be flexible within window",
-            },
-            "prednisone": {
-                "window_hours": 24,
-                "critical_period": 12,
-                "guidance": "Daily corticosteroid - take as soon as remembered same day",
-            },
-        }
-
-        return windows.get(
-            medication.lower(),
-            {
-                "window_hours": 24,
-                "critical_period": 12,
-                "guidance": "Consult prescribing information",
-            },
-        )
+        # Callers almost always pass lowercase names; only fold case on a miss
+        window = _THERAPEUTIC_WINDOWS.get(medication)
+        if window is None:
+            window = _THERAPEUTIC_WINDOWS.get(medication.lower(), _DEFAULT_THERAPEUTIC_WINDOW)
+        return window
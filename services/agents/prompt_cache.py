@@ -0,0 +1,95 @@
+"""
+Prompt-keyed response cache for ADK agents.
+
+LLM calls dominate request latency, and several agent prompts are fully
+determined by their inputs. This module provides a small thread-safe LRU
+cache keyed on a stable hash of the prompt text so repeated prompts can
+skip the model call entirely.
+"""
+
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+def prompt_key(prompt: str) -> str:
+    """
+    Compute a stable cache key for a prompt.
+
+    Args:
+        prompt: Full prompt text sent to the model
+
+    Returns:
+        32-character hex digest of the prompt
+    """
+    return hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache with optional per-entry expiry.
+
+    A maxsize of 0 disables caching: lookups always miss and writes are dropped.
+    With a ttl, entries older than ttl seconds are treated as missing.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float | None = None):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries to retain (0 disables caching)
+            ttl: Seconds an entry stays valid after being stored (None never expires)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (monotonic expiry time, value)
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _live_item(self, key: str) -> tuple[float, Any] | None:
+        """Return the stored entry for key, dropping it if expired. Caller holds the lock."""
+        item = self._data.get(key)
+        if item is not None and item[0] <= time.monotonic():
+            del self._data[key]
+            return None
+        return item
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for key (marking it recently used), or default."""
+        with self._lock:
+            item = self._live_item(key)
+            if item is None:
+                return default
+            self._data.move_to_end(key)
+            return item[1]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        if self.maxsize <= 0:
+            return
+        expires_at = math.inf if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        with self._lock:
+            return self._live_item(key) is not None
+
+    def __len__(self) -> int:
+        """Number of stored entries (expired entries count until next looked up)."""
+        with self._lock:
+            return len(self._data)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
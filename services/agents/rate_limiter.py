@@ -0,0 +1,73 @@
+"""
+Client-side rate limiting for Gemini calls.
+
+Batch helpers can issue requests faster than the model's requests-per-minute
+quota allows; the excess comes back as 429 errors and has to be retried. A
+token bucket per model spaces requests out before they are sent instead.
+"""
+
+import asyncio
+import functools
+import threading
+import time
+
+from services.config.adk_config import GEMINI_RPM_LIMIT
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at rate_per_minute / 60 per second.
+
+    A rate of 0 disables limiting: acquisitions never wait.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: float | None = None):
+        """
+        Initialize the bucket, starting full.
+
+        Args:
+            rate_per_minute: Sustained requests allowed per minute (0 disables limiting)
+            capacity: Maximum burst size (defaults to rate_per_minute)
+        """
+        self.rate_per_minute = rate_per_minute
+        self.capacity = rate_per_minute if capacity is None else capacity
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds to wait before using it."""
+        if self.rate_per_minute <= 0:
+            return 0.0
+        refill_per_second = self.rate_per_minute / 60
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self.capacity, self._tokens + elapsed * refill_per_second)
+            self._updated = now
+            # Tokens may go negative: later callers queue behind earlier reservations
+            self._tokens -= 1
+            return max(0.0, -self._tokens / refill_per_second)
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, without blocking the event loop."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+@functools.cache
+def get_rate_limiter(_model: str) -> TokenBucket:
+    """
+    Return the token bucket shared by every agent calling the given model.
+
+    Quotas are enforced per model, so the model name is only the cache key: each
+    distinct name gets its own bucket, and repeat calls return the same one.
+
+    Args:
+        _model: Gemini model name
+
+    Returns:
+        TokenBucket limited to GEMINI_RPM_LIMIT requests per minute
+    """
+    return TokenBucket(GEMINI_RPM_LIMIT)
@@ -8,12 +8,82 @@ Integrates real clinical outcomes data from SRTR (Scientific Registry of
 Transplant Recipients) to provide population-based rejection risk scores.
 """
 
+import copy
+import functools
+import json
+import time
 from typing import Any
 
+from google import genai  # type: ignore[import-untyped]
+
 from services.agents.base_adk_agent import BaseADKAgent
-from services.agents.response_parser import extract_json_from_response
-from services.config.adk_config import REJECTION_RISK_CONFIG
-from services.data.srtr_outcomes import get_srtr_data
+from services.agents.prompt_cache import LRUCache, prompt_key
+from services.agents.response_parser import (
+    extract_json_from_response,
+    extract_json_list_from_response,
+    extract_response_text,
+)
+from services.config.adk_config import (
+    REJECTION_BATCH_SIZE,
+    REJECTION_RISK_CONFIG,
+    RESPONSE_CACHE_SIZE,
+    RESPONSE_CACHE_TTL,
+)
+from services.data.srtr_outcomes import SRTROutcomesData, get_srtr_data
+
+# Static SRTR instructions; only the population stats and data-source values vary
+_SRTR_SECTION_HEADER = "\n--- Real Clinical Outcomes Data (SRTR 2023) ---\n"
+_SRTR_SECTION_INSTRUCTIONS = (
+    "\n\nUse these population statistics to contextualize your risk assessment.\n"
+    "\nIMPORTANT: Include in your JSON response:\n"
+    "1. 'rejection_probability' (0.0-1.0) - based on symptom severity and SRTR baseline\n"
+    "2. 'urgency' (LOW/MEDIUM/HIGH/CRITICAL)\n"
+    "3. 'risk_level' (low/medium/high/critical)\n"
+    "4. 'recommended_action' - specific clinical action\n"
+    "5. 'reasoning_steps' (list) - your clinical reasoning\n"
+    "6. 'similar_cases' (list of 3) - generate realistic cases based on SRTR data\n"
+    "   Each case: {symptoms: str, outcome: str, similarity: float}\n"
+    "7. 'srtr_data_source' with:\n"
+    "   - source: SRTR 2023 Annual Data Report\n"
+)
+_SRTR_UNAVAILABLE_NOTICE = "\n--- WARNING: SRTR data unavailable (demo mode) ---"
+_REJECTION_PROMPT_TAIL = (
+    "\nProvide a JSON response with: rejection_probability, urgency, "
+    "risk_level, recommended_action, reasoning_steps (list), "
+    "similar_cases (list of 3 dicts)."
+)
+
+_PARSE_FAILURE_ACTION = "Unable to parse AI response. Review full analysis and contact team."
+
+# Gemini Batch API job states after which a job no longer changes
+_BATCH_JOB_TERMINAL_STATES = frozenset(
+    {"JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"}
+)
+
+_BATCH_PROMPT_HEADER = (
+    "Analyze the following {count} cases independently. Return a JSON array of "
+    "length {count}, one result object per case, in case order."
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _srtr_section(srtr: SRTROutcomesData, organ: str, age_group: str, months_post_tx: Any) -> str:
+    """
+    Return the complete SRTR block for the prompt.
+
+    The block depends only on the organ's data, age group, and months post-transplant,
+    which repeat across requests, so it is built once per combination.
+    """
+    population_stats = srtr.format_for_prompt(age_group, months_post_tx)
+    rejection_rate = srtr.get_acute_rejection_rate(age_group)
+    total_records = srtr.total_records or "N/A"
+    return (
+        f"{_SRTR_SECTION_HEADER}{population_stats}{_SRTR_SECTION_INSTRUCTIONS}"
+        f"   - organ: {organ.capitalize()}\n"
+        f"   - age_group: {age_group}\n"
+        f"   - baseline_rejection_rate: {rejection_rate}\n"
+        f"   - total_records: {total_records}"
+    )
 
 
 class RejectionRiskAgent(BaseADKAgent):
@@ -40,12 +110,16 @@ class RejectionRiskAgent(BaseADKAgent):
             session_id_prefix="rejection_analysis",
             api_key=api_key,
         )
+        # Parsed results keyed by prompt hash; identical inputs skip the model call
+        self._response_cache = LRUCache(maxsize=RESPONSE_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL)
+        self._batch_client: Any = None
 
     def analyze_rejection_risk(
         self,
         symptoms: dict[str, Any],
         patient_id: str | None = None,
         patient_context: dict[str, Any] | None = None,
+        cache_bust: bool = False,
     ) -> dict[str, Any]:
         """
         Analyze transplant rejection risk based on symptoms.
@@ -54,6 +128,7 @@ class RejectionRiskAgent(BaseADKAgent):
             symptoms: Dict with fever (°F), weight_gain (lbs), fatigue, urine_output
             patient_id: Optional patient identifier for context
             patient_context: Optional dict with organ type, age group, months post-tx
+            cache_bust: Skip the cached result for an identical prompt and ask the model again
 
         Returns:
             Dict with:
@@ -72,11 +147,199 @@ class RejectionRiskAgent(BaseADKAgent):
             patient_context=patient_context,
         )
 
+        cache_key = prompt_key(prompt)
+        cached = None if cache_bust else self._response_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
         # Invoke agent using base class method
         response = self._invoke_agent(prompt)
 
         # Parse agent response
-        return self._parse_agent_response(response)
+        return self._remember(cache_key, self._parse_agent_response(response))
+
+    async def analyze_rejection_risk_async(
+        self,
+        symptoms: dict[str, Any],
+        patient_id: str | None = None,
+        patient_context: dict[str, Any] | None = None,
+        cache_bust: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Async variant of analyze_rejection_risk for callers with a running event loop.
+
+        Args and return value match analyze_rejection_risk.
+        """
+        prompt = self._build_rejection_prompt(
+            symptoms=symptoms,
+            patient_id=patient_id,
+            patient_context=patient_context,
+        )
+
+        cache_key = prompt_key(prompt)
+        cached = None if cache_bust else self._response_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        response = await self._invoke_agent_async(prompt)
+
+        return self._remember(cache_key, self._parse_agent_response(response))
+
+    def analyze_rejection_risk_batch(
+        self, cases: list[dict[str, Any]], batch_size: int = REJECTION_BATCH_SIZE
+    ) -> list[dict[str, Any]]:
+        """
+        Analyze several rejection risk cases with one model call per batch.
+
+        Args:
+            cases: List of dicts with analyze_rejection_risk keyword arguments
+                (symptoms, and optionally patient_id, patient_context)
+            batch_size: Maximum cases per model call
+
+        Returns:
+            One result dict per case, in order, shaped like analyze_rejection_risk's
+        """
+        step = max(batch_size, 1)
+        results: list[dict[str, Any]] = []
+        for start in range(0, len(cases), step):
+            results.extend(self._analyze_batch(cases[start : start + step]))
+        return results
+
+    def _analyze_batch(self, cases: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Analyze one batch of cases in a single call, falling back to per-case calls."""
+        if len(cases) == 1:
+            return [self.analyze_rejection_risk(**cases[0])]
+
+        prompt_parts = [_BATCH_PROMPT_HEADER.format(count=len(cases))]
+        for i, case in enumerate(cases, 1):
+            case_prompt = self._build_rejection_prompt(
+                symptoms=case["symptoms"],
+                patient_id=case.get("patient_id"),
+                patient_context=case.get("patient_context"),
+            )
+            prompt_parts.append(f"=== CASE {i} ===\n{case_prompt}")
+
+        response_text = self._invoke_agent("\n\n".join(prompt_parts))
+        parsed = extract_json_list_from_response(response_text)
+
+        if parsed is None or len(parsed) != len(cases):
+            # Misaligned or unparseable batch output; analyze each case on its own
+            return [self.analyze_rejection_risk(**case) for case in cases]
+
+        return [
+            self._build_result(item, json.dumps(item))
+            if isinstance(item, dict)
+            else self.analyze_rejection_risk(**case)
+            for item, case in zip(parsed, cases, strict=True)
+        ]
+
+    def submit_batch(self, cases: list[dict[str, Any]]) -> str:
+        """
+        Submit cases to the Gemini Batch API for offline scoring.
+
+        Batch jobs are billed at half the interactive price and don't count
+        against the interactive rate limit, but complete asynchronously (usually
+        minutes, up to 24 hours). Collect results with retrieve_batch.
+
+        Args:
+            cases: List of dicts with analyze_rejection_risk keyword arguments
+                (symptoms, and optionally patient_id, patient_context)
+
+        Returns:
+            Batch job name to pass to retrieve_batch
+
+        Raises:
+            RuntimeError: If the Batch API is not enabled (REJECTION_BATCH_API)
+        """
+        if not REJECTION_RISK_CONFIG["batch_api_enabled"]:
+            raise RuntimeError("Gemini Batch API is disabled; set REJECTION_BATCH_API=true")
+
+        # Batch requests bypass the ADK agent, so each carries the instruction and the
+        # generation settings the agent uses, keeping output comparable to the
+        # interactive path that _build_result parses
+        config = {
+            "system_instruction": REJECTION_RISK_CONFIG["instruction"],
+            **self._generation_settings(REJECTION_RISK_CONFIG),
+        }
+        requests = [
+            {
+                "contents": [
+                    {
+                        "role": "user",
+                        "parts": [
+                            {
+                                "text": self._build_rejection_prompt(
+                                    symptoms=case["symptoms"],
+                                    patient_id=case.get("patient_id"),
+                                    patient_context=case.get("patient_context"),
+                                )
+                            }
+                        ],
+                    }
+                ],
+                "config": config,
+            }
+            for case in cases
+        ]
+        job = self._get_batch_client().batches.create(
+            model=REJECTION_RISK_CONFIG["model"], src=requests
+        )
+        return str(job.name)
+
+    def retrieve_batch(
+        self, job_name: str, poll_interval: float = 30.0, timeout: float | None = 3600.0
+    ) -> list[dict[str, Any]]:
+        """
+        Wait for a batch job from submit_batch to finish and parse its results.
+
+        Args:
+            job_name: Name returned by submit_batch
+            poll_interval: Seconds between job status checks
+            timeout: Seconds to wait for the job to finish (None waits until it does);
+                the job keeps running and can be retrieved again later
+
+        Returns:
+            One result dict per submitted case, in order, shaped like
+            analyze_rejection_risk's
+
+        Raises:
+            RuntimeError: If the job fails, is cancelled, or expires
+            TimeoutError: If the job is still running after timeout seconds
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        client = self._get_batch_client()
+        job = client.batches.get(name=job_name)
+        while job.state.name not in _BATCH_JOB_TERMINAL_STATES:
+            wait = poll_interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"Batch job {job_name} still {job.state.name} after {timeout}s"
+                    )
+                wait = min(wait, remaining)
+            time.sleep(wait)
+            job = client.batches.get(name=job_name)
+
+        if job.state.name != "JOB_STATE_SUCCEEDED":
+            raise RuntimeError(f"Batch job {job_name} ended in state {job.state.name}")
+
+        return [
+            self._parse_agent_response(inlined.response or "")
+            for inlined in job.dest.inlined_responses
+        ]
+
+    def _get_batch_client(self) -> Any:
+        """Lazily build the google-genai client used for Batch API jobs."""
+        if self._batch_client is None:
+            self._batch_client = genai.Client(api_key=self.api_key)
+        return self._batch_client
+
+    def _remember(self, cache_key: str, result: dict[str, Any]) -> dict[str, Any]:
+        """Cache a parsed result (unless parsing failed) and return it to the caller."""
+        if result["recommended_action"] != _PARSE_FAILURE_ACTION:
+            self._response_cache[cache_key] = copy.deepcopy(result)
+        return result
 
     def _build_rejection_prompt(
         self,
@@ -85,66 +348,37 @@ class RejectionRiskAgent(BaseADKAgent):
         patient_context: dict[str, Any] | None,
     ) -> str:
         """Build structured prompt for rejection risk analysis with SRTR data."""
-        prompt_parts = [
-            "Analyze this transplant rejection risk scenario:",
-            f"- Fever: {symptoms.get('fever', 'N/A')}°F",
-            f"- Weight gain: {symptoms.get('weight_gain', 'N/A')} lbs (this week)",
-            f"- Fatigue: {symptoms.get('fatigue', 'N/A')}",
-            f"- Urine output: {symptoms.get('urine_output', 'N/A')}",
-        ]
-
+        prompt = (
+            "Analyze this transplant rejection risk scenario:\n"
+            f"- Fever: {symptoms.get('fever', 'N/A')}°F\n"
+            f"- Weight gain: {symptoms.get('weight_gain', 'N/A')} lbs (this week)\n"
+            f"- Fatigue: {symptoms.get('fatigue', 'N/A')}\n"
+            f"- Urine output: {symptoms.get('urine_output', 'N/A')}"
+        )
         if patient_id:
-            prompt_parts.append(f"- Patient ID: {patient_id}")
+            prompt += f"\n- Patient ID: {patient_id}"
+
+        if not patient_context:
+            return f"{prompt}\n{_REJECTION_PROMPT_TAIL}"
 
-        if patient_context:
-            prompt_parts.append(f"- Patient context: {patient_context}")
+        prompt += f"\n- Patient context: {patient_context}"
 
         # Add SRTR population statistics if patient context includes required fields
-        srtr_data_available = False
-        if patient_context:
-            organ = patient_context.get("organ_type", "kidney")
-            age_group = patient_context.get("age_group", "50-64")
-            months_post_tx = patient_context.get("months_post_transplant", 6)
+        organ = patient_context.get("organ_type") or "kidney"
+        age_group = patient_context.get("age_group", "50-64")
+        months_post_tx = patient_context.get("months_post_transplant", 6)
 
+        if organ.lower() in SRTROutcomesData.SUPPORTED_ORGANS:
             try:
                 srtr = get_srtr_data(organ)
-                population_stats = srtr.format_for_prompt(age_group, months_post_tx)
-                rejection_rate = srtr.get_acute_rejection_rate(age_group)
-
-                prompt_parts.extend(
-                    [
-                        "\n--- Real Clinical Outcomes Data (SRTR 2023) ---",
-                        population_stats,
-                        "\nUse these population statistics to contextualize your risk assessment.",
-                        "\nIMPORTANT: Include in your JSON response:",
-                        "1. 'rejection_probability' (0.0-1.0) - based on symptom severity and SRTR baseline",
-                        "2. 'urgency' (LOW/MEDIUM/HIGH/CRITICAL)",
-                        "3. 'risk_level' (low/medium/high/critical)",
-                        "4. 'recommended_action' - specific clinical action",
-                        "5. 'reasoning_steps' (list) - your clinical reasoning",
-                        "6. 'similar_cases' (list of 3) - generate realistic cases based on SRTR data",
-                        "   Each case: {symptoms: str, outcome: str, similarity: float}",
-                        "7. 'srtr_data_source' with:",
-                        "   - source: SRTR 2023 Annual Data Report",
-                        f"   - organ: {organ.capitalize()}",
-                        f"   - age_group: {age_group}",
-                        f"   - baseline_rejection_rate: {rejection_rate}",
-                        f"   - total_records: {srtr._summary.get('total_records', 'N/A')}",  # type: ignore[union-attr]
-                    ]
-                )
-                srtr_data_available = True
-            except Exception:
-                # If SRTR data unavailable, continue without it
-                prompt_parts.append("\n--- WARNING: SRTR data unavailable (demo mode) ---")
-
-        if not srtr_data_available:
-            prompt_parts.append(
-                "\nProvide a JSON response with: rejection_probability, urgency, "
-                "risk_level, recommended_action, reasoning_steps (list), "
-                "similar_cases (list of 3 dicts)."
-            )
+                if srtr.has_data:
+                    srtr_section = _srtr_section(srtr, organ, age_group, months_post_tx)
+                    return f"{prompt}\n{srtr_section}"
+            except (OSError, KeyError, TypeError, ValueError):
+                pass
 
-        return "\n".join(prompt_parts)
+        # If SRTR data unavailable, continue without it
+        return f"{prompt}\n{_SRTR_UNAVAILABLE_NOTICE}\n{_REJECTION_PROMPT_TAIL}"
 
     def _parse_agent_response(self, response: Any) -> dict[str, Any]:
         """
@@ -156,35 +390,39 @@ class RejectionRiskAgent(BaseADKAgent):
         Returns:
             Structured dict with rejection risk data
         """
-        response_text = str(response)
+        response_text = extract_response_text(response)
 
         # Try to extract and parse JSON from the response
         parsed_json = extract_json_from_response(response_text)
 
         if parsed_json:
-            # Use parsed values from AI (organ-specific, patient-specific)
-            return {
-                "rejection_probability": parsed_json.get("rejection_probability", 0.5),
-                "urgency": parsed_json.get("urgency", "MEDIUM"),
-                "risk_level": parsed_json.get("risk_level", "medium"),
-                "recommended_action": parsed_json.get(
-                    "recommended_action", "Monitor symptoms and contact team if worsens"
-                ),
-                "reasoning_steps": parsed_json.get("reasoning_steps", []),
-                "similar_cases": parsed_json.get("similar_cases", []),
-                "srtr_data_source": parsed_json.get("srtr_data_source"),
-                "agent_name": self.agent.name,
-                "raw_response": response_text,
-            }
+            return self._build_result(parsed_json, response_text)
         else:
             # Fallback if JSON parsing fails
             return {
                 "rejection_probability": 0.5,
                 "urgency": "MEDIUM",
                 "risk_level": "medium",
-                "recommended_action": "Unable to parse AI response. Review full analysis and contact team.",
+                "recommended_action": _PARSE_FAILURE_ACTION,
                 "reasoning_steps": [response_text],
                 "similar_cases": [],
                 "agent_name": self.agent.name,
                 "raw_response": response_text,
             }
+
+    def _build_result(self, parsed_json: dict[str, Any], response_text: str) -> dict[str, Any]:
+        """Build the result dict from a parsed JSON answer."""
+        # Use parsed values from AI (organ-specific, patient-specific)
+        return {
+            "rejection_probability": parsed_json.get("rejection_probability", 0.5),
+            "urgency": parsed_json.get("urgency", "MEDIUM"),
+            "risk_level": parsed_json.get("risk_level", "medium"),
+            "recommended_action": parsed_json.get(
+                "recommended_action", "Monitor symptoms and contact team if worsens"
+            ),
+            "reasoning_steps": parsed_json.get("reasoning_steps", []),
+            "similar_cases": parsed_json.get("similar_cases", []),
+            "srtr_data_source": parsed_json.get("srtr_data_source"),
+            "agent_name": self.agent.name,
+            "raw_response": response_text,
+        }
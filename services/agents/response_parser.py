@@ -6,8 +6,25 @@ standardized parsing logic to extract structured data from those responses.
 """
 
 import json
+import logging
 from typing import Any
 
+__all__ = [
+    "extract_json_from_response",
+    "extract_json_list_from_response",
+    "extract_response_text",
+]
+
+_LOGGER = logging.getLogger(__name__)
+
+# Longest response parsed in full; structured agent answers are a few KB, so
+# anything near this is a runaway generation and only its head is scanned
+MAX_RESPONSE_CHARS = 512 * 1024
+
+# Shared decoder; raw_decode parses one value and reports where it ended,
+# so an object embedded in prose is decoded without locating its end first
+_DECODER = json.JSONDecoder()
+
 
 def _try_parse_json_dict(text: str) -> dict[str, Any] | None:
     """Try to parse text as JSON dict, return None if fails."""
@@ -20,9 +37,9 @@ def _try_parse_json_dict(text: str) -> dict[str, Any] | None:
     return None
 
 
-def _extract_code_block(text: str, marker: str) -> str | None:
-    """Extract content between marker and closing ```."""
-    start = text.find(marker)
+def _extract_code_block(text: str, marker: str, start: int = 0) -> str | None:
+    """Extract content between marker (searched from start) and closing ```."""
+    start = text.find(marker, start)
     if start == -1:
         return None
 
@@ -39,40 +56,13 @@ def _extract_code_block(text: str, marker: str) -> str | None:
     return text[content_start:content_end]
 
 
-def _find_json_object(text: str) -> str | None:
-    """Find first complete JSON object by counting braces."""
-    brace_index = text.find("{")
-    if brace_index == -1:
+def _decode_json_object_at(text: str, start: int) -> dict[str, Any] | None:
+    """Decode the JSON object beginning at text[start], ignoring anything after it."""
+    try:
+        parsed, _ = _DECODER.raw_decode(text, start)
+    except json.JSONDecodeError:
         return None
-
-    depth = 0
-    in_string = False
-    escape_next = False
-
-    for i in range(brace_index, len(text)):
-        char = text[i]
-
-        if escape_next:
-            escape_next = False
-            continue
-
-        if char == "\\":
-            escape_next = True
-            continue
-
-        if char == '"':
-            in_string = not in_string
-            continue
-
-        if not in_string:
-            if char == "{":
-                depth += 1
-            elif char == "}":
-                depth -= 1
-                if depth == 0:
-                    return text[brace_index : i + 1]
-
-    return None
+    return parsed if isinstance(parsed, dict) else None
 
 
 def extract_json_from_response(response_text: str) -> dict[str, Any] | None:
@@ -91,25 +81,99 @@ def extract_json_from_response(response_text: str) -> dict[str, Any] | None:
     if not response_text:
         return None
 
-    # Try ```json ... ``` code block
-    content = _extract_code_block(response_text, "```json")
-    if content:
-        result = _try_parse_json_dict(content)
-        if result:
-            return result
+    if len(response_text) > MAX_RESPONSE_CHARS:
+        _LOGGER.warning(
+            "Truncating %d-char agent response to %d chars before JSON extraction",
+            len(response_text),
+            MAX_RESPONSE_CHARS,
+        )
+        response_text = response_text[:MAX_RESPONSE_CHARS]
+
+    # Every candidate (bare, fenced, or embedded) contains an object, so a
+    # response without a brace can be rejected with one scan
+    brace_index = response_text.find("{")
+    if brace_index == -1:
+        return None
 
-    # Try ``` ... ``` code block
-    content = _extract_code_block(response_text, "```")
-    if content:
-        result = _try_parse_json_dict(content)
+    # Fast path: the whole response is a JSON object (single C-level parse)
+    stripped = response_text.strip()
+    if stripped.startswith("{") and stripped.endswith("}"):
+        result = _try_parse_json_dict(stripped)
         if result:
             return result
 
-    # Try raw JSON object
-    content = _find_json_object(response_text)
-    if content:
-        result = _try_parse_json_dict(content)
-        if result:
-            return result
+    # Locate the first fence once; no fence means neither code block can match,
+    # and a ```json fence can only start at or after it
+    fence = response_text.find("```")
+    if fence != -1:
+        # Try ```json ... ``` code block
+        content = _extract_code_block(response_text, "```json", fence)
+        if content:
+            result = _try_parse_json_dict(content)
+            if result:
+                return result
+
+        # Try ``` ... ``` code block
+        content = _extract_code_block(response_text, "```", fence)
+        if content:
+            result = _try_parse_json_dict(content)
+            if result:
+                return result
+
+    # Try raw JSON object starting at the first brace
+    return _decode_json_object_at(response_text, brace_index) or None
+
+
+def extract_json_list_from_response(response_text: str) -> list[Any] | None:
+    """
+    Extract and parse a JSON array from an AI response.
 
-    return None
+    Used for batched prompts that ask for one result per input. The array may
+    be returned raw or wrapped in a markdown code block.
+
+    Args:
+        response_text: Raw text response from the AI
+
+    Returns:
+        Parsed JSON list if successful, None if parsing fails
+    """
+    if not response_text:
+        return None
+
+    bracket_index = response_text.find("[")
+    if bracket_index == -1:
+        return None
+
+    try:
+        parsed, _ = _DECODER.raw_decode(response_text, bracket_index)
+    except json.JSONDecodeError:
+        return None
+    return parsed if isinstance(parsed, list) else None
+
+
+def extract_response_text(response: Any) -> str:
+    """
+    Get the model text from an agent response without serializing the object.
+
+    Accepts the plain strings returned by BaseADKAgent._invoke_agent as well as
+    ADK/GenAI response objects exposing .text or .content.parts[].text.
+
+    Args:
+        response: Agent response (str or ADK/GenAI response object)
+
+    Returns:
+        Response text, or str(response) if no text accessor is available
+    """
+    if isinstance(response, str):
+        return response
+
+    text = getattr(response, "text", None)
+    if isinstance(text, str):
+        return text
+
+    parts = getattr(getattr(response, "content", None), "parts", None) or ()
+    texts = [t for part in parts if isinstance(t := getattr(part, "text", None), str)]
+    if texts:
+        return "".join(texts)
+
+    return str(response)
@@ -0,0 +1,92 @@
+"""
+Retry with exponential backoff for transient Gemini failures.
+
+Rate limiting (429) and server-side errors (5xx, timeouts) are usually gone a
+few seconds later, so failing the whole analysis on the first one wastes the
+request. Client errors (400, 401, 403, 404) are not retried: sending the same
+request again cannot fix them. Every retry is logged so a slow call in backoff
+can be told apart from a hung one. An optional deadline bounds the whole
+sequence, so retries can't hold a request thread indefinitely.
+"""
+
+import asyncio
+import functools
+import logging
+import random
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying (529 is an upstream "overloaded" status)
+TRANSIENT_STATUS_CODES = frozenset({429, 500, 502, 503, 504, 529})
+
+
+def _status_code(exc: BaseException) -> Any:
+    """Return the HTTP status carried by an API error, if any."""
+    return getattr(exc, "code", None) or getattr(exc, "status_code", None)
+
+
+def is_transient(exc: BaseException) -> bool:
+    """
+    Classify an exception from a model call as transient (worth retrying).
+
+    Args:
+        exc: Exception raised by the call
+
+    Returns:
+        True for timeouts, connection errors, and 429/5xx API errors
+    """
+    if isinstance(exc, TimeoutError | ConnectionError):
+        return True
+    return _status_code(exc) in TRANSIENT_STATUS_CODES
+
+
+def retry_llm[**P, T](
+    max_attempts: int = 5, base: float = 1.0, cap: float = 30.0, deadline: float | None = None
+) -> Callable[[Callable[P, Coroutine[Any, Any, T]]], Callable[P, Coroutine[Any, Any, T]]]:
+    """
+    Retry an async model call on transient errors with jittered exponential backoff.
+
+    The wait before retry n (1-based) is min(cap, base * 2 ** (n - 1)) plus up to
+    one second of random jitter, so concurrent callers don't retry in lockstep.
+
+    Args:
+        max_attempts: Total attempts, including the first
+        base: Initial backoff in seconds
+        cap: Maximum backoff in seconds, before jitter
+        deadline: Seconds allowed for all attempts and waits together (None for no
+            limit); when it passes, the call in progress is cancelled and
+            TimeoutError is raised
+
+    Returns:
+        Decorator for coroutine functions
+    """
+
+    def decorator(
+        func: Callable[P, Coroutine[Any, Any, T]],
+    ) -> Callable[P, Coroutine[Any, Any, T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            attempt = 1
+            async with asyncio.timeout(deadline):
+                while True:
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        if attempt >= max_attempts or not is_transient(e):
+                            raise
+                        wait = min(cap, base * 2 ** (attempt - 1)) + random.uniform(0, 1)
+                        _LOGGER.warning(
+                            "[LLM] provider=gemini attempt=%d/%d status=%s wait=%.1fs",
+                            attempt,
+                            max_attempts,
+                            _status_code(e) or type(e).__name__,
+                            wait,
+                        )
+                        await asyncio.sleep(wait)
+                        attempt += 1
+
+        return wrapper
+
+    return decorator
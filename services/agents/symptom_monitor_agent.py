@@ -11,9 +11,14 @@ from typing import Any
 from google.adk.agents import Agent  # type: ignore[import-untyped]
 from google.genai import types  # type: ignore[import-untyped]
 
+from services.agents.base_adk_agent import run_sync
+from services.agents.prompt_cache import LRUCache, prompt_key
+from services.agents.response_parser import extract_response_text
 from services.config.adk_config import (
     DEFAULT_GENERATION_CONFIG,
     GEMINI_API_KEY,
+    RESPONSE_CACHE_SIZE,
+    RESPONSE_CACHE_TTL,
     SYMPTOM_MONITOR_CONFIG,
 )
 
@@ -54,12 +59,16 @@ class SymptomMonitorAgent:
             generate_content_config=generate_config,
         )
 
+        # Response text keyed by prompt hash; identical inputs skip the model call
+        self._response_cache = LRUCache(maxsize=RESPONSE_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL)
+
     def analyze_symptoms(
         self,
         symptoms: list[str],
         patient_id: str | None = None,
         patient_context: dict[str, Any] | None = None,
         vital_signs: dict[str, Any] | None = None,
+        cache_bust: bool = False,
     ) -> dict[str, Any]:
         """
         Analyze patient symptoms for transplant rejection risk.
@@ -69,6 +78,7 @@ class SymptomMonitorAgent:
             patient_id: Optional patient identifier for context
             patient_context: Optional dict with transplant date, medication history, previous rejections
             vital_signs: Optional dict with temperature, weight, blood pressure
+            cache_bust: Skip the cached result for an identical prompt and ask the model again
 
         Returns:
             Dict with:
@@ -79,6 +89,29 @@ class SymptomMonitorAgent:
                 - differential: Alternative diagnoses to consider
                 - confidence: Confidence score (0.0-1.0)
         """
+        return run_sync(
+            self.analyze_symptoms_async(
+                symptoms=symptoms,
+                patient_id=patient_id,
+                patient_context=patient_context,
+                vital_signs=vital_signs,
+                cache_bust=cache_bust,
+            )
+        )
+
+    async def analyze_symptoms_async(
+        self,
+        symptoms: list[str],
+        patient_id: str | None = None,
+        patient_context: dict[str, Any] | None = None,
+        vital_signs: dict[str, Any] | None = None,
+        cache_bust: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Async variant of analyze_symptoms for callers with a running event loop.
+
+        Args and return value match analyze_symptoms.
+        """
         # Build prompt with clinical context
         prompt = self._build_symptom_analysis_prompt(
             symptoms=symptoms,
@@ -87,11 +120,21 @@ class SymptomMonitorAgent:
             vital_signs=vital_signs,
         )
 
-        # Invoke agent (ADK handles session management)
-        response = asyncio.run(self.agent.run_async(prompt))  # type: ignore[attr-defined, arg-type, var-annotated]
+        # Parsing is a cheap template fill, so the cache holds the response text
+        # and each hit builds a fresh result dict from it
+        cache_key = prompt_key(prompt)
+        response_text = None if cache_bust else self._response_cache.get(cache_key)
+        if response_text is None:
+            # Invoke agent (ADK handles session management)
+            response = await asyncio.wait_for(
+                self.agent.run_async(prompt),  # type: ignore[attr-defined, arg-type]
+                timeout=SYMPTOM_MONITOR_CONFIG["request_timeout"],  # type: ignore[arg-type]
+            )
+            response_text = extract_response_text(response)
+            self._response_cache[cache_key] = response_text
 
         # Parse agent response
-        return self._parse_agent_response(response)
+        return self._parse_agent_response(response_text)
 
     def _build_symptom_analysis_prompt(
         self,
@@ -101,27 +144,22 @@ class SymptomMonitorAgent:
         vital_signs: dict[str, Any] | None,
     ) -> str:
         """Build structured prompt for symptom analysis."""
-        prompt_parts = [
-            "Analyze these patient symptoms for kidney transplant rejection risk:",
-            f"- Symptoms: {', '.join(symptoms)}",
-        ]
-
+        prompt = (
+            "Analyze these patient symptoms for kidney transplant rejection risk:\n"
+            f"- Symptoms: {', '.join(symptoms)}"
+        )
         if patient_id:
-            prompt_parts.append(f"- Patient ID: {patient_id}")
-
+            prompt += f"\n- Patient ID: {patient_id}"
         if patient_context:
-            prompt_parts.append(f"- Patient context: {patient_context}")
-
+            prompt += f"\n- Patient context: {patient_context}"
         if vital_signs:
-            prompt_parts.append(f"- Vital signs: {vital_signs}")
+            prompt += f"\n- Vital signs: {vital_signs}"
 
-        prompt_parts.append(
-            "\nProvide a JSON response with: rejection_risk, urgency, reasoning, "
+        return (
+            f"{prompt}\n\nProvide a JSON response with: rejection_risk, urgency, reasoning, "
             "actions (list), differential (list), confidence (0.0-1.0)."
         )
 
-        return "\n".join(prompt_parts)
-
     def _parse_agent_response(self, response: Any) -> dict[str, Any]:
         """
         Parse ADK agent response into structured format.
@@ -134,7 +172,7 @@ class SymptomMonitorAgent:
         """
         # ADK returns agent response object
         # Extract text content and parse JSON if present
-        response_text = str(response)
+        response_text = extract_response_text(response)
 
         # Basic parsing (in real implementation, use JSON parsing)
         # For now, return structured format
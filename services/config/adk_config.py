@@ -30,6 +30,43 @@ DEFAULT_GENERATION_CONFIG = {
     "top_k": 40,
 }
 
+# Gemini context caching for static agent instructions (opt-in).
+# Only requests above min_tokens are cached; Gemini rejects smaller caches.
+CONTEXT_CACHE_CONFIG: dict[str, Any] = {
+    "enabled": os.environ.get("ADK_CONTEXT_CACHE", "false").lower() == "true",
+    "min_tokens": 1024,
+    "ttl_seconds": 3600,
+    "cache_intervals": 10,
+}
+
+# Response cache size for coordinator synthesis (0 disables caching)
+SYNTHESIS_CACHE_SIZE = int(os.environ.get("SYNTHESIS_CACHE_SIZE", "512"))
+
+# Answer cache size for drug interaction checks (0 disables caching)
+INTERACTION_CACHE_SIZE = int(os.environ.get("INTERACTION_CACHE_SIZE", "1024"))
+
+# Parsed-result cache for rejection risk and symptom analyses (0 disables caching);
+# entries expire after RESPONSE_CACHE_TTL seconds
+RESPONSE_CACHE_SIZE = int(os.environ.get("RESPONSE_CACHE_SIZE", "4096"))
+RESPONSE_CACHE_TTL = float(os.environ.get("RESPONSE_CACHE_TTL", "3600"))
+
+# Cases sent per model call by RejectionRiskAgent.analyze_rejection_risk_batch
+REJECTION_BATCH_SIZE = int(os.environ.get("REJECTION_BATCH_SIZE", "8"))
+
+# Maximum model calls one batch helper keeps in flight (provider rate limits)
+AGENT_MAX_CONCURRENCY = int(os.environ.get("AGENT_MAX_CONCURRENCY", "48"))
+
+# Client-side Gemini requests per minute, per model (0 disables throttling)
+GEMINI_RPM_LIMIT = int(os.environ.get("GEMINI_RPM_LIMIT", "0"))
+
+# Seconds before a single agent call is abandoned (and retried as transient);
+# roughly 10x the observed median Gemini latency
+DEFAULT_REQUEST_TIMEOUT = float(os.environ.get("AGENT_REQUEST_TIMEOUT", "75"))
+
+# Seconds one agent call may take across all retries, so a synchronous request
+# thread is released well inside Cloud Run's request timeout (300s in deploy.sh)
+AGENT_CALL_DEADLINE = float(os.environ.get("AGENT_CALL_DEADLINE", "120"))
+
 # Agent-Specific Configurations
 COORDINATOR_CONFIG = {
     "name": "TransplantCoordinator",
@@ -67,6 +104,9 @@ Provide JSON-formatted responses with: recommendation, reasoning_steps, risk_lev
 REJECTION_RISK_CONFIG = {
     "name": "RejectionRiskAnalyzer",
     "model": GEMINI_MODEL,
+    "request_timeout": DEFAULT_REQUEST_TIMEOUT,
+    # Offline cohort scoring through the Gemini Batch API (half price, async turnaround)
+    "batch_api_enabled": os.environ.get("REJECTION_BATCH_API", "false").lower() == "true",
     "description": "Analyzes transplant rejection symptoms using SRTR population data",
     "instruction": """You are the RejectionRiskAnalyzer agent specializing in transplant rejection detection.
 Your role is to:
@@ -97,6 +137,7 @@ similar_cases (list of 3: {symptoms, outcome, similarity}), srtr_data_source (wh
 SYMPTOM_MONITOR_CONFIG = {
     "name": "SymptomMonitor",
     "model": GEMINI_MODEL,
+    "request_timeout": DEFAULT_REQUEST_TIMEOUT,
     "description": "Detects transplant rejection symptoms and assesses urgency",
     "instruction": """You are the SymptomMonitor agent specializing in transplant rejection detection.
 Your role is to:
@@ -133,7 +174,9 @@ Key interactions for transplant medications:
 - Mycophenolate + Antacids: Decreased absorption
 - Tacrolimus + Ketoconazole/Erythromycin: Increased levels
 
-Provide JSON-formatted responses with: has_interaction, severity, mechanism, clinical_effect, recommendation.""",
+Provide JSON-formatted responses with: has_interaction, severity, mechanism, clinical_effect, recommendation,
+confidence (0.0-1.0), and interactions (list of objects with substances, severity, mechanism,
+clinical_effect, recommendation).""",
 }
 
 # Firestore Configuration
@@ -160,6 +203,16 @@ def validate_config() -> bool:
     return True
 
 
+# Agent name -> configuration, for get_agent_config
+_AGENT_CONFIGS: dict[str, dict[str, Any]] = {
+    "TransplantCoordinator": COORDINATOR_CONFIG,
+    "MedicationAdvisor": MEDICATION_ADVISOR_CONFIG,
+    "RejectionRiskAnalyzer": REJECTION_RISK_CONFIG,
+    "SymptomMonitor": SYMPTOM_MONITOR_CONFIG,
+    "DrugInteractionChecker": DRUG_INTERACTION_CONFIG,
+}
+
+
 def get_agent_config(agent_name: str) -> dict[str, Any]:
     """
     Get configuration for a specific agent.
@@ -170,11 +223,4 @@ def get_agent_config(agent_name: str) -> dict[str, Any]:
     Returns:
         Dictionary with agent configuration
     """
-    configs = {
-        "TransplantCoordinator": COORDINATOR_CONFIG,
-        "MedicationAdvisor": MEDICATION_ADVISOR_CONFIG,
-        "RejectionRiskAnalyzer": REJECTION_RISK_CONFIG,
-        "SymptomMonitor": SYMPTOM_MONITOR_CONFIG,
-        "DrugInteractionChecker": DRUG_INTERACTION_CONFIG,
-    }
-    return configs.get(agent_name, {})
+    return _AGENT_CONFIGS.get(agent_name, {})
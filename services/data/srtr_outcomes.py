@@ -2,14 +2,36 @@
 SRTR Outcomes Data Query Module
 
 Provides easy access to real transplant outcomes data from SRTR for use by ADK agents.
-Data is loaded from JSON files (fast, no Firestore queries needed).
+Data is loaded from JSON files (fast, no Firestore queries needed). The small
+summary file is read up front; the per-record flat file is read on first use.
 Supports all 6 organ types: kidney, liver, heart, lung, pancreas, intestine.
 """
 
+import bisect
 import json
+import threading
 from pathlib import Path
 from typing import Any
 
+# Hours-late band edges; a dose is in a band when it is later than the band's edge
+_LATE_DOSE_THRESHOLDS_HOURS = (2.0, 6.0, 12.0)
+
+# (risk multiplier, explanation template) for each band, from on time to >12h late
+_LATE_DOSE_RISK_BANDS = (
+    (1.0, "Minimal risk impact. Baseline rejection rate: {rate:.2f}%."),
+    (1.1, "Slight risk increase. Stay vigilant. Baseline rejection rate: {rate:.2f}%."),
+    (
+        1.2,
+        "Dose 6-12h late moderately increases risk. "
+        "Baseline rejection rate for {age_group}: {rate:.2f}%.",
+    ),
+    (
+        1.5,
+        "Dose >12h late significantly increases risk. "
+        "Your age group ({age_group}) has baseline rejection rate of {rate:.2f}%.",
+    ),
+)
+
 
 class SRTROutcomesData:
     """Query SRTR transplant outcomes data for any organ."""
@@ -30,22 +52,70 @@ class SRTROutcomesData:
         self.organ = organ.lower()
         self.data_dir = Path(data_dir)
         self._data: list[dict[str, Any]] | None = None
+        self._data_loaded = False
+        self._data_lock = threading.Lock()
+        # age_group -> [(years_post_transplant, survival_rate)]; None holds every record
+        self._graft_index: dict[str | None, list[tuple[float, Any]]] = {}
         self._summary: dict[str, Any] | None = None
-        self._load_data()
+        self._load_summary()
 
-    def _load_data(self):
-        """Load data from JSON files for specified organ."""
-        flat_file = self.data_dir / f"{self.organ}_outcomes_flat.json"
+    def _load_summary(self):
+        """Load the summary JSON file for specified organ."""
         summary_file = self.data_dir / f"{self.organ}_summary.json"
 
-        if flat_file.exists():
-            with open(flat_file) as f:
-                self._data = json.load(f)
-
         if summary_file.exists():
             with open(summary_file) as f:
                 self._summary = json.load(f)
 
+    @property
+    def data(self) -> list[dict[str, Any]] | None:
+        """Graft survival records, loaded on first access (None if no flat records)."""
+        if not self._data_loaded:
+            with self._data_lock:
+                if not self._data_loaded:
+                    self._data = self._load_graft_records()
+                    self._graft_index = self._build_graft_index(self._data or [])
+                    self._data_loaded = True
+        return self._data
+
+    def _load_graft_records(self) -> list[dict[str, Any]] | None:
+        """Load the flat JSON file, keeping only the graft survival records queried here."""
+        flat_file = self.data_dir / f"{self.organ}_outcomes_flat.json"
+        if not flat_file.exists():
+            return None
+
+        with open(flat_file, "rb") as f:
+            records: list[dict[str, Any]] = json.load(f)
+        if not records:
+            return None
+        # The other metrics are served from the summary file; dropping them here lets
+        # the parsed records be freed right after load instead of staying resident
+        return [r for r in records if r.get("metric") == "graft_survival"]
+
+    @staticmethod
+    def _build_graft_index(
+        records: list[dict[str, Any]],
+    ) -> dict[str | None, list[tuple[float, Any]]]:
+        """Group (years, survival rate) pairs by age group so queries skip other groups."""
+        index: dict[str | None, list[tuple[float, Any]]] = {None: []}
+        for r in records:
+            point = (r.get("years_post_transplant", 0), r.get("survival_rate"))
+            index[None].append(point)
+            age_group = r.get("age_group")
+            if age_group is not None:
+                index.setdefault(age_group, []).append(point)
+        return index
+
+    @property
+    def has_data(self) -> bool:
+        """Whether the organ summary file was loaded (False in demo mode without data files)."""
+        return self._summary is not None
+
+    @property
+    def total_records(self) -> int | None:
+        """Number of recipient records behind the summary (None without data files)."""
+        return self._summary.get("total_records") if self._summary else None
+
     def get_acute_rejection_rate(self, age_group: str | None = None) -> float | dict[str, float]:
         """
         Get acute rejection rate (latest year: 2022).
@@ -80,21 +150,14 @@ class SRTROutcomesData:
         Returns:
             Survival rate percentage
         """
-        if not self._data:
+        if self.data is None:
             return 99.0  # Conservative default
 
         years = months_post_transplant / 12.0
 
-        # Find matching records
-        matches = [
-            r
-            for r in self._data
-            if r.get("metric") == "graft_survival"
-            and abs(r.get("years_post_transplant", 0) - years) < 0.1
-        ]
-
-        if age_group:
-            matches = [r for r in matches if r.get("age_group") == age_group]
+        # Find matching records within the age group's bucket
+        points = self._graft_index.get(age_group or None, [])
+        matches = [rate for y, rate in points if abs(y - years) < 0.1]
 
         if not matches:
             # Return 1-year average if no exact match
@@ -104,7 +167,7 @@ class SRTROutcomesData:
             return 98.0
 
         # Average the matching records
-        survival_rates: list[float] = [float(r["survival_rate"]) for r in matches]
+        survival_rates: list[float] = [float(rate) for rate in matches]
         return float(sum(survival_rates) / len(survival_rates))
 
     def get_population_context(self, age_group: str, months_post_transplant: int) -> dict[str, Any]:
@@ -164,21 +227,10 @@ class SRTROutcomesData:
         # Get baseline rejection rate for age group
         baseline_rejection = self.get_acute_rejection_rate(age_group)
 
-        # Risk factors
-        if hours_late > 12:
-            multiplier = 1.5
-            explanation = f"Dose >12h late significantly increases risk. Your age group ({age_group}) has baseline rejection rate of {baseline_rejection:.2f}%."
-        elif hours_late > 6:
-            multiplier = 1.2
-            explanation = f"Dose 6-12h late moderately increases risk. Baseline rejection rate for {age_group}: {baseline_rejection:.2f}%."
-        elif hours_late > 2:
-            multiplier = 1.1
-            explanation = f"Slight risk increase. Stay vigilant. Baseline rejection rate: {baseline_rejection:.2f}%."
-        else:
-            multiplier = 1.0
-            explanation = (
-                f"Minimal risk impact. Baseline rejection rate: {baseline_rejection:.2f}%."
-            )
+        # Risk factors: the band is the number of thresholds hours_late exceeds
+        band = bisect.bisect_left(_LATE_DOSE_THRESHOLDS_HOURS, hours_late)
+        multiplier, template = _LATE_DOSE_RISK_BANDS[band]
+        explanation = template.format(age_group=age_group, rate=baseline_rejection)
 
         return multiplier, explanation
 
@@ -3,12 +3,50 @@ Google Gemini AI Client for Transplant Medication Adherence
 Real AI inference for the Google Cloud Run Hackathon
 """
 
+import functools
 import json
 import os
 from typing import Any
 
 import google.generativeai as genai
 
+# Generation settings per task, built once and shared by every request
+_GEN_CFG_MISSED_DOSE = genai.types.GenerationConfig(
+    temperature=0.3,  # Lower for medical accuracy
+    max_output_tokens=800,
+)
+_GEN_CFG_SYMPTOMS = genai.types.GenerationConfig(
+    temperature=0.3,
+    max_output_tokens=600,
+)
+_GEN_CFG_INTERACTION = genai.types.GenerationConfig(
+    temperature=0.2,  # Very low for drug safety
+    max_output_tokens=500,
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _configure(api_key: str) -> None:
+    """Configure the SDK for api_key, skipping the call when the key is unchanged."""
+    genai.configure(api_key=api_key)
+
+
+@functools.cache
+def _generative_model(model_name: str) -> genai.GenerativeModel:
+    """Return the model handle shared by every GeminiClient (clients are made per request)."""
+    return genai.GenerativeModel(model_name)
+
+
+def _strip_fence(text: str) -> str:
+    """Return the body of a leading markdown code block, or the stripped text if none."""
+    text = text.strip()
+    if not text.startswith("```"):
+        return text
+    # Slice up to the closing fence instead of splitting on every fence in the text
+    end = text.find("```", 3)
+    body = text[3:] if end == -1 else text[3:end]
+    return body.removeprefix("json")
+
 
 class GeminiClient:
     """Client for Google Gemini AI API"""
@@ -16,12 +54,10 @@ class GeminiClient:
     def __init__(self, api_key: str | None = None):
         self.api_key = api_key or os.environ.get("GEMINI_API_KEY", "")
         if self.api_key:
-            genai.configure(api_key=self.api_key)
+            _configure(self.api_key)
             # Use Gemini 2.0 Flash - fast and powerful model for medical reasoning
-            self.model = genai.GenerativeModel("gemini-2.0-flash")
-            self.flash_model = genai.GenerativeModel(
-                "gemini-2.0-flash-lite"
-            )  # Even faster for simple queries
+            self.model = _generative_model("gemini-2.0-flash")
+            self.flash_model = _generative_model("gemini-2.0-flash-lite")  # Even faster
         else:
             self.model = None
             self.flash_model = None
@@ -63,21 +99,10 @@ Provide a response in JSON format with these fields:
 Format as valid JSON only."""
 
         try:
-            response = self.model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.3,  # Lower for medical accuracy
-                    max_output_tokens=800,
-                ),
-            )
+            response = self.model.generate_content(prompt, generation_config=_GEN_CFG_MISSED_DOSE)
 
             # Parse JSON from response
-            response_text = response.text.strip()
-            # Remove markdown code blocks if present
-            if response_text.startswith("```"):
-                response_text = response_text.split("```")[1]
-                if response_text.startswith("json"):
-                    response_text = response_text[4:]
+            response_text = _strip_fence(response.text)
 
             result = json.loads(response_text)
             result["ai_model"] = "gemini-2.0-flash"
@@ -118,18 +143,10 @@ Format as valid JSON only."""
 
         try:
             response = self.flash_model.generate_content(  # Use Flash for faster response
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.3,
-                    max_output_tokens=600,
-                ),
+                prompt, generation_config=_GEN_CFG_SYMPTOMS
             )
 
-            response_text = response.text.strip()
-            if response_text.startswith("```"):
-                response_text = response_text.split("```")[1]
-                if response_text.startswith("json"):
-                    response_text = response_text[4:]
+            response_text = _strip_fence(response.text)
 
             result = json.loads(response_text)
             result["ai_model"] = "gemini-2.0-flash"
@@ -167,18 +184,10 @@ Format as valid JSON only."""
 
         try:
             response = self.flash_model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.2,  # Very low for drug safety
-                    max_output_tokens=500,
-                ),
+                prompt, generation_config=_GEN_CFG_INTERACTION
             )
 
-            response_text = response.text.strip()
-            if response_text.startswith("```"):
-                response_text = response_text.split("```")[1]
-                if response_text.startswith("json"):
-                    response_text = response_text[4:]
+            response_text = _strip_fence(response.text)
 
             result = json.loads(response_text)
             result["ai_model"] = "gemini-2.0-flash"
@@ -254,7 +263,8 @@ Format as valid JSON only."""
 
     def _mock_interaction_check(self, medications: list[str], new_item: str) -> dict[str, Any]:
         """Mock drug interaction check"""
-        if "tacrolimus" in [m.lower() for m in medications] and "grapefruit" in new_item.lower():
+        # Cheap substring check first; the medication scan stops at the first match
+        if "grapefruit" in new_item.lower() and any(m.lower() == "tacrolimus" for m in medications):
             return {
                 "has_interaction": True,
                 "severity": "severe",
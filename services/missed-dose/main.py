@@ -3,9 +3,17 @@ Cloud Run Service: Missed Dose Analysis
 Uses Google ADK Multi-Agent System for AI medical reasoning
 """
 
+import atexit
+import copy
+import functools
 import logging
 import os
+import random
 import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 from flask import Flask, jsonify, render_template, request
@@ -13,17 +21,43 @@ from flask_cors import CORS
 from google.cloud import firestore
 from werkzeug.exceptions import BadRequest
 
-# Add parent directory to path to import ADK agents
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add repository root to path to import ADK agents (in the container, deploy.sh
+# copies them next to this file instead)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from services.agents.coordinator_agent import TransplantCoordinatorAgent
 from services.agents.drug_interaction_agent import DrugInteractionCheckerAgent
 from services.agents.medication_advisor_agent import MedicationAdvisorAgent
+from services.agents.prompt_cache import LRUCache
 from services.agents.rejection_risk_agent import RejectionRiskAgent
 from services.agents.symptom_monitor_agent import SymptomMonitorAgent
 
 # Constants
 PLATFORM_NAME = "Google Cloud Run"
 
+# Static "infrastructure" metadata attached to API responses, built once per process
+_INFRASTRUCTURE_BASE = {
+    "platform": PLATFORM_NAME,
+    "database": "Firestore",
+    "ai_system": "Google ADK Multi-Agent System",
+    "ai_model": "gemini-2.0-flash-exp",
+}
+_REGION = os.environ.get("REGION", "us-central1")
+MEDICATION_ADVISOR_INFRASTRUCTURE = {
+    **_INFRASTRUCTURE_BASE,
+    "agent_used": "MedicationAdvisor",
+    "region": _REGION,
+}
+REJECTION_RISK_INFRASTRUCTURE = {
+    **_INFRASTRUCTURE_BASE,
+    "agent_used": "RejectionRiskAnalyzer",
+    "region": _REGION,
+}
+DRUG_INTERACTION_INFRASTRUCTURE = {
+    **_INFRASTRUCTURE_BASE,
+    "agent_used": "DrugInteractionChecker",
+    "region": _REGION,
+}
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -33,81 +67,177 @@ app = Flask(__name__)
 CORS(app)
 
 # Initialize Firestore
-db = firestore.Client(project=os.environ.get("GOOGLE_CLOUD_PROJECT", "transplant-prediction"))
+# Each client multiplexes its calls over one gRPC channel, which caps concurrent
+# streams; spreading requests over a few clients keeps them from queueing there
+firestore_clients = [
+    firestore.Client(project=os.environ.get("GOOGLE_CLOUD_PROJECT", "transplant-prediction"))
+    for _ in range(int(os.environ.get("FIRESTORE_POOL_SIZE", "4")))
+]
+
+
+def firestore_client():
+    """Pick a Firestore client from the pool"""
+    return random.choice(firestore_clients)
+
+
+# Runs independent Firestore reads alongside the request thread, so request latency
+# isn't the sum of round trips
+firestore_io = ThreadPoolExecutor(max_workers=16, thread_name_prefix="firestore")
+
+# History writes are queued and committed in batches by a background thread, so a
+# request never waits on its own write (deque appends/pops are thread-safe). The
+# thread only runs while Cloud Run allocates CPU, so deploy.sh turns off CPU
+# throttling; a full batch is also written from the request that filled it.
+INTERACTION_BATCH_SIZE = 500
+INTERACTION_FLUSH_INTERVAL = 0.5  # seconds
+pending_interactions: deque = deque()
+
+# Patient profiles change rarely; repeat requests within the TTL skip the Firestore read
+patient_context_cache = LRUCache(
+    maxsize=10_000, ttl=float(os.environ.get("PATIENT_CONTEXT_CACHE_TTL", "60"))
+)
 
-# Initialize ADK agents
+# Initialize ADK agents on first use, so the worker starts serving (and answering
+# /health) without waiting on agent construction; the warmup thread below builds
+# the ones the API routes need in the background
 api_key = os.environ.get("GEMINI_API_KEY")
 if not api_key:
     logger.warning("GEMINI_API_KEY not set - agents will use config default")
 
-medication_advisor = MedicationAdvisorAgent(api_key=api_key)
-rejection_risk = RejectionRiskAgent(api_key=api_key)
-symptom_monitor = SymptomMonitorAgent(api_key=api_key)
-drug_interaction_checker = DrugInteractionCheckerAgent(api_key=api_key)
-coordinator = TransplantCoordinatorAgent(
-    api_key=api_key,
-    medication_advisor=medication_advisor,
-    symptom_monitor=symptom_monitor,
-    drug_interaction_checker=drug_interaction_checker,
-)
+
+@functools.lru_cache(maxsize=1)
+def get_medication_advisor():
+    return MedicationAdvisorAgent(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=1)
+def get_rejection_risk():
+    return RejectionRiskAgent(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=1)
+def get_symptom_monitor():
+    return SymptomMonitorAgent(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=1)
+def get_drug_interaction_checker():
+    return DrugInteractionCheckerAgent(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=1)
+def get_coordinator():
+    return TransplantCoordinatorAgent(
+        api_key=api_key,
+        medication_advisor=get_medication_advisor(),
+        symptom_monitor=get_symptom_monitor(),
+        drug_interaction_checker=get_drug_interaction_checker(),
+    )
+
+
+def _warm_up_agents():
+    for factory in (get_medication_advisor, get_rejection_risk, get_drug_interaction_checker):
+        try:
+            factory()
+        except Exception as e:
+            # The route builds the agent on first use instead and reports any error there
+            logger.error(f"Agent warmup failed for {factory.__name__}: {e}")
+
+
+threading.Thread(target=_warm_up_agents, name="agent-warmup", daemon=True).start()
+
+
+# Medication database, keyed by lowercase name
+MEDICATIONS = {
+    "tacrolimus": {
+        "name": "Tacrolimus",
+        "category": "calcineurin_inhibitor",
+        "time_window_hours": 12,
+        "critical": True,
+        "target_levels": "5-15 ng/mL",
+        "half_life": "12 hours",
+        "interactions": ["grapefruit", "ketoconazole", "erythromycin"],
+    },
+    "cyclosporine": {
+        "name": "Cyclosporine",
+        "category": "calcineurin_inhibitor",
+        "time_window_hours": 12,
+        "critical": True,
+        "target_levels": "100-400 ng/mL",
+        "half_life": "8-27 hours",
+        "interactions": ["grapefruit", "St. John's Wort", "clarithromycin"],
+    },
+    "mycophenolate": {
+        "name": "Mycophenolate",
+        "category": "antiproliferative",
+        "time_window_hours": 12,
+        "critical": True,
+        "target_levels": "1-3.5 mg/L",
+        "half_life": "16-18 hours",
+        "interactions": ["antacids", "cholestyramine", "magnesium"],
+    },
+    "prednisone": {
+        "name": "Prednisone",
+        "category": "corticosteroid",
+        "time_window_hours": 24,
+        "critical": False,
+        "half_life": "3-4 hours",
+        "interactions": ["NSAIDs", "warfarin"],
+    },
+}
 
 
 def find_medication(name):
     """Medication database lookup"""
-    medications = {
-        "tacrolimus": {
-            "name": "Tacrolimus",
-            "category": "calcineurin_inhibitor",
-            "time_window_hours": 12,
-            "critical": True,
-            "target_levels": "5-15 ng/mL",
-            "half_life": "12 hours",
-            "interactions": ["grapefruit", "ketoconazole", "erythromycin"],
-        },
-        "cyclosporine": {
-            "name": "Cyclosporine",
-            "category": "calcineurin_inhibitor",
-            "time_window_hours": 12,
-            "critical": True,
-            "target_levels": "100-400 ng/mL",
-            "half_life": "8-27 hours",
-            "interactions": ["grapefruit", "St. John's Wort", "clarithromycin"],
-        },
-        "mycophenolate": {
-            "name": "Mycophenolate",
-            "category": "antiproliferative",
-            "time_window_hours": 12,
-            "critical": True,
-            "target_levels": "1-3.5 mg/L",
-            "half_life": "16-18 hours",
-            "interactions": ["antacids", "cholestyramine", "magnesium"],
-        },
-        "prednisone": {
-            "name": "Prednisone",
-            "category": "corticosteroid",
-            "time_window_hours": 24,
-            "critical": False,
-            "half_life": "3-4 hours",
-            "interactions": ["NSAIDs", "warfarin"],
-        },
-    }
-    return medications.get(name.lower())
+    return MEDICATIONS.get(name.lower())
+
+
+def clock_minutes(value):
+    """Minutes since midnight for a "H:MM AM"-style time (strptime format "%I:%M %p")"""
+    if isinstance(value, str):
+        clock, _, meridiem = value.partition(" ")
+        hour, _, minute = clock.partition(":")
+        meridiem = meridiem.upper()
+        # Hand-parse the canonical form; strptime is far slower and this runs per request
+        if (
+            meridiem in ("AM", "PM")
+            and len(hour) <= 2
+            and hour.isascii()
+            and hour.isdigit()
+            and 1 <= int(hour) <= 12
+            and len(minute) == 2
+            and minute.isascii()
+            and minute.isdigit()
+            and int(minute) < 60
+        ):
+            return int(hour) % 12 * 60 + int(minute) + (720 if meridiem == "PM" else 0)
+
+    # Anything else gets strptime's leniency and errors (ValueError/TypeError)
+    parsed = datetime.strptime(value, "%I:%M %p")
+    return parsed.hour * 60 + parsed.minute
 
 
 def get_patient_context(patient_id):
-    """Get patient context from Firestore"""
+    """Get patient context from Firestore (cached briefly per patient)"""
+    cached = patient_context_cache.get(patient_id)
+    if cached is not None:
+        # Callers update the context in place, so hand out a copy
+        return copy.deepcopy(cached)
+
     try:
-        doc_ref = db.collection("patients").document(patient_id)
+        doc_ref = firestore_client().collection("patients").document(patient_id)
         doc = doc_ref.get()
 
         if doc.exists:
             data = doc.to_dict()
-            return {
+            context = {
                 "transplant_type": data.get("transplant_type", "kidney"),
                 "months_post_transplant": data.get("months_post_transplant", 6),
                 "medications": data.get("medications", ["tacrolimus", "mycophenolate"]),
                 "adherence_rate": data.get("adherence_rate", 0.85),
             }
+            patient_context_cache[patient_id] = context
+            return copy.deepcopy(context)
     except Exception as e:
         logger.error(f"Firestore error: {e}")
 
@@ -120,25 +250,31 @@ def get_patient_context(patient_id):
     }
 
 
-def calculate_adherence(patient_id):
+def calculate_adherence(patient_id, now=None):
     """Calculate adherence from recent history in Firestore"""
     try:
         # Query recent dose history
-        history_ref = db.collection("patient_history")
-        week_ago = datetime.now() - timedelta(days=7)
+        history_ref = firestore_client().collection("patient_history")
+        week_ago = (now or datetime.now()) - timedelta(days=7)
 
+        # Only hours_late is read, so fetch just that field instead of whole documents
         docs = (
             history_ref.where("patient_id", "==", patient_id)
             .where("timestamp", ">=", week_ago)
+            .select(["hours_late"])
             .stream()
         )
 
-        doses = list(docs)
-        if doses:
-            on_time = sum(1 for d in doses if d.to_dict().get("hours_late", 0) < 2)
-            adherence_rate = on_time / len(doses) if doses else 0.8
-            missed_week = sum(1 for d in doses if d.to_dict().get("hours_late", 0) > 12)
-            return adherence_rate, missed_week
+        # Tally in one pass over the stream
+        total = on_time = missed_week = 0
+        for d in docs:
+            hours_late = d.to_dict().get("hours_late", 0)
+            total += 1
+            on_time += hours_late < 2
+            missed_week += hours_late > 12
+
+        if total:
+            return on_time / total, missed_week
     except Exception as e:
         logger.error(f"Adherence calculation error: {e}")
 
@@ -215,21 +351,49 @@ def normalize_rejection_symptoms(raw_symptoms: dict) -> dict:
     return normalized
 
 
-def record_interaction(patient_id, interaction_type, data):
-    """Record interaction to Firestore"""
-    try:
-        doc_ref = db.collection("patient_history").document()
-        doc_ref.set(
-            {
-                "patient_id": patient_id,
-                "timestamp": datetime.now(),
-                "interaction_type": interaction_type,
-                "data": data,
-                "ttl": datetime.now() + timedelta(days=90),
-            }
-        )
-    except Exception as e:
-        logger.error(f"Error recording interaction: {e}")
+def record_interaction(patient_id, interaction_type, data, now=None):
+    """Queue an interaction for the next batched write to Firestore"""
+    now = now or datetime.now()
+    pending_interactions.append(
+        {
+            "patient_id": patient_id,
+            "timestamp": now,
+            "interaction_type": interaction_type,
+            "data": data,
+            "ttl": now + timedelta(days=90),
+        }
+    )
+    if len(pending_interactions) >= INTERACTION_BATCH_SIZE:
+        flush_interactions()
+
+
+def flush_interactions():
+    """Write queued interactions to Firestore, up to 500 (the batch limit) per commit"""
+    while pending_interactions:
+        entries = []
+        while pending_interactions and len(entries) < INTERACTION_BATCH_SIZE:
+            entries.append(pending_interactions.popleft())
+        try:
+            client = firestore_client()
+            batch = client.batch()
+            history_ref = client.collection("patient_history")
+            for entry in entries:
+                batch.set(history_ref.document(), entry)
+            batch.commit()
+        except Exception as e:
+            logger.error(f"Error recording {len(entries)} interactions: {e}")
+
+
+def _flush_interactions_periodically():
+    while True:
+        time.sleep(INTERACTION_FLUSH_INTERVAL)
+        flush_interactions()
+
+
+threading.Thread(
+    target=_flush_interactions_periodically, name="interaction-flusher", daemon=True
+).start()
+atexit.register(flush_interactions)
 
 
 @app.route("/health", methods=["GET"])
@@ -295,15 +459,12 @@ def missed_dose():
         scheduled_time = data.get("scheduled_time", "")
         current_time = data.get("current_time", "")
         patient_id = data.get("patient_id", "demo_patient")
+        # One timestamp per request for the adherence window and the history record
+        now = datetime.now()
 
         # Calculate hours late
         try:
-            scheduled_dt = datetime.strptime(scheduled_time, "%I:%M %p")
-            current_dt = datetime.strptime(current_time, "%I:%M %p")
-            time_diff = current_dt - scheduled_dt
-            hours_late = time_diff.seconds / 3600
-            if time_diff.days < 0:
-                hours_late = (24 * 3600 - abs(time_diff.seconds)) / 3600
+            hours_late = abs(clock_minutes(current_time) - clock_minutes(scheduled_time)) / 60
         except (ValueError, TypeError):
             hours_late = 6  # Default
 
@@ -328,19 +489,15 @@ def missed_dose():
                             "Have your medication list ready",
                             "Do not skip doses without medical advice",
                         ],
-                        "infrastructure": {
-                            "platform": PLATFORM_NAME,
-                            "database": "Firestore",
-                            "ai_system": "Google ADK Multi-Agent System",
-                            "ai_model": "gemini-2.0-flash-exp",
-                            "agent_used": "MedicationAdvisor",
-                            "region": os.environ.get("REGION", "us-central1"),
-                        },
+                        "infrastructure": MEDICATION_ADVISOR_INFRASTRUCTURE,
                     }
                 ),
                 200,
             )
 
+        # Adherence history doesn't depend on patient context; fetch both at once
+        adherence_future = firestore_io.submit(calculate_adherence, patient_id, now)
+
         # Get patient context - use request data if provided, otherwise look up from Firestore
         request_context = data.get("patient_context", {})
 
@@ -354,7 +511,7 @@ def missed_dose():
             # Look up from Firestore
             patient_context = get_patient_context(patient_id)
 
-        adherence_rate, missed_this_week = calculate_adherence(patient_id)
+        adherence_rate, missed_this_week = adherence_future.result()
 
         patient_context.update(
             {
@@ -367,7 +524,7 @@ def missed_dose():
         )
 
         # Get AI-powered recommendation from ADK MedicationAdvisor agent
-        agent_response = medication_advisor.analyze_missed_dose(
+        agent_response = get_medication_advisor().analyze_missed_dose(
             medication=medication["name"],
             scheduled_time=scheduled_time,
             current_time=current_time,
@@ -393,6 +550,7 @@ def missed_dose():
                 "ai_system": "ADK MedicationAdvisor",
                 "risk_level": agent_response.get("risk_level", "medium"),
             },
+            now=now,
         )
 
         # Build response (maintain backward compatibility with existing API format)
@@ -407,14 +565,7 @@ def missed_dose():
                 "doses_missed_this_week": missed_this_week,
             },
             "medication_details": medication,
-            "infrastructure": {
-                "platform": PLATFORM_NAME,
-                "database": "Firestore",
-                "ai_system": "Google ADK Multi-Agent System",
-                "ai_model": "gemini-2.0-flash-exp",
-                "agent_used": "MedicationAdvisor",
-                "region": os.environ.get("REGION", "us-central1"),
-            },
+            "infrastructure": MEDICATION_ADVISOR_INFRASTRUCTURE,
         }
 
         return jsonify(response)
@@ -455,13 +606,14 @@ def analyze_rejection_risk():
 
         symptoms = data.get("symptoms", {})
         patient_id = data.get("patient_id", "demo_patient")
+        now = datetime.now()
         patient_context = data.get("patient_context")
 
         # Normalize symptom data to agent's expected format
         normalized_symptoms = normalize_rejection_symptoms(symptoms)
 
         # Get AI-powered rejection risk analysis from ADK RejectionRiskAgent
-        agent_response = rejection_risk.analyze_rejection_risk(
+        agent_response = get_rejection_risk().analyze_rejection_risk(
             symptoms=normalized_symptoms, patient_id=patient_id, patient_context=patient_context
         )
 
@@ -476,6 +628,7 @@ def analyze_rejection_risk():
                 "ai_system": "ADK RejectionRiskAnalyzer",
                 "risk_level": agent_response.get("risk_level", "medium"),
             },
+            now=now,
         )
 
         # Build response
@@ -488,14 +641,7 @@ def analyze_rejection_risk():
             ),
             "reasoning_steps": agent_response.get("reasoning_steps", []),
             "similar_cases": agent_response.get("similar_cases", []),
-            "infrastructure": {
-                "platform": PLATFORM_NAME,
-                "database": "Firestore",
-                "ai_system": "Google ADK Multi-Agent System",
-                "ai_model": "gemini-2.0-flash-exp",
-                "agent_used": "RejectionRiskAnalyzer",
-                "region": os.environ.get("REGION", "us-central1"),
-            },
+            "infrastructure": REJECTION_RISK_INFRASTRUCTURE,
         }
 
         return jsonify(response)
@@ -544,13 +690,8 @@ def check_drug_interactions():
         patient_id = data.get("patient_id")
         patient_context = data.get("patient_context")
 
-        # Initialize DrugInteractionChecker agent
-        from services.agents.drug_interaction_agent import DrugInteractionCheckerAgent
-
-        checker_agent = DrugInteractionCheckerAgent()
-
-        # Check interactions
-        result = checker_agent.check_interaction(
+        # Check interactions (shared agent keeps its interaction cache across requests)
+        result = get_drug_interaction_checker().check_interaction(
             medications=medications,
             foods=foods,
             supplements=supplements,
@@ -559,13 +700,7 @@ def check_drug_interactions():
         )
 
         # Add infrastructure metadata
-        result["infrastructure"] = {
-            "platform": "Google Cloud Run",
-            "region": "us-central1",
-            "ai_system": "Google ADK Multi-Agent System",
-            "ai_model": "gemini-2.0-flash-exp",
-            "agent_used": "DrugInteractionChecker",
-        }
+        result["infrastructure"] = DRUG_INTERACTION_INFRASTRUCTURE
 
         return jsonify(result), 200
 
@@ -1,23 +0,0 @@
-"""
-ADK Agents Package
-
-This package contains the four specialized agents for transplant medication adherence:
-- TransplantCoordinator: Routes requests to specialist agents
-- MedicationAdvisor: Analyzes missed medication doses
-- SymptomMonitor: Detects transplant rejection symptoms
-- DrugInteractionChecker: Validates medication safety
-"""
-
-from services.agents.coordinator_agent import TransplantCoordinatorAgent
-from services.agents.drug_interaction_agent import DrugInteractionCheckerAgent
-from services.agents.medication_advisor_agent import MedicationAdvisorAgent
-from services.agents.symptom_monitor_agent import SymptomMonitorAgent
-
-__version__ = "2.0.0"
-
-__all__ = [
-    "TransplantCoordinatorAgent",
-    "MedicationAdvisorAgent",
-    "SymptomMonitorAgent",
-    "DrugInteractionCheckerAgent",
-]
@@ -1,27 +0,0 @@
-"""
-Configuration package for ADK agents.
-"""
-
-from services.config.adk_config import (
-    COORDINATOR_CONFIG,
-    DEFAULT_GENERATION_CONFIG,
-    DRUG_INTERACTION_CONFIG,
-    GEMINI_API_KEY,
-    GEMINI_MODEL,
-    MEDICATION_ADVISOR_CONFIG,
-    SYMPTOM_MONITOR_CONFIG,
-    get_agent_config,
-    validate_config,
-)
-
-__all__ = [
-    "GEMINI_MODEL",
-    "GEMINI_API_KEY",
-    "DEFAULT_GENERATION_CONFIG",
-    "COORDINATOR_CONFIG",
-    "MEDICATION_ADVISOR_CONFIG",
-    "SYMPTOM_MONITOR_CONFIG",
-    "DRUG_INTERACTION_CONFIG",
-    "validate_config",
-    "get_agent_config",
-]
@@ -14,6 +14,7 @@ from typing import Any
 from google.adk.agents import Agent  # type: ignore[import-untyped]
 from google.genai import types  # type: ignore[import-untyped]
 
+from services.agents.response_parser import extract_response_text
 from services.config.adk_config import (
     COORDINATOR_CONFIG,
     DEFAULT_GENERATION_CONFIG,
@@ -261,7 +262,7 @@ Action: transfer_to_agent(agent_name='MedicationAdvisor') first, then SymptomMon
         Returns:
             Structured dict with response data
         """
-        response_text = str(response)
+        response_text = extract_response_text(response)
 
         # Extract metadata from ADK response
         # In real implementation, parse events to extract routing path
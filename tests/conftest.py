@@ -7,6 +7,8 @@ _GOOGLE_MODULES = [
     "google",
     "google.adk",
     "google.adk.agents",
+    "google.adk.agents.context_cache_config",
+    "google.adk.apps",
     "google.adk.runners",
     "google.adk.sessions",
     "google.adk.sessions.in_memory_session_service",
@@ -0,0 +1,13 @@
+"""Agent test fixtures."""
+
+import pytest
+
+from services.agents.base_adk_agent import BaseADKAgent
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_agents():
+    """Drop Agents shared across instances so each test sees its own patched Agent."""
+    BaseADKAgent._shared_agents.clear()
+    yield
+    BaseADKAgent._shared_agents.clear()
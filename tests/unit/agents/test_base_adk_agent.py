@@ -1,7 +1,10 @@
 """Unit tests for BaseADKAgent — covers session-creation branch and default parse."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
 
 class TestBaseADKAgentInvokeSessionCreation:
     @patch("services.agents.base_adk_agent.Runner")
@@ -37,6 +40,44 @@ class TestBaseADKAgentInvokeSessionCreation:
         assert result == "hello"
         mock_session_svc.create_session.assert_called_once()
 
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_invoke_agent_uses_new_session_per_call(self, mock_types, mock_agent, mock_runner_cls):
+        from services.agents.base_adk_agent import BaseADKAgent
+
+        mock_runner = MagicMock()
+        mock_runner_cls.return_value = mock_runner
+        mock_runner.app_name = "test"
+
+        mock_session_svc = AsyncMock()
+        mock_runner.session_service = mock_session_svc
+
+        async def _gen(**_):
+            event = MagicMock()
+            event.content.parts = [MagicMock(text="hello")]
+            yield event
+
+        mock_runner.run_async.side_effect = _gen
+
+        agent = BaseADKAgent(
+            agent_config={"name": "T", "model": "m", "description": "d", "instruction": "i"},
+            app_name="test",
+            session_id_prefix="pfx",
+            api_key="k",
+        )
+
+        agent._invoke_agent("first")
+        agent._invoke_agent("second")
+
+        run_sessions = [c.kwargs["session_id"] for c in mock_runner.run_async.call_args_list]
+        created = [c.kwargs["session_id"] for c in mock_session_svc.create_session.call_args_list]
+        deleted = [c.kwargs["session_id"] for c in mock_session_svc.delete_session.call_args_list]
+        assert len(set(run_sessions)) == 2
+        assert all(session_id.startswith("pfx_") for session_id in run_sessions)
+        assert created == run_sessions
+        assert deleted == run_sessions
+
 
 class TestBaseADKAgentDefaultParse:
     @patch("services.agents.base_adk_agent.Runner")
@@ -59,3 +100,166 @@ class TestBaseADKAgentDefaultParse:
 
         assert result["agent_name"] == "TestAgent"
         assert result["raw_response"] == "raw text"
+
+
+class TestRunSync:
+    def test_run_sync_reuses_one_background_loop(self):
+        from services.agents.base_adk_agent import run_sync
+
+        async def _current_loop():
+            return asyncio.get_running_loop()
+
+        assert run_sync(_current_loop()) is run_sync(_current_loop())
+
+    def test_run_sync_works_inside_running_loop(self):
+        from services.agents.base_adk_agent import run_sync
+
+        async def _value():
+            return 42
+
+        async def _caller():
+            return run_sync(_value())
+
+        assert asyncio.run(_caller()) == 42
+
+    def test_run_sync_propagates_exceptions(self):
+        from services.agents.base_adk_agent import run_sync
+
+        async def _boom():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            run_sync(_boom())
+
+
+class TestContextCache:
+    @patch.dict(
+        "services.agents.base_adk_agent.CONTEXT_CACHE_CONFIG",
+        {"enabled": True, "min_tokens": 1024, "ttl_seconds": 60, "cache_intervals": 5},
+    )
+    @patch("services.agents.base_adk_agent.ContextCacheConfig")
+    @patch("services.agents.base_adk_agent.App")
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_runner_uses_cached_app_when_enabled(
+        self, mock_types, mock_agent_cls, mock_runner_cls, mock_app_cls, mock_cache_cfg_cls
+    ):
+        from services.agents.base_adk_agent import BaseADKAgent
+
+        BaseADKAgent(
+            agent_config={"name": "T", "model": "m", "description": "d", "instruction": "i"},
+            app_name="test",
+            session_id_prefix="pfx",
+            context_cache=True,
+        )
+
+        mock_cache_cfg_cls.assert_called_once_with(
+            min_tokens=1024, ttl_seconds=60, cache_intervals=5
+        )
+        mock_app_cls.assert_called_once_with(
+            name="test",
+            root_agent=mock_agent_cls.return_value,
+            context_cache_config=mock_cache_cfg_cls.return_value,
+        )
+        assert mock_runner_cls.call_args.kwargs["app"] is mock_app_cls.return_value
+
+    @patch.dict("services.agents.base_adk_agent.CONTEXT_CACHE_CONFIG", {"enabled": False})
+    @patch("services.agents.base_adk_agent.App")
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_runner_uses_plain_agent_when_disabled(
+        self, mock_types, mock_agent_cls, mock_runner_cls, mock_app_cls
+    ):
+        from services.agents.base_adk_agent import BaseADKAgent
+
+        BaseADKAgent(
+            agent_config={"name": "T", "model": "m", "description": "d", "instruction": "i"},
+            app_name="test",
+            session_id_prefix="pfx",
+            context_cache=True,
+        )
+
+        mock_app_cls.assert_not_called()
+        assert mock_runner_cls.call_args.kwargs["agent"] is mock_agent_cls.return_value
+
+
+class TestSharedAgent:
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_instances_of_same_app_share_agent(self, mock_types, mock_agent, mock_runner_cls):
+        from services.agents.base_adk_agent import BaseADKAgent
+
+        config = {"name": "T", "model": "m", "description": "d", "instruction": "i"}
+
+        first = BaseADKAgent(agent_config=config, app_name="app", session_id_prefix="p")
+        second = BaseADKAgent(agent_config=config, app_name="app", session_id_prefix="p")
+        other = BaseADKAgent(agent_config=config, app_name="other", session_id_prefix="p")
+
+        assert first.agent is second.agent
+        assert mock_agent.call_count == 2
+        assert mock_types.GenerateContentConfig.call_count == 2
+        assert mock_runner_cls.call_count == 3
+        assert other.agent is mock_agent.return_value
+
+
+class TestGatherLimited:
+    def test_caps_in_flight_and_keeps_order(self):
+        from services.agents.base_adk_agent import gather_limited
+
+        in_flight = 0
+        peak = 0
+
+        async def _work(i):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return i
+
+        results = asyncio.run(gather_limited((_work(i) for i in range(10)), concurrency=3))
+
+        assert results == list(range(10))
+        assert peak == 3
+
+
+class TestRequestTimeout:
+    @patch("services.agents.retry.asyncio.sleep", new_callable=AsyncMock)
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_stalled_call_times_out_and_is_retried(
+        self, mock_types, mock_agent, mock_runner_cls, mock_backoff_sleep
+    ):
+        from services.agents.base_adk_agent import BaseADKAgent
+
+        mock_runner = MagicMock()
+        mock_runner_cls.return_value = mock_runner
+        mock_runner.session_service = AsyncMock()
+
+        async def _stalled(**_):
+            await asyncio.Event().wait()
+            yield MagicMock()
+
+        mock_runner.run_async.side_effect = _stalled
+
+        agent = BaseADKAgent(
+            agent_config={
+                "name": "T",
+                "model": "m",
+                "description": "d",
+                "instruction": "i",
+                "request_timeout": 0.01,
+            },
+            app_name="test",
+            session_id_prefix="pfx",
+        )
+
+        with pytest.raises(TimeoutError):
+            asyncio.run(agent._invoke_agent_async("prompt"))
+
+        assert mock_runner.run_async.call_count == 5
+        assert mock_backoff_sleep.await_count == 4
@@ -22,8 +22,8 @@ def _async_generator_mock(text: str):
 class TestTransplantCoordinatorAgent:
     """Test suite for TransplantCoordinatorAgent."""
 
-    @patch("services.agents.coordinator_agent.Agent")
-    @patch("services.agents.coordinator_agent.types")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
     def test_init_creates_agent_with_correct_config(
         self, mock_types: MagicMock, mock_agent_class: MagicMock
     ) -> None:
@@ -45,8 +45,8 @@ class TestTransplantCoordinatorAgent:
             generate_content_config=mock_generate_config,
         )
 
-    @patch("services.agents.coordinator_agent.Agent")
-    @patch("services.agents.coordinator_agent.types")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
     def test_init_stores_specialist_agents(
         self, mock_types: MagicMock, mock_agent_class: MagicMock
     ) -> None:
@@ -69,9 +69,9 @@ class TestTransplantCoordinatorAgent:
         assert agent.symptom_monitor == mock_symptom_monitor
         assert agent.drug_interaction_checker == mock_drug_checker
 
-    @patch("services.agents.coordinator_agent.Runner")
-    @patch("services.agents.coordinator_agent.Agent")
-    @patch("services.agents.coordinator_agent.types")
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
     def test_route_request_calls_agent(
         self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_runner_class: MagicMock
     ) -> None:
@@ -103,9 +103,9 @@ class TestTransplantCoordinatorAgent:
         # Should call runner.run_async at least once for routing analysis
         assert mock_runner_instance.run_async.call_count >= 1
 
-    @patch("services.agents.coordinator_agent.Runner")
-    @patch("services.agents.coordinator_agent.Agent")
-    @patch("services.agents.coordinator_agent.types")
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
     def test_route_request_returns_structured_response(
         self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_runner_class: MagicMock
     ) -> None:
@@ -141,9 +141,9 @@ class TestTransplantCoordinatorAgent:
         assert "confidence" in result
         assert 0.0 <= result["confidence"] <= 1.0
 
-    @patch("services.agents.coordinator_agent.Runner")
-    @patch("services.agents.coordinator_agent.Agent")
-    @patch("services.agents.coordinator_agent.types")
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
     def test_analyze_routing_identifies_medication_advisor(
         self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_runner_class: MagicMock
     ) -> None:
@@ -171,9 +171,9 @@ class TestTransplantCoordinatorAgent:
         assert "MedicationAdvisor" in routing["agents_needed"]
         assert routing["request_type"] == "missed_dose"
 
-    @patch("services.agents.coordinator_agent.Runner")
-    @patch("services.agents.coordinator_agent.Agent")
-    @patch("services.agents.coordinator_agent.types")
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
     def test_analyze_routing_identifies_symptom_monitor(
         self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_runner_class: MagicMock
     ) -> None:
@@ -200,9 +200,9 @@ class TestTransplantCoordinatorAgent:
         assert "agents_needed" in routing
         assert "SymptomMonitor" in routing["agents_needed"]
 
-    @patch("services.agents.coordinator_agent.Runner")
-    @patch("services.agents.coordinator_agent.Agent")
-    @patch("services.agents.coordinator_agent.types")
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
     def test_analyze_routing_identifies_drug_interaction_checker(
         self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_runner_class: MagicMock
     ) -> None:
@@ -229,9 +229,9 @@ class TestTransplantCoordinatorAgent:
         assert "agents_needed" in routing
         assert "DrugInteractionChecker" in routing["agents_needed"]
 
-    @patch("services.agents.coordinator_agent.Runner")
-    @patch("services.agents.coordinator_agent.Agent")
-    @patch("services.agents.coordinator_agent.types")
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
     def test_analyze_routing_identifies_multi_concern(
         self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_runner_class: MagicMock
     ) -> None:
@@ -259,8 +259,8 @@ class TestTransplantCoordinatorAgent:
         assert len(routing["agents_needed"]) > 1
         assert routing["request_type"] == "multi_concern"
 
-    @patch("services.agents.coordinator_agent.Agent")
-    @patch("services.agents.coordinator_agent.types")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
     def test_classify_request_type_missed_dose(
         self, mock_types: MagicMock, mock_agent_class: MagicMock
     ) -> None:
@@ -277,8 +277,8 @@ class TestTransplantCoordinatorAgent:
         # Assert
         assert request_type == "missed_dose"
 
-    @patch("services.agents.coordinator_agent.Agent")
-    @patch("services.agents.coordinator_agent.types")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
     def test_classify_request_type_symptom_check(
         self, mock_types: MagicMock, mock_agent_class: MagicMock
     ) -> None:
@@ -295,8 +295,8 @@ class TestTransplantCoordinatorAgent:
         # Assert
         assert request_type == "symptom_check"
 
-    @patch("services.agents.coordinator_agent.Agent")
-    @patch("services.agents.coordinator_agent.types")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
     def test_classify_request_type_interaction_check(
         self, mock_types: MagicMock, mock_agent_class: MagicMock
     ) -> None:
@@ -313,8 +313,8 @@ class TestTransplantCoordinatorAgent:
         # Assert
         assert request_type == "interaction_check"
 
-    @patch("services.agents.coordinator_agent.Agent")
-    @patch("services.agents.coordinator_agent.types")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
     def test_get_agent_capabilities_structure(
         self, mock_types: MagicMock, mock_agent_class: MagicMock
     ) -> None:
@@ -335,8 +335,8 @@ class TestTransplantCoordinatorAgent:
         assert "SymptomMonitor" in capabilities["specialists"]
         assert "DrugInteractionChecker" in capabilities["specialists"]
 
-    @patch("services.agents.coordinator_agent.Agent")
-    @patch("services.agents.coordinator_agent.types")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
     def test_get_agent_capabilities_medication_advisor(
         self, mock_types: MagicMock, mock_agent_class: MagicMock
     ) -> None:
@@ -356,8 +356,8 @@ class TestTransplantCoordinatorAgent:
         assert "handles" in med_advisor
         assert len(med_advisor["handles"]) > 0
 
-    @patch("services.agents.coordinator_agent.Agent")
-    @patch("services.agents.coordinator_agent.types")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
     def test_consult_specialists_with_medication_advisor(
         self, mock_types: MagicMock, mock_agent_class: MagicMock
     ) -> None:
@@ -17,9 +17,9 @@ def _async_generator_mock(text: str):
 
 
 class TestSessionCreationBranch:
-    @patch("services.agents.coordinator_agent.Runner")
-    @patch("services.agents.coordinator_agent.Agent")
-    @patch("services.agents.coordinator_agent.types")
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
     def test_analyze_routing_creates_session_when_none(
         self, mock_types, mock_agent_class, mock_runner_class
     ):
@@ -40,9 +40,37 @@ class TestSessionCreationBranch:
         mock_session_svc.create_session.assert_called()
 
 
+class TestRoutingPrompt:
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_routing_prompt_embeds_request_between_static_parts(
+        self, mock_types, mock_agent_class, mock_runner_class
+    ):
+        mock_runner = MagicMock()
+        mock_runner_class.return_value = mock_runner
+        mock_runner.app_name = "TransplantCoordinator"
+
+        mock_session_svc = AsyncMock()
+        mock_session_svc.get_session.return_value = MagicMock()
+        mock_runner.session_service = mock_session_svc
+        mock_runner.run_async.side_effect = lambda **_: _async_generator_mock("Routing")
+
+        from services.agents.coordinator_agent import TransplantCoordinatorAgent
+
+        agent = TransplantCoordinatorAgent(api_key="test")
+        agent._analyze_routing("I missed my dose")
+
+        prompt = mock_types.Part.call_args.kwargs["text"]
+        assert prompt.startswith("Analyze this patient request")
+        assert "Request: I missed my dose\n\nAvailable agents:" in prompt
+        assert 'Respond with JSON: {\n    "agents_needed"' in prompt
+        assert prompt.endswith("}")
+
+
 class TestClassifyGeneralInquiry:
-    @patch("services.agents.coordinator_agent.Agent")
-    @patch("services.agents.coordinator_agent.types")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
     def test_classify_empty_list(self, mock_types, mock_agent_class):
         from services.agents.coordinator_agent import TransplantCoordinatorAgent
 
@@ -51,9 +79,9 @@ class TestClassifyGeneralInquiry:
 
 
 class TestDefaultRouting:
-    @patch("services.agents.coordinator_agent.Runner")
-    @patch("services.agents.coordinator_agent.Agent")
-    @patch("services.agents.coordinator_agent.types")
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
     def test_defaults_to_medication_advisor_for_unclear_request(
         self, mock_types, mock_agent_class, mock_runner_class
     ):
@@ -73,10 +101,20 @@ class TestDefaultRouting:
 
         assert "MedicationAdvisor" in routing["agents_needed"]
 
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_keyword_routing_is_case_insensitive_and_ordered(self, mock_types, mock_agent_class):
+        from services.agents.coordinator_agent import TransplantCoordinatorAgent
+
+        agent = TransplantCoordinatorAgent(api_key="test")
+        routing = agent._build_routing_decision("Took IBUPROFEN for the Painful FEVER", "")
+
+        assert routing["agents_needed"] == ["SymptomMonitor", "DrugInteractionChecker"]
+
 
 class TestSequentialConsult:
-    @patch("services.agents.coordinator_agent.Agent")
-    @patch("services.agents.coordinator_agent.types")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
     def test_consult_all_specialists_sequential(self, mock_types, mock_agent_class):
         from services.agents.coordinator_agent import TransplantCoordinatorAgent
 
@@ -107,8 +145,8 @@ class TestSequentialConsult:
 
 
 class TestParallelConsult:
-    @patch("services.agents.coordinator_agent.Agent")
-    @patch("services.agents.coordinator_agent.types")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
     def test_consult_specialists_parallel(self, mock_types, mock_agent_class):
         from services.agents.coordinator_agent import TransplantCoordinatorAgent
 
@@ -129,8 +167,8 @@ class TestParallelConsult:
         assert "SymptomMonitor" in result
         assert "DrugInteractionChecker" in result
 
-    @patch("services.agents.coordinator_agent.Agent")
-    @patch("services.agents.coordinator_agent.types")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
     def test_async_medication_advisor(self, mock_types, mock_agent_class):
         from services.agents.coordinator_agent import TransplantCoordinatorAgent
 
@@ -138,8 +176,8 @@ class TestParallelConsult:
         result = asyncio.run(agent._consult_medication_advisor_async())
         assert result["agent"] == "MedicationAdvisor"
 
-    @patch("services.agents.coordinator_agent.Agent")
-    @patch("services.agents.coordinator_agent.types")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
     def test_async_symptom_monitor(self, mock_types, mock_agent_class):
         from services.agents.coordinator_agent import TransplantCoordinatorAgent
 
@@ -147,8 +185,8 @@ class TestParallelConsult:
         result = asyncio.run(agent._consult_symptom_monitor_async())
         assert result["agent"] == "SymptomMonitor"
 
-    @patch("services.agents.coordinator_agent.Agent")
-    @patch("services.agents.coordinator_agent.types")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
     def test_async_drug_interaction(self, mock_types, mock_agent_class):
         from services.agents.coordinator_agent import TransplantCoordinatorAgent
 
@@ -158,9 +196,9 @@ class TestParallelConsult:
 
 
 class TestSynthesizeResponse:
-    @patch("services.agents.coordinator_agent.Runner")
-    @patch("services.agents.coordinator_agent.Agent")
-    @patch("services.agents.coordinator_agent.types")
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
     def test_synthesize_with_specialist_responses(
         self, mock_types, mock_agent_class, mock_runner_class
     ):
@@ -192,3 +230,251 @@ class TestSynthesizeResponse:
         assert result["request_type"] == "missed_dose"
         assert result["confidence"] == 0.85
         mock_session_svc.create_session.assert_called()
+
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_synthesize_reuses_cached_response_for_identical_prompt(
+        self, mock_types, mock_agent_class, mock_runner_class
+    ):
+        mock_runner = MagicMock()
+        mock_runner_class.return_value = mock_runner
+        mock_runner.app_name = "TransplantCoordinator"
+
+        mock_session_svc = AsyncMock()
+        mock_session_svc.get_session.return_value = MagicMock()
+        mock_runner.session_service = mock_session_svc
+        mock_runner.run_async.side_effect = lambda **_: _async_generator_mock("Synthesized")
+
+        from services.agents.coordinator_agent import TransplantCoordinatorAgent
+
+        agent = TransplantCoordinatorAgent(api_key="test")
+        kwargs = {
+            "request": "I missed my dose",
+            "routing_decision": {"reasoning": "test reason", "request_type": "missed_dose"},
+            "specialist_responses": {
+                "MedicationAdvisor": {"response": "Take dose now", "status": "success"}
+            },
+        }
+
+        first = agent._synthesize_response(**kwargs)
+        second = agent._synthesize_response(**kwargs)
+
+        assert mock_runner.run_async.call_count == 1
+        assert first["recommendations"] == second["recommendations"] == "Synthesized"
+
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_synthesize_cache_ignores_free_form_routing_reasoning(
+        self, mock_types, mock_agent_class, mock_runner_class
+    ):
+        mock_runner = MagicMock()
+        mock_runner_class.return_value = mock_runner
+        mock_runner.app_name = "TransplantCoordinator"
+        mock_runner.session_service = AsyncMock()
+        mock_runner.run_async.side_effect = lambda **_: _async_generator_mock("Synthesized")
+
+        from services.agents.coordinator_agent import TransplantCoordinatorAgent
+
+        agent = TransplantCoordinatorAgent(api_key="test")
+        specialists = {"MedicationAdvisor": {"response": "Take dose now", "status": "success"}}
+
+        agent._synthesize_response(
+            request="I missed my dose",
+            routing_decision={
+                "agents_needed": ["MedicationAdvisor"],
+                "reasoning": "Patient reports a missed dose.",
+                "request_type": "missed_dose",
+            },
+            specialist_responses=specialists,
+        )
+        agent._synthesize_response(
+            request="  i missed my   dose",
+            routing_decision={
+                "agents_needed": ["MedicationAdvisor"],
+                "reasoning": "The request concerns medication timing.",
+                "request_type": "missed_dose",
+            },
+            specialist_responses=specialists,
+        )
+        agent._synthesize_response(
+            request="I missed my dose",
+            routing_decision={
+                "agents_needed": ["MedicationAdvisor"],
+                "reasoning": "Patient reports a missed dose.",
+                "request_type": "missed_dose",
+            },
+            specialist_responses={
+                "MedicationAdvisor": {"response": "Skip this dose", "status": "success"}
+            },
+        )
+
+        assert mock_runner.run_async.call_count == 2
+
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_synthesize_cache_disabled_with_zero_size(
+        self, mock_types, mock_agent_class, mock_runner_class
+    ):
+        mock_runner = MagicMock()
+        mock_runner_class.return_value = mock_runner
+        mock_runner.app_name = "TransplantCoordinator"
+
+        mock_session_svc = AsyncMock()
+        mock_session_svc.get_session.return_value = MagicMock()
+        mock_runner.session_service = mock_session_svc
+        mock_runner.run_async.side_effect = lambda **_: _async_generator_mock("Synthesized")
+
+        from services.agents.coordinator_agent import TransplantCoordinatorAgent
+
+        agent = TransplantCoordinatorAgent(api_key="test", synthesis_cache_size=0)
+        kwargs = {
+            "request": "I missed my dose",
+            "routing_decision": {"reasoning": "test reason", "request_type": "missed_dose"},
+            "specialist_responses": {},
+        }
+
+        agent._synthesize_response(**kwargs)
+        agent._synthesize_response(**kwargs)
+
+        assert mock_runner.run_async.call_count == 2
+
+
+def _async_multi_part_mock(texts: list[str]):
+    async def _generator():
+        for text in texts:
+            event = MagicMock()
+            event.content = MagicMock()
+            event.content.parts = [MagicMock()]
+            event.content.parts[0].text = text
+            yield event
+
+    return _generator()
+
+
+class TestRouteRequestStream:
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_stream_yields_synthesis_chunks_in_order(
+        self, mock_types, mock_agent_class, mock_runner_class
+    ):
+        mock_runner = MagicMock()
+        mock_runner_class.return_value = mock_runner
+        mock_runner.app_name = "TransplantCoordinator"
+
+        mock_session_svc = AsyncMock()
+        mock_session_svc.get_session.return_value = MagicMock()
+        mock_runner.session_service = mock_session_svc
+        mock_runner.run_async.side_effect = lambda **kwargs: (
+            _async_generator_mock("Routing")
+            if kwargs["session_id"].startswith("routing_analysis")
+            else _async_multi_part_mock(["Take ", "your dose ", "now."])
+        )
+
+        from services.agents.coordinator_agent import TransplantCoordinatorAgent
+
+        agent = TransplantCoordinatorAgent(api_key="test", medication_advisor=MagicMock())
+
+        async def _collect():
+            return [chunk async for chunk in agent.aroute_request_stream("I missed my dose")]
+
+        chunks = asyncio.run(_collect())
+
+        assert chunks == ["Take ", "your dose ", "now."]
+
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_stream_serves_repeat_request_from_cache(
+        self, mock_types, mock_agent_class, mock_runner_class
+    ):
+        mock_runner = MagicMock()
+        mock_runner_class.return_value = mock_runner
+        mock_runner.app_name = "TransplantCoordinator"
+
+        mock_session_svc = AsyncMock()
+        mock_session_svc.get_session.return_value = MagicMock()
+        mock_runner.session_service = mock_session_svc
+        mock_runner.run_async.side_effect = lambda **kwargs: (
+            _async_generator_mock("Routing")
+            if kwargs["session_id"].startswith("routing_analysis")
+            else _async_multi_part_mock(["Take ", "now."])
+        )
+
+        from services.agents.coordinator_agent import TransplantCoordinatorAgent
+
+        agent = TransplantCoordinatorAgent(api_key="test", medication_advisor=MagicMock())
+
+        async def _collect():
+            return [chunk async for chunk in agent.aroute_request_stream("I missed my dose")]
+
+        asyncio.run(_collect())
+        second = asyncio.run(_collect())
+
+        assert second == ["Take now."]
+        synthesis_calls = [
+            c
+            for c in mock_runner.run_async.call_args_list
+            if c.kwargs["session_id"].startswith("synthesis")
+        ]
+        assert len(synthesis_calls) == 1
+
+
+class TestRouteRequestSync:
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_route_request_works_inside_a_running_event_loop(
+        self, mock_types, mock_agent_class, mock_runner_class
+    ):
+        mock_runner = MagicMock()
+        mock_runner_class.return_value = mock_runner
+        mock_runner.app_name = "TransplantCoordinator"
+        mock_runner.session_service = AsyncMock()
+        mock_runner.run_async.side_effect = lambda **kwargs: (
+            _async_generator_mock("Routing")
+            if kwargs["session_id"].startswith("routing_analysis")
+            else _async_generator_mock("Take your dose now.")
+        )
+
+        from services.agents.coordinator_agent import TransplantCoordinatorAgent
+
+        agent = TransplantCoordinatorAgent(api_key="test", medication_advisor=MagicMock())
+
+        async def _from_async_caller():
+            return agent.route_request("I missed my dose")
+
+        result = asyncio.run(_from_async_caller())
+
+        assert result["coordinator_analysis"] == "Routing"
+        assert result["recommendations"] == "Take your dose now."
+        assert result["agents_consulted"] == ["MedicationAdvisor"]
+
+
+class TestRoutingFallback:
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_routing_error_falls_back_to_keywords_and_logs(
+        self, mock_types, mock_agent_class, mock_runner_class, caplog
+    ):
+        mock_runner = MagicMock()
+        mock_runner_class.return_value = mock_runner
+        mock_runner.app_name = "TransplantCoordinator"
+
+        mock_session_svc = AsyncMock()
+        mock_session_svc.create_session.side_effect = RuntimeError("quota exceeded")
+        mock_runner.session_service = mock_session_svc
+
+        from services.agents.coordinator_agent import TransplantCoordinatorAgent
+
+        agent = TransplantCoordinatorAgent(api_key="test")
+        with caplog.at_level("WARNING", logger="services.agents.coordinator_agent"):
+            routing = agent._analyze_routing("I have a fever")
+
+        assert routing["agents_needed"] == ["SymptomMonitor"]
+        assert "unavailable" in routing["reasoning"]
+        assert "Routing analysis error: quota exceeded" in caplog.text
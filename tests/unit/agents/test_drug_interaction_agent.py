@@ -2,7 +2,10 @@
 
 from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
+import pytest
+
 from services.agents.drug_interaction_agent import DrugInteractionCheckerAgent
+from services.config.adk_config import DEFAULT_GENERATION_CONFIG
 
 
 def _async_generator_mock(text: str):
@@ -46,6 +49,31 @@ class TestDrugInteractionCheckerAgent:
             generate_content_config=mock_generate_config,
         )
 
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_init_requests_json_output_without_response_schema(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock
+    ) -> None:
+        """Test that the single and batch agents ask for JSON without a response_schema.
+
+        ADK's LlmAgent rejects generate_content_config.response_schema at construction.
+        """
+        # Act
+        agent = DrugInteractionCheckerAgent(api_key="test_key")
+        agent._get_batch_agent()
+
+        # Assert
+        single, batch = mock_types.GenerateContentConfig.call_args_list
+        for config_call in (single, batch):
+            assert config_call.kwargs["response_mime_type"] == "application/json"
+            assert "response_schema" not in config_call.kwargs
+        assert single.kwargs["max_output_tokens"] == DEFAULT_GENERATION_CONFIG["max_output_tokens"]
+        for agent_call in mock_agent_class.call_args_list:
+            assert (
+                agent_call.kwargs["generate_content_config"]
+                is mock_types.GenerateContentConfig.return_value
+            )
+
     @patch("services.agents.base_adk_agent.Runner")
     @patch("services.agents.base_adk_agent.Agent")
     @patch("services.agents.base_adk_agent.types")
@@ -287,7 +315,8 @@ class TestDrugInteractionCheckerAgent:
         assert "vitamin D" in prompt
         assert "P123" in prompt
         assert "kidney_function" in prompt
-        assert "JSON response" in prompt
+        # Output format is enforced by the response schema, not the prompt
+        assert "JSON response" not in prompt
 
     @patch("services.agents.base_adk_agent.Runner")
     @patch("services.agents.base_adk_agent.Agent")
@@ -315,7 +344,296 @@ class TestDrugInteractionCheckerAgent:
         # Act
         result = agent.check_interaction(medications=["tacrolimus"])
 
-        # Assert
-        mock_runner_instance.run_async.assert_called_once()
+        # Assert: a lone medication has nothing to interact with, so no model call
+        mock_runner_instance.run_async.assert_not_called()
         assert result["has_interaction"] is False
-        assert result["severity"] in ["none", "unknown"]
+        assert result["severity"] == "none"
+
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_check_interaction_without_medications_skips_model(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_runner_class: MagicMock
+    ) -> None:
+        """Test that an empty medication list returns immediately."""
+        agent = DrugInteractionCheckerAgent(api_key="test_key")
+
+        result = agent.check_interaction(medications=[], foods=["grapefruit"])
+
+        mock_runner_class.return_value.run_async.assert_not_called()
+        assert result["has_interaction"] is False
+        assert result["interactions"] == []
+        assert result["clinical_effect"] == "No medications provided"
+
+    def test_known_interactions_reference_is_shared_and_read_only(self) -> None:
+        """Test that the reference is one module-level object callers cannot mutate."""
+        # Arrange
+        with (
+            patch("services.agents.base_adk_agent.Agent"),
+            patch("services.agents.base_adk_agent.types"),
+        ):
+            agent = DrugInteractionCheckerAgent(api_key="test_key")
+
+        # Act
+        reference = agent.get_known_interactions_reference()
+
+        # Assert
+        assert reference is agent.get_known_interactions_reference()
+        with pytest.raises(TypeError):
+            reference["severe"] = {}  # type: ignore[index]
+
+
+class TestCheckInteractionsBatch:
+    """Test suite for DrugInteractionCheckerAgent.check_interactions_batch."""
+
+    @staticmethod
+    def _mock_runner(mock_runner_class: MagicMock, *texts: str) -> MagicMock:
+        """Configure Runner so successive run_async calls yield the given texts."""
+        mock_runner_instance = MagicMock()
+        mock_runner_class.return_value = mock_runner_instance
+        mock_session_service = AsyncMock()
+        mock_session_service.get_session.return_value = MagicMock()
+        mock_runner_instance.session_service = mock_session_service
+        responses = iter(texts)
+        mock_runner_instance.run_async.side_effect = lambda **_: _async_generator_mock(
+            next(responses)
+        )
+        return mock_runner_instance
+
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_batch_uses_single_call(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_runner_class: MagicMock
+    ) -> None:
+        """Test that all scenarios are answered by one model call, in order."""
+        # Arrange
+        runner = self._mock_runner(
+            mock_runner_class,
+            '```json\n[{"has_interaction": true, "severity": "severe", "recommendation": "Avoid",'
+            ' "confidence": 0.9}, {"has_interaction": false, "severity": "none",'
+            ' "recommendation": "OK", "confidence": 0.8}]\n```',
+        )
+        agent = DrugInteractionCheckerAgent(api_key="test_key")
+
+        # Act
+        results = agent.check_interactions_batch(
+            [
+                {"medications": ["tacrolimus"], "supplements": ["echinacea"]},
+                {"medications": ["prednisone", "metformin"]},
+            ]
+        )
+
+        # Assert
+        runner.run_async.assert_called_once()
+        prompt = mock_types.Part.call_args.kwargs["text"]
+        assert "Scenario 1:" in prompt
+        assert "Scenario 2:" in prompt
+        assert [r["severity"] for r in results] == ["severe", "none"]
+        assert results[0]["has_interaction"] is True
+
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_batch_falls_back_to_single_checks_on_misaligned_output(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_runner_class: MagicMock
+    ) -> None:
+        """Test that a result count mismatch re-checks each scenario individually."""
+        # Arrange
+        runner = self._mock_runner(
+            mock_runner_class,
+            '[{"has_interaction": false, "severity": "none"}]',
+            '{"has_interaction": true, "severity": "moderate"}',
+            '{"has_interaction": false, "severity": "mild"}',
+        )
+        agent = DrugInteractionCheckerAgent(api_key="test_key")
+
+        # Act
+        results = agent.check_interactions_batch(
+            [
+                {"medications": ["tacrolimus", "prednisone"]},
+                {"medications": ["mycophenolate", "prednisone"]},
+            ]
+        )
+
+        # Assert
+        assert runner.run_async.call_count == 3
+        assert [r["severity"] for r in results] == ["moderate", "mild"]
+
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_batch_sends_only_scenarios_needing_the_model(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_runner_class: MagicMock
+    ) -> None:
+        """Test that trivial, reference-table and cached scenarios skip the batch prompt."""
+        # Arrange
+        runner = self._mock_runner(
+            mock_runner_class,
+            '{"has_interaction": true, "severity": "mild", "recommendation": "Monitor"}',
+            '[{"has_interaction": true, "severity": "moderate", "recommendation": "Space"},'
+            ' {"has_interaction": false, "severity": "none", "recommendation": "OK"}]',
+        )
+        agent = DrugInteractionCheckerAgent(api_key="test_key")
+        cached = agent.check_interaction(["tacrolimus", "amlodipine"])
+        known = agent.check_interaction(["tacrolimus"], foods=["grapefruit"])
+
+        # Act
+        results = agent.check_interactions_batch(
+            [
+                {"medications": ["tacrolimus"], "foods": ["grapefruit"]},
+                {"medications": ["sirolimus", "diltiazem"]},
+                {"medications": ["prednisone"]},
+                {"medications": ["Amlodipine", "tacrolimus"]},
+                {"medications": ["prednisone", "metformin"]},
+            ]
+        )
+
+        # Assert
+        assert runner.run_async.call_count == 2
+        prompt = mock_types.Part.call_args.kwargs["text"]
+        assert "Scenario 2:" in prompt
+        assert "Scenario 3:" not in prompt
+        assert "sirolimus" in prompt
+        assert "metformin" in prompt
+        assert results[0] == known
+        assert [r["severity"] for r in results] == ["severe", "moderate", "none", "mild", "none"]
+        assert results[3] == cached
+        assert agent.check_interaction(["diltiazem", "sirolimus"])["severity"] == "moderate"
+        assert runner.run_async.call_count == 2
+
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_batch_empty_scenarios(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock
+    ) -> None:
+        """Test that an empty batch makes no model call."""
+        agent = DrugInteractionCheckerAgent(api_key="test_key")
+
+        assert agent.check_interactions_batch([]) == []
+
+
+class TestKnownInteractionLookup:
+    """Test suite for answering covered pairs from the reference table."""
+
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_known_pair_skips_model(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_runner_class: MagicMock
+    ) -> None:
+        """Test that a pair in the reference table is answered without a model call."""
+        agent = DrugInteractionCheckerAgent(api_key="test_key")
+
+        result = agent.check_interaction(medications=["Tacrolimus"], foods=["grapefruit juice"])
+
+        mock_runner_class.return_value.run_async.assert_not_called()
+        assert result["has_interaction"] is True
+        assert result["severity"] == "severe"
+        assert result["mechanism"] == "CYP3A4 inhibition"
+        assert result["interactions"][0]["substances"] == ["Tacrolimus", "Grapefruit"]
+
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_alias_and_highest_severity(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock
+    ) -> None:
+        """Test example names resolve to their class and the top severity wins."""
+        agent = DrugInteractionCheckerAgent(api_key="test_key")
+
+        result = agent._lookup_known_interactions(["tacrolimus", "ibuprofen"], None, None, None)
+
+        assert result is not None
+        assert result["severity"] == "moderate"
+        assert result["recommendation"] == "Use acetaminophen instead"
+
+    @pytest.mark.parametrize(
+        ("medications", "patient_context"),
+        [
+            (["tacrolimus"], None),
+            (["tacrolimus", "prednisone"], None),
+            (["tacrolimus", "ketoconazole", "prednisone"], None),
+            (["tacrolimus", "ketoconazole"], {"kidney_function": "reduced"}),
+        ],
+    )
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_uncovered_queries_need_model(
+        self,
+        mock_types: MagicMock,
+        mock_agent_class: MagicMock,
+        medications: list[str],
+        patient_context: dict[str, str] | None,
+    ) -> None:
+        """Test that single substances, unknown pairs and patient context go to the model."""
+        agent = DrugInteractionCheckerAgent(api_key="test_key")
+
+        result = agent._lookup_known_interactions(medications, None, None, patient_context)
+
+        assert result is None
+
+
+class TestInteractionAnswerCache:
+    """Test suite for the per-instance interaction answer cache."""
+
+    @staticmethod
+    def _mock_runner(mock_runner_class: MagicMock, text: str) -> MagicMock:
+        mock_runner_instance = MagicMock()
+        mock_runner_class.return_value = mock_runner_instance
+        mock_session_service = AsyncMock()
+        mock_session_service.get_session.return_value = MagicMock()
+        mock_runner_instance.session_service = mock_session_service
+        mock_runner_instance.run_async.side_effect = lambda **_: _async_generator_mock(text)
+        return mock_runner_instance
+
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_repeat_query_is_served_from_cache(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_runner_class: MagicMock
+    ) -> None:
+        """Test that an equivalent query (order/case differ) skips the model call."""
+        runner = self._mock_runner(
+            mock_runner_class, '{"has_interaction": false, "severity": "none", "interactions": []}'
+        )
+        agent = DrugInteractionCheckerAgent(api_key="test_key")
+
+        first = agent.check_interaction(medications=["tacrolimus", "prednisone"])
+        first["interactions"].append("mutated by caller")
+        second = agent.check_interaction(medications=["Prednisone", "tacrolimus"])
+
+        runner.run_async.assert_called_once()
+        assert second["severity"] == "none"
+        assert second["interactions"] == []
+
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_unparsed_answers_are_not_cached(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_runner_class: MagicMock
+    ) -> None:
+        """Test that fallback results from unparseable output are retried next time."""
+        runner = self._mock_runner(mock_runner_class, "not json")
+        agent = DrugInteractionCheckerAgent(api_key="test_key")
+
+        agent.check_interaction(medications=["tacrolimus", "prednisone"])
+        agent.check_interaction(medications=["tacrolimus", "prednisone"])
+
+        assert runner.run_async.call_count == 2
+
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_zero_cache_size_disables_cache(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_runner_class: MagicMock
+    ) -> None:
+        """Test that cache_size=0 always calls the model."""
+        runner = self._mock_runner(
+            mock_runner_class, '{"has_interaction": false, "severity": "none"}'
+        )
+        agent = DrugInteractionCheckerAgent(api_key="test_key", cache_size=0)
+
+        agent.check_interaction(medications=["tacrolimus", "prednisone"])
+        agent.check_interaction(medications=["tacrolimus", "prednisone"])
+
+        assert runner.run_async.call_count == 2
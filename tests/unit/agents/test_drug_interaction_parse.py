@@ -29,6 +29,24 @@ class TestDrugInteractionParseWithJson:
         assert result["mechanism"] == "CYP3A4 inhibition"
         assert result["confidence"] == 0.95
 
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_parse_failure_returns_fresh_fallback(self, mock_types, mock_agent_class):
+        from services.agents.drug_interaction_agent import DrugInteractionCheckerAgent
+
+        agent = DrugInteractionCheckerAgent(api_key="test_key")
+
+        first = agent._parse_agent_response("no json here")
+        first["interactions"].append("mutated")
+        second = agent._parse_agent_response("still no json")
+
+        assert second["severity"] == "unknown"
+        assert second["interactions"] == []
+        assert second["mechanism"] == "still no json"
+        assert second["raw_response"] == "still no json"
+        assert second["clinical_effect"] == "Unable to parse AI response"
+        assert second["confidence"] == 0.50
+
     @patch("services.agents.base_adk_agent.Agent")
     @patch("services.agents.base_adk_agent.types")
     def test_parse_response_severity_from_interactions(self, mock_types, mock_agent_class):
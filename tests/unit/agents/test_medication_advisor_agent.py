@@ -1,7 +1,10 @@
 """Unit tests for MedicationAdvisorAgent."""
 
+import asyncio
 from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
+import pytest
+
 from services.agents.medication_advisor_agent import MedicationAdvisorAgent
 
 
@@ -295,3 +298,273 @@ class TestMedicationAdvisorAgent:
         assert isinstance(result["next_steps"], list)
         assert "agent_name" in result
         assert "raw_response" in result
+
+    def test_get_therapeutic_window_is_shared_and_read_only(self) -> None:
+        """Test that windows are module-level constants that callers cannot mutate."""
+        # Arrange
+        with (
+            patch("services.agents.base_adk_agent.Agent"),
+            patch("services.agents.base_adk_agent.types"),
+        ):
+            agent = MedicationAdvisorAgent(api_key="test_key")
+
+        # Act
+        window = agent.get_therapeutic_window("tacrolimus")
+
+        # Assert
+        assert window is agent.get_therapeutic_window("Tacrolimus")
+        with pytest.raises(TypeError):
+            window["window_hours"] = 1  # type: ignore[index]
+
+    @patch("services.agents.medication_advisor_agent.get_srtr_data")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_build_missed_dose_prompt_reuses_formatted_srtr_context(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_get_srtr: MagicMock
+    ) -> None:
+        """Test that SRTR context is formatted once per organ/age/whole-month key."""
+        # Arrange
+        mock_srtr = MagicMock()
+        mock_srtr.format_for_prompt.return_value = "Population stats"
+        mock_get_srtr.return_value = mock_srtr
+
+        agent = MedicationAdvisorAgent(api_key="test_key")
+
+        # Act
+        prompts = [
+            agent._build_missed_dose_prompt(
+                medication="tacrolimus",
+                scheduled_time="8:00 AM",
+                current_time="2:00 PM",
+                patient_id=None,
+                patient_context={"organ_type": "liver", "months_post_transplant": months},
+            )
+            for months in (6, 6.4)
+        ]
+
+        # Assert
+        mock_srtr.format_for_prompt.assert_called_once_with("50-64", 6)
+        assert all("Population stats" in prompt for prompt in prompts)
+
+    @patch("services.agents.medication_advisor_agent.get_srtr_data")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_build_missed_dose_prompt_sends_full_srtr_context_every_time(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_get_srtr: MagicMock
+    ) -> None:
+        """Test that every prompt carries its own SRTR block, even when repeated."""
+        # Arrange
+        mock_srtr = MagicMock()
+        mock_srtr.format_for_prompt.side_effect = lambda age_group, _months: f"Stats {age_group}"
+        mock_get_srtr.return_value = mock_srtr
+
+        agent = MedicationAdvisorAgent(api_key="test_key")
+
+        # Act
+        prompts = [
+            agent._build_missed_dose_prompt(
+                medication="tacrolimus",
+                scheduled_time="8:00 AM",
+                current_time="2:00 PM",
+                patient_id=None,
+                patient_context={"organ_type": "heart", "age_group": age_group},
+            )
+            for age_group in ("35-49", "35-49", "65+")
+        ]
+
+        # Assert
+        assert prompts[0] == prompts[1]
+        assert "Stats 35-49" in prompts[1]
+        assert "srtr_data_source" in prompts[1]
+        assert "Stats 65+" in prompts[2]
+
+    @patch("services.agents.medication_advisor_agent.get_srtr_data")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_build_missed_dose_prompt_null_organ_defaults_to_kidney(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_get_srtr: MagicMock
+    ) -> None:
+        """Test that null organ_type/transplant_type fall back to kidney instead of raising."""
+        # Arrange
+        mock_get_srtr.return_value.has_data = False
+        agent = MedicationAdvisorAgent(api_key="test_key")
+
+        # Act
+        prompt = agent._build_missed_dose_prompt(
+            medication="tacrolimus",
+            scheduled_time="8:00 AM",
+            current_time="2:00 PM",
+            patient_id=None,
+            patient_context={"organ_type": None, "transplant_type": None},
+        )
+
+        # Assert
+        mock_get_srtr.assert_called_once_with("kidney")
+        assert "SRTR data unavailable" in prompt
+
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_analyze_missed_dose_async_runs_on_callers_loop(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_runner_class: MagicMock
+    ) -> None:
+        """Test that the async variant awaits the runner without the background loop."""
+        # Arrange
+        mock_runner_instance = MagicMock()
+        mock_runner_class.return_value = mock_runner_instance
+        mock_session_service = AsyncMock()
+        mock_session_service.get_session.return_value = MagicMock()
+        mock_runner_instance.session_service = mock_session_service
+        mock_runner_instance.run_async.side_effect = lambda **_: _async_generator_mock(
+            '{"recommendation": "take_now", "risk_level": "low", "confidence": 0.9}'
+        )
+
+        agent = MedicationAdvisorAgent(api_key="test_key")
+
+        # Act
+        with patch("services.agents.base_adk_agent.run_sync") as mock_run_sync:
+            result = asyncio.run(
+                agent.analyze_missed_dose_async(
+                    medication="tacrolimus", scheduled_time="8:00 AM", current_time="9:00 AM"
+                )
+            )
+
+        # Assert
+        mock_run_sync.assert_not_called()
+        mock_runner_instance.run_async.assert_called_once()
+        assert result["recommendation"] == "take_now"
+
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_analyze_missed_dose_batch_uses_one_session_per_request(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_runner_class: MagicMock
+    ) -> None:
+        """Test that batch analyses run concurrently in separate sessions, in order."""
+        # Arrange
+        mock_runner_instance = MagicMock()
+        mock_runner_class.return_value = mock_runner_instance
+        mock_session_service = AsyncMock()
+        mock_session_service.get_session.return_value = MagicMock()
+        mock_runner_instance.session_service = mock_session_service
+        mock_runner_instance.run_async.side_effect = lambda **kwargs: _async_generator_mock(
+            f'{{"recommendation": "{kwargs["session_id"]}"}}'
+        )
+
+        agent = MedicationAdvisorAgent(api_key="test_key")
+        requests = [
+            {"medication": med, "scheduled_time": "8:00 AM", "current_time": "9:00 AM"}
+            for med in ("tacrolimus", "prednisone")
+        ]
+
+        # Act
+        results = asyncio.run(agent.analyze_missed_dose_batch(requests))
+
+        # Assert
+        session_ids = [r["recommendation"] for r in results]
+        assert session_ids == [
+            c.kwargs["session_id"] for c in mock_runner_instance.run_async.call_args_list
+        ]
+        assert len(set(session_ids)) == 2
+        assert all(session_id.startswith("medication_analysis_") for session_id in session_ids)
+
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_analyze_missed_dose_stream_yields_chunks_in_order(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_runner_class: MagicMock
+    ) -> None:
+        """Test that the stream variant yields each response part as it arrives."""
+
+        # Arrange
+        async def _multi_part_events(**_):
+            for text in ('{"recommendation": ', '"take_now"', "}"):
+                event = MagicMock()
+                event.content.parts = [MagicMock(text=text)]
+                yield event
+
+        mock_runner_instance = MagicMock()
+        mock_runner_class.return_value = mock_runner_instance
+        mock_session_service = AsyncMock()
+        mock_session_service.get_session.return_value = MagicMock()
+        mock_runner_instance.session_service = mock_session_service
+        mock_runner_instance.run_async.side_effect = _multi_part_events
+
+        agent = MedicationAdvisorAgent(api_key="test_key")
+
+        async def _collect():
+            return [
+                chunk
+                async for chunk in agent.analyze_missed_dose_stream(
+                    medication="tacrolimus", scheduled_time="8:00 AM", current_time="9:00 AM"
+                )
+            ]
+
+        # Act
+        chunks = asyncio.run(_collect())
+
+        # Assert
+        assert chunks == ['{"recommendation": ', '"take_now"', "}"]
+        assert agent._parse_agent_response("".join(chunks))["recommendation"] == "take_now"
+
+
+class TestMissedDoseResponseCache:
+    """Test suite for MedicationAdvisorAgent's parsed-result cache."""
+
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_identical_scenario_skips_model_call(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_runner_class: MagicMock
+    ) -> None:
+        """Test that repeats are served from cache as copies, and cache_bust re-asks."""
+        # Arrange
+        mock_runner_instance = MagicMock()
+        mock_runner_class.return_value = mock_runner_instance
+        mock_runner_instance.session_service = AsyncMock()
+        mock_runner_instance.run_async.side_effect = lambda **_: _async_generator_mock(
+            '{"recommendation": "take_now", "next_steps": ["set alarm"]}'
+        )
+        agent = MedicationAdvisorAgent(api_key="test_key")
+        scenario = {
+            "medication": "tacrolimus",
+            "scheduled_time": "8:00 AM",
+            "current_time": "10:00 AM",
+            "patient_id": "patient_1",
+        }
+
+        # Act
+        first = agent.analyze_missed_dose(**scenario)
+        first["next_steps"].append("caller edit")
+        second = agent.analyze_missed_dose(**scenario)
+        agent.analyze_missed_dose(**scenario, cache_bust=True)
+
+        # Assert
+        assert mock_runner_instance.run_async.call_count == 2
+        assert second["recommendation"] == "take_now"
+        assert second["next_steps"] == ["set alarm"]
+
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_unparseable_response_is_not_cached(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_runner_class: MagicMock
+    ) -> None:
+        """Test that a parse failure is retried on the next identical request."""
+        # Arrange
+        mock_runner_instance = MagicMock()
+        mock_runner_class.return_value = mock_runner_instance
+        mock_runner_instance.session_service = AsyncMock()
+        mock_runner_instance.run_async.side_effect = lambda **_: _async_generator_mock(
+            "no json here"
+        )
+        agent = MedicationAdvisorAgent(api_key="test_key")
+
+        # Act
+        for _ in range(2):
+            agent.analyze_missed_dose(
+                medication="tacrolimus", scheduled_time="8:00 AM", current_time="9:00 AM"
+            )
+
+        # Assert
+        assert mock_runner_instance.run_async.call_count == 2
@@ -0,0 +1,17 @@
+"""Unit tests for the services.agents package re-exports."""
+
+import pytest
+
+import services.agents
+
+
+class TestLazyExports:
+    def test_agent_classes_resolve_to_their_modules(self):
+        from services.agents.medication_advisor_agent import MedicationAdvisorAgent
+
+        assert services.agents.MedicationAdvisorAgent is MedicationAdvisorAgent
+        assert set(services.agents.__all__) <= set(dir(services.agents))
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError):
+            services.agents.NotAnAgent  # noqa: B018
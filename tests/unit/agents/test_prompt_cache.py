@@ -0,0 +1,69 @@
+"""Unit tests for the prompt-keyed LRU response cache."""
+
+from unittest.mock import patch
+
+from services.agents.prompt_cache import LRUCache, prompt_key
+
+
+class TestPromptKey:
+    def test_key_is_stable_for_same_prompt(self):
+        assert prompt_key("hello") == prompt_key("hello")
+
+    def test_key_differs_for_different_prompts(self):
+        assert prompt_key("hello") != prompt_key("hello!")
+
+    def test_key_is_32_hex_chars(self):
+        key = prompt_key("anything")
+        assert len(key) == 32
+        int(key, 16)
+
+
+class TestLRUCache:
+    def test_get_missing_returns_default(self):
+        cache = LRUCache(maxsize=2)
+        assert cache.get("missing") is None
+        assert cache.get("missing", "fallback") == "fallback"
+
+    def test_set_and_get(self):
+        cache = LRUCache(maxsize=2)
+        cache["a"] = 1
+        assert cache.get("a") == 1
+        assert "a" in cache
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache.get("a")  # "b" is now least recently used
+        cache["c"] = 3
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_zero_maxsize_disables_cache(self):
+        cache = LRUCache(maxsize=0)
+        cache["a"] = 1
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_clear(self):
+        cache = LRUCache(maxsize=2)
+        cache["a"] = 1
+        cache.clear()
+        assert len(cache) == 0
+
+    @patch("services.agents.prompt_cache.time.monotonic")
+    def test_entries_expire_after_ttl(self, mock_monotonic):
+        mock_monotonic.return_value = 0.0
+        cache = LRUCache(maxsize=2, ttl=10)
+        cache["a"] = 1
+
+        mock_monotonic.return_value = 9.9
+        assert cache.get("a") == 1
+
+        mock_monotonic.return_value = 10.0
+        assert cache.get("a") is None
+        assert "a" not in cache
+        assert len(cache) == 0
@@ -0,0 +1,42 @@
+"""Unit tests for the client-side token bucket rate limiter."""
+
+import asyncio
+from unittest.mock import patch
+
+from services.agents.rate_limiter import TokenBucket, get_rate_limiter
+
+
+class TestTokenBucket:
+    def test_zero_rate_never_waits(self):
+        bucket = TokenBucket(0)
+        assert [bucket.reserve() for _ in range(5)] == [0.0] * 5
+
+    @patch("services.agents.rate_limiter.time.monotonic", return_value=100.0)
+    def test_burst_then_spaced_by_refill_rate(self, mock_monotonic):
+        bucket = TokenBucket(60, capacity=2)
+
+        delays = [bucket.reserve() for _ in range(4)]
+
+        assert delays == [0.0, 0.0, 1.0, 2.0]
+
+    @patch("services.agents.rate_limiter.time.monotonic")
+    def test_tokens_refill_over_time(self, mock_monotonic):
+        mock_monotonic.return_value = 0.0
+        bucket = TokenBucket(120, capacity=1)
+        assert bucket.reserve() == 0.0
+
+        mock_monotonic.return_value = 0.5
+        assert bucket.reserve() == 0.0
+
+    @patch("services.agents.rate_limiter.asyncio.sleep")
+    def test_acquire_sleeps_for_reserved_delay(self, mock_sleep):
+        bucket = TokenBucket(60, capacity=1)
+        with patch.object(bucket, "reserve", return_value=1.5):
+            asyncio.run(bucket.acquire())
+        mock_sleep.assert_awaited_once_with(1.5)
+
+
+class TestGetRateLimiter:
+    def test_shared_per_model(self):
+        assert get_rate_limiter("model-a") is get_rate_limiter("model-a")
+        assert get_rate_limiter("model-a") is not get_rate_limiter("model-b")
@@ -2,7 +2,10 @@
 
 from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
+import pytest
+
 from services.agents.rejection_risk_agent import RejectionRiskAgent
+from services.config.adk_config import REJECTION_RISK_CONFIG
 
 
 def _async_generator_mock(text: str):
@@ -75,7 +78,7 @@ class TestRejectionRiskAgent:
         mock_srtr = MagicMock()
         mock_srtr.format_for_prompt.return_value = "Population stats: 6.19% rejection rate"
         mock_srtr.get_acute_rejection_rate.return_value = 6.19
-        mock_srtr._summary = {"total_records": 11709}
+        mock_srtr.total_records = 11709
         mock_get_srtr.return_value = mock_srtr
 
         mock_runner_instance = MagicMock()
@@ -169,7 +172,7 @@ class TestRejectionRiskAgent:
         mock_srtr = MagicMock()
         mock_srtr.format_for_prompt.return_value = "Population stats: 6.19% rejection rate"
         mock_srtr.get_acute_rejection_rate.return_value = 6.19
-        mock_srtr._summary = {"total_records": 11709}
+        mock_srtr.total_records = 11709
         mock_get_srtr.return_value = mock_srtr
 
         mock_agent_instance = MagicMock()
@@ -233,3 +236,277 @@ class TestRejectionRiskAgent:
         assert isinstance(result["similar_cases"], list)
         assert "agent_name" in result
         assert "raw_response" in result
+
+    @patch("services.agents.rejection_risk_agent.get_srtr_data")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_build_rejection_prompt_reuses_srtr_stats(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_get_srtr: MagicMock
+    ) -> None:
+        """Test that SRTR statistics are formatted once per age group and month."""
+        # Arrange
+        mock_srtr = MagicMock()
+        mock_srtr.format_for_prompt.return_value = "Population stats"
+        mock_srtr.get_acute_rejection_rate.return_value = 8.5
+        mock_srtr.total_records = 4321
+        mock_get_srtr.return_value = mock_srtr
+
+        agent = RejectionRiskAgent(api_key="test_key")
+
+        # Act
+        prompts = [
+            agent._build_rejection_prompt(
+                symptoms={"fever": 100.5},
+                patient_id=None,
+                patient_context={"organ_type": "lung", "months_post_transplant": 12},
+            )
+            for _ in range(2)
+        ]
+
+        # Assert
+        mock_srtr.format_for_prompt.assert_called_once_with("50-64", 12)
+        mock_srtr.get_acute_rejection_rate.assert_called_once_with("50-64")
+        assert prompts[0] == prompts[1]
+        assert "total_records: 4321" in prompts[0]
+
+    @patch("services.agents.rejection_risk_agent.get_srtr_data")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_build_rejection_prompt_null_organ_defaults_to_kidney(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_get_srtr: MagicMock
+    ) -> None:
+        """Test that an explicit null organ_type falls back to kidney instead of raising."""
+        # Arrange
+        mock_get_srtr.return_value.has_data = False
+        agent = RejectionRiskAgent(api_key="test_key")
+
+        # Act
+        prompt = agent._build_rejection_prompt(
+            symptoms={"fever": 100.5},
+            patient_id=None,
+            patient_context={"organ_type": None},
+        )
+
+        # Assert
+        mock_get_srtr.assert_called_once_with("kidney")
+        assert "SRTR data unavailable" in prompt
+
+
+class TestRejectionResponseCache:
+    """Test suite for RejectionRiskAgent's parsed-result cache."""
+
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_identical_prompt_skips_model_call(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_runner_class: MagicMock
+    ) -> None:
+        """Test that repeats are served from cache as copies, and cache_bust re-asks."""
+        # Arrange
+        mock_runner_instance = MagicMock()
+        mock_runner_class.return_value = mock_runner_instance
+        mock_runner_instance.session_service = AsyncMock()
+        mock_runner_instance.run_async.side_effect = lambda **_: _async_generator_mock(
+            '{"risk_level": "high", "reasoning_steps": ["fever"]}'
+        )
+        agent = RejectionRiskAgent(api_key="test_key")
+
+        # Act
+        first = agent.analyze_rejection_risk(symptoms={"fever": 101.5})
+        first["reasoning_steps"].append("caller edit")
+        second = agent.analyze_rejection_risk(symptoms={"fever": 101.5})
+        agent.analyze_rejection_risk(symptoms={"fever": 101.5}, cache_bust=True)
+
+        # Assert
+        assert mock_runner_instance.run_async.call_count == 2
+        assert second["risk_level"] == "high"
+        assert second["reasoning_steps"] == ["fever"]
+
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_unparseable_response_is_not_cached(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_runner_class: MagicMock
+    ) -> None:
+        """Test that a parse failure is retried on the next identical request."""
+        # Arrange
+        mock_runner_instance = MagicMock()
+        mock_runner_class.return_value = mock_runner_instance
+        mock_runner_instance.session_service = AsyncMock()
+        mock_runner_instance.run_async.side_effect = lambda **_: _async_generator_mock(
+            "no json here"
+        )
+        agent = RejectionRiskAgent(api_key="test_key")
+
+        # Act
+        agent.analyze_rejection_risk(symptoms={"fever": 99.0})
+        agent.analyze_rejection_risk(symptoms={"fever": 99.0})
+
+        # Assert
+        assert mock_runner_instance.run_async.call_count == 2
+
+
+class TestAnalyzeRejectionRiskBatch:
+    """Test suite for RejectionRiskAgent.analyze_rejection_risk_batch."""
+
+    @staticmethod
+    def _mock_runner(mock_runner_class: MagicMock, *texts: str) -> MagicMock:
+        """Configure Runner so successive run_async calls yield the given texts."""
+        mock_runner_instance = MagicMock()
+        mock_runner_class.return_value = mock_runner_instance
+        mock_session_service = AsyncMock()
+        mock_session_service.get_session.return_value = MagicMock()
+        mock_runner_instance.session_service = mock_session_service
+        responses = iter(texts)
+        mock_runner_instance.run_async.side_effect = lambda **_: _async_generator_mock(
+            next(responses)
+        )
+        return mock_runner_instance
+
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_batch_uses_one_call_per_batch(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_runner_class: MagicMock
+    ) -> None:
+        """Test that cases are grouped into batch_size calls and returned in order."""
+        # Arrange
+        runner = self._mock_runner(
+            mock_runner_class,
+            '```json\n[{"risk_level": "high"}, {"risk_level": "low"}]\n```',
+            '{"risk_level": "medium"}',
+        )
+        agent = RejectionRiskAgent(api_key="test_key")
+        cases = [{"symptoms": {"fever": fever}} for fever in (101.5, 98.6, 99.9)]
+
+        # Act
+        results = agent.analyze_rejection_risk_batch(cases, batch_size=2)
+
+        # Assert
+        assert runner.run_async.call_count == 2
+        first_prompt = mock_types.Part.call_args_list[0].kwargs["text"]
+        assert "JSON array of length 2" in first_prompt
+        assert "=== CASE 2 ===" in first_prompt
+        assert [r["risk_level"] for r in results] == ["high", "low", "medium"]
+
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_batch_falls_back_to_single_calls_on_misaligned_output(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock, mock_runner_class: MagicMock
+    ) -> None:
+        """Test that a result count mismatch re-analyzes each case individually."""
+        # Arrange
+        runner = self._mock_runner(
+            mock_runner_class,
+            '[{"risk_level": "high"}]',
+            '{"risk_level": "critical"}',
+            '{"risk_level": "low"}',
+        )
+        agent = RejectionRiskAgent(api_key="test_key")
+        cases = [{"symptoms": {"fever": 102.0}}, {"symptoms": {"fever": 98.6}}]
+
+        # Act
+        results = agent.analyze_rejection_risk_batch(cases)
+
+        # Assert
+        assert runner.run_async.call_count == 3
+        assert [r["risk_level"] for r in results] == ["critical", "low"]
+
+
+class TestRejectionBatchApi:
+    """Test suite for RejectionRiskAgent Gemini Batch API jobs."""
+
+    @patch.dict(
+        "services.agents.rejection_risk_agent.REJECTION_RISK_CONFIG", {"batch_api_enabled": False}
+    )
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    def test_submit_batch_requires_opt_in(
+        self, mock_agent_class: MagicMock, mock_runner_class: MagicMock
+    ) -> None:
+        """Test that submit_batch refuses to run unless REJECTION_BATCH_API is set."""
+        agent = RejectionRiskAgent(api_key="test_key")
+
+        with pytest.raises(RuntimeError, match="REJECTION_BATCH_API"):
+            agent.submit_batch([{"symptoms": {"fever": 101.5}}])
+
+    @patch.dict(
+        "services.agents.rejection_risk_agent.REJECTION_RISK_CONFIG", {"batch_api_enabled": True}
+    )
+    @patch("services.agents.rejection_risk_agent.time.sleep")
+    @patch("services.agents.rejection_risk_agent.genai")
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    def test_submit_and_retrieve_batch(
+        self,
+        mock_agent_class: MagicMock,
+        mock_runner_class: MagicMock,
+        mock_genai: MagicMock,
+        mock_sleep: MagicMock,
+    ) -> None:
+        """Test that one inline request is sent per case and results come back in order."""
+        # Arrange
+        client = mock_genai.Client.return_value
+        client.batches.create.return_value.name = "batches/123"
+        running, done = MagicMock(), MagicMock()
+        running.state.name = "JOB_STATE_RUNNING"
+        done.state.name = "JOB_STATE_SUCCEEDED"
+        done.dest.inlined_responses = [
+            MagicMock(response='{"risk_level": "high"}'),
+            MagicMock(response='{"risk_level": "low"}'),
+        ]
+        client.batches.get.side_effect = [running, done]
+        agent = RejectionRiskAgent(api_key="test_key")
+        cases = [{"symptoms": {"fever": 101.5}}, {"symptoms": {"fever": 98.6}}]
+
+        # Act
+        job_name = agent.submit_batch(cases)
+        results = agent.retrieve_batch(job_name, poll_interval=5)
+
+        # Assert
+        assert job_name == "batches/123"
+        requests = client.batches.create.call_args.kwargs["src"]
+        assert len(requests) == 2
+        assert "101.5" in requests[0]["contents"][0]["parts"][0]["text"]
+        config = requests[0]["config"]
+        assert config["system_instruction"] == REJECTION_RISK_CONFIG["instruction"]
+        assert {"temperature", "top_p", "top_k", "max_output_tokens"} <= config.keys()
+        mock_sleep.assert_called_once_with(5)
+        assert [r["risk_level"] for r in results] == ["high", "low"]
+
+    @patch("services.agents.rejection_risk_agent.genai")
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    def test_retrieve_batch_raises_on_failed_job(
+        self, mock_agent_class: MagicMock, mock_runner_class: MagicMock, mock_genai: MagicMock
+    ) -> None:
+        """Test that a failed job raises instead of returning partial results."""
+        mock_genai.Client.return_value.batches.get.return_value.state.name = "JOB_STATE_FAILED"
+        agent = RejectionRiskAgent(api_key="test_key")
+
+        with pytest.raises(RuntimeError, match="JOB_STATE_FAILED"):
+            agent.retrieve_batch("batches/123")
+
+    @patch("services.agents.rejection_risk_agent.time.monotonic")
+    @patch("services.agents.rejection_risk_agent.time.sleep")
+    @patch("services.agents.rejection_risk_agent.genai")
+    @patch("services.agents.base_adk_agent.Runner")
+    @patch("services.agents.base_adk_agent.Agent")
+    def test_retrieve_batch_raises_after_timeout(
+        self,
+        mock_agent_class: MagicMock,
+        mock_runner_class: MagicMock,
+        mock_genai: MagicMock,
+        mock_sleep: MagicMock,
+        mock_monotonic: MagicMock,
+    ) -> None:
+        """Test that a job still running at the deadline raises TimeoutError."""
+        mock_genai.Client.return_value.batches.get.return_value.state.name = "JOB_STATE_RUNNING"
+        mock_monotonic.side_effect = [0.0, 0.0, 40.0, 60.0]
+        agent = RejectionRiskAgent(api_key="test_key")
+
+        with pytest.raises(TimeoutError, match="JOB_STATE_RUNNING"):
+            agent.retrieve_batch("batches/123", poll_interval=30, timeout=60)
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [30, 20.0]
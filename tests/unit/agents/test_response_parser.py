@@ -1,6 +1,12 @@
 """Unit tests for response_parser module."""
 
-from services.agents.response_parser import extract_json_from_response
+from types import SimpleNamespace
+
+from services.agents.response_parser import (
+    extract_json_from_response,
+    extract_json_list_from_response,
+    extract_response_text,
+)
 
 
 class TestExtractJsonFromResponse:
@@ -190,3 +196,49 @@ Thank you!
         assert result is not None
         assert "Take the medication now" in result["recommendation"]
         assert "Monitor for side effects" in result["recommendation"]
+
+
+class TestExtractJsonListFromResponse:
+    """Test suite for extract_json_list_from_response."""
+
+    def test_extracts_fenced_array(self) -> None:
+        """Test that an array inside a ```json block is parsed."""
+        response = 'Results:\n```json\n[{"a": 1}, {"a": 2}]\n```'
+        assert extract_json_list_from_response(response) == [{"a": 1}, {"a": 2}]
+
+    def test_returns_none_for_object_or_garbage(self) -> None:
+        """Test that non-array or malformed output returns None."""
+        assert extract_json_list_from_response('{"a": 1}') is None
+        assert extract_json_list_from_response("[not json") is None
+        assert extract_json_list_from_response("") is None
+
+
+class TestExtractResponseText:
+    """Test suite for extract_response_text function."""
+
+    def test_returns_string_unchanged(self) -> None:
+        """Test that plain string responses are returned as-is."""
+        text = '{"severity": "none"}'
+        assert extract_response_text(text) is text
+
+    def test_uses_text_attribute(self) -> None:
+        """Test that a response's .text accessor is preferred."""
+        response = SimpleNamespace(text="model output")
+        assert extract_response_text(response) == "model output"
+
+    def test_joins_content_parts(self) -> None:
+        """Test that text is collected from .content.parts when .text is absent."""
+        response = SimpleNamespace(
+            content=SimpleNamespace(
+                parts=[
+                    SimpleNamespace(text="part one "),
+                    SimpleNamespace(text=None),
+                    SimpleNamespace(text="part two"),
+                ]
+            )
+        )
+        assert extract_response_text(response) == "part one part two"
+
+    def test_falls_back_to_str(self) -> None:
+        """Test that unexpected shapes fall back to str()."""
+        assert extract_response_text(42) == "42"
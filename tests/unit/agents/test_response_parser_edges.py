@@ -1,6 +1,9 @@
 """Edge-case tests for response_parser — covers unclosed code blocks and incomplete JSON."""
 
-from services.agents.response_parser import extract_json_from_response
+import logging
+import time
+
+from services.agents.response_parser import MAX_RESPONSE_CHARS, extract_json_from_response
 
 
 class TestExtractCodeBlockEdges:
@@ -34,7 +37,47 @@ class TestFindJsonObjectEdges:
         result = extract_json_from_response(response)
         assert result is not None
 
+    def test_object_followed_by_stray_braces(self):
+        response = 'Result: {"key": {"nested": "}"}} and then {unbalanced'
+        result = extract_json_from_response(response)
+        assert result == {"key": {"nested": "}"}}
+
+    def test_unbalanced_braces_in_large_response_parse_in_linear_time(self):
+        # ~100KB of opening braces with no closing one; a backtracking
+        # search for {...} would be quadratic here
+        response = "{ " * 1000 + "no json here " * 7500
+        start = time.perf_counter()
+        result = extract_json_from_response(response)
+        elapsed = time.perf_counter() - start
+        assert result is None
+        assert elapsed < 0.5
+
+    def test_oversized_response_is_truncated_with_warning(self, caplog):
+        response = '{"risk_level": "high"} ' + "x" * MAX_RESPONSE_CHARS
+        with caplog.at_level(logging.WARNING, logger="services.agents.response_parser"):
+            result = extract_json_from_response(response)
+        assert result == {"risk_level": "high"}
+        assert "Truncating" in caplog.text
+
     def test_no_braces_at_all(self):
         response = "Just plain text with no JSON"
         result = extract_json_from_response(response)
         assert result is None
+
+
+class TestRawJsonFastPath:
+    def test_bare_json_object_with_surrounding_whitespace(self):
+        response = '\n  {"severity": "mild", "interactions": [{"a": 1}]}  \n'
+        result = extract_json_from_response(response)
+        assert result == {"severity": "mild", "interactions": [{"a": 1}]}
+
+    def test_bare_json_containing_code_fence_in_string(self):
+        response = '{"note": "use ```json blocks``` sparingly", "ok": true}'
+        result = extract_json_from_response(response)
+        assert result is not None
+        assert result["ok"] is True
+
+    def test_invalid_leading_braces_fall_through_to_code_block(self):
+        response = '{not json} but later ```json\n{"key": 1}\n```'
+        result = extract_json_from_response(response)
+        assert result == {"key": 1}
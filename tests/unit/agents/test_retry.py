@@ -0,0 +1,75 @@
+"""Unit tests for the transient-error retry decorator."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from services.agents.retry import is_transient, retry_llm
+
+
+class _APIError(Exception):
+    def __init__(self, code):
+        super().__init__(f"status {code}")
+        self.code = code
+
+
+class TestIsTransient:
+    def test_rate_limit_and_server_errors_are_transient(self):
+        assert all(is_transient(_APIError(code)) for code in (429, 500, 503, 529))
+        assert is_transient(TimeoutError())
+
+    def test_client_errors_are_fatal(self):
+        assert not any(is_transient(_APIError(code)) for code in (400, 401, 403, 404))
+        assert not is_transient(ValueError("bad input"))
+
+
+@patch("services.agents.retry.asyncio.sleep", new_callable=AsyncMock)
+class TestRetryLLM:
+    def test_retries_transient_errors_then_succeeds(self, mock_sleep, caplog):
+        call = AsyncMock(side_effect=[_APIError(503), _APIError(429), "ok"])
+
+        with caplog.at_level("WARNING", logger="services.agents.retry"):
+            result = asyncio.run(retry_llm(max_attempts=5, base=1.0)(call)())
+
+        assert result == "ok"
+        assert call.await_count == 3
+        waits = [c.args[0] for c in mock_sleep.await_args_list]
+        assert 1.0 <= waits[0] < 2.0
+        assert 2.0 <= waits[1] < 3.0
+        assert "attempt=1/5 status=503" in caplog.text
+
+    def test_fatal_error_is_not_retried(self, mock_sleep):
+        call = AsyncMock(side_effect=_APIError(400))
+
+        with pytest.raises(_APIError):
+            asyncio.run(retry_llm()(call)())
+
+        assert call.await_count == 1
+        mock_sleep.assert_not_awaited()
+
+    def test_gives_up_after_max_attempts(self, mock_sleep):
+        call = AsyncMock(side_effect=_APIError(503))
+
+        with pytest.raises(_APIError):
+            asyncio.run(retry_llm(max_attempts=3)(call)())
+
+        assert call.await_count == 3
+
+
+class TestRetryDeadline:
+    def test_deadline_cancels_retries_in_progress(self):
+        attempts = 0
+
+        async def _slow_transient_failure():
+            nonlocal attempts
+            attempts += 1
+            await asyncio.sleep(0.02)
+            raise _APIError(503)
+
+        call = retry_llm(max_attempts=5, base=10.0, deadline=0.1)(_slow_transient_failure)
+
+        with pytest.raises(TimeoutError):
+            asyncio.run(call())
+
+        assert attempts == 1
@@ -8,7 +8,7 @@ class TestMedicationAdvisorSRTRException:
     @patch("services.agents.base_adk_agent.Agent")
     @patch("services.agents.base_adk_agent.types")
     def test_build_prompt_handles_srtr_exception(self, mock_types, mock_agent, mock_get_srtr):
-        mock_get_srtr.side_effect = Exception("SRTR unavailable")
+        mock_get_srtr.side_effect = OSError("SRTR unavailable")
 
         from services.agents.medication_advisor_agent import MedicationAdvisorAgent
 
@@ -29,7 +29,7 @@ class TestRejectionRiskSRTRException:
     @patch("services.agents.base_adk_agent.Agent")
     @patch("services.agents.base_adk_agent.types")
     def test_build_prompt_handles_srtr_exception(self, mock_types, mock_agent, mock_get_srtr):
-        mock_get_srtr.side_effect = Exception("SRTR unavailable")
+        mock_get_srtr.side_effect = OSError("SRTR unavailable")
 
         from services.agents.rejection_risk_agent import RejectionRiskAgent
 
@@ -41,3 +41,41 @@ class TestRejectionRiskSRTRException:
         )
 
         assert "WARNING: SRTR data unavailable" in prompt
+
+
+class TestSRTRPrecheck:
+    @patch("services.agents.medication_advisor_agent.get_srtr_data")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_unsupported_organ_skips_srtr_lookup(self, mock_types, mock_agent, mock_get_srtr):
+        from services.agents.medication_advisor_agent import MedicationAdvisorAgent
+
+        agent = MedicationAdvisorAgent(api_key="test")
+        prompt = agent._build_missed_dose_prompt(
+            medication="tacrolimus",
+            scheduled_time="08:00",
+            current_time="12:00",
+            patient_id=None,
+            patient_context={"organ_type": "cornea"},
+        )
+
+        mock_get_srtr.assert_not_called()
+        assert "WARNING: SRTR data unavailable" in prompt
+
+    @patch("services.agents.rejection_risk_agent.get_srtr_data")
+    @patch("services.agents.base_adk_agent.Agent")
+    @patch("services.agents.base_adk_agent.types")
+    def test_missing_data_files_use_notice(self, mock_types, mock_agent, mock_get_srtr):
+        mock_get_srtr.return_value.has_data = False
+
+        from services.agents.rejection_risk_agent import RejectionRiskAgent
+
+        agent = RejectionRiskAgent(api_key="test")
+        prompt = agent._build_rejection_prompt(
+            symptoms={"fever": 101.0},
+            patient_id=None,
+            patient_context={"organ_type": "kidney"},
+        )
+
+        mock_get_srtr.return_value.format_for_prompt.assert_not_called()
+        assert "WARNING: SRTR data unavailable" in prompt
@@ -96,6 +96,29 @@ class TestSymptomMonitorAgent:
         assert "confidence" in result
         assert 0.0 <= result["confidence"] <= 1.0
 
+    @patch("services.agents.symptom_monitor_agent.Agent")
+    @patch("services.agents.symptom_monitor_agent.types")
+    def test_repeat_symptoms_served_from_cache(
+        self, mock_types: MagicMock, mock_agent_class: MagicMock
+    ) -> None:
+        """Test that an identical prompt reuses the cached response unless busted."""
+        # Arrange
+        mock_agent_instance = MagicMock()
+        mock_agent_class.return_value = mock_agent_instance
+        mock_agent_instance.run_async.side_effect = lambda _: _async_return("Agent response")
+
+        agent = SymptomMonitorAgent(api_key="test_key")
+
+        # Act
+        first = agent.analyze_symptoms(symptoms=["fever"])
+        second = agent.analyze_symptoms(symptoms=["fever"])
+        agent.analyze_symptoms(symptoms=["fever"], cache_bust=True)
+
+        # Assert
+        assert mock_agent_instance.run_async.call_count == 2
+        assert second == first
+        assert second is not first
+
     def test_get_rejection_symptoms_reference_structure(self) -> None:
         """Test that rejection symptoms reference has correct structure."""
         # Arrange
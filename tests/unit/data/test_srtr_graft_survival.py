@@ -95,3 +95,44 @@ class TestGraftSurvivalWithData:
             rate = srtr.get_graft_survival_rate(6)
 
             assert rate == 98.0
+
+    def test_keeps_only_graft_survival_records_in_memory(self):
+        data = [
+            {"metric": "acute_rejection_rate", "demographic": "35-49", "value": 6.19},
+            {
+                "metric": "graft_survival",
+                "years_post_transplant": 1.0,
+                "survival_rate": 95.0,
+                "age_group": "35-49",
+            },
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(Path(tmpdir) / "kidney_outcomes_flat.json", "w") as f:
+                json.dump(data, f)
+
+            srtr = SRTROutcomesData(organ="kidney", data_dir=tmpdir)
+
+            assert srtr.data == [data[1]]
+            assert srtr.get_graft_survival_rate(12, "35-49") == 95.0
+
+    def test_age_group_lookup_ignores_other_groups(self):
+        data = [
+            {
+                "metric": "graft_survival",
+                "years_post_transplant": 1.0,
+                "survival_rate": rate,
+                "age_group": age_group,
+            }
+            for age_group, rate in (("35-49", 95.0), ("65+", 90.0), ("35-49", 97.0))
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(Path(tmpdir) / "kidney_outcomes_flat.json", "w") as f:
+                json.dump(data, f)
+
+            srtr = SRTROutcomesData(organ="kidney", data_dir=tmpdir)
+
+            assert srtr.get_graft_survival_rate(12, "35-49") == 96.0
+            assert srtr.get_graft_survival_rate(12, "65+") == 90.0
+            assert srtr.get_graft_survival_rate(12) == 94.0
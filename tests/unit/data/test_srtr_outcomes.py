@@ -107,16 +107,32 @@ class TestSRTROutcomesData:
         """Test initialization with default kidney organ."""
         srtr = SRTROutcomesData(organ="kidney", data_dir=temp_data_dir)
         assert srtr.organ == "kidney"
-        assert srtr._data is not None
+        assert srtr.data is not None
         assert srtr._summary is not None
+        assert srtr.has_data is True
 
     def test_init_lung(self, temp_data_dir):
         """Test initialization with lung organ."""
         srtr = SRTROutcomesData(organ="lung", data_dir=temp_data_dir)
         assert srtr.organ == "lung"
-        assert srtr._data is not None
+        assert srtr.data is not None
         assert srtr._summary is not None
 
+    def test_total_records_from_summary(self, temp_data_dir):
+        """Test that total_records reads the summary, and is None without data files."""
+        assert SRTROutcomesData(organ="kidney", data_dir=temp_data_dir).total_records == 2
+        with tempfile.TemporaryDirectory() as tmpdir:
+            assert SRTROutcomesData(organ="kidney", data_dir=tmpdir).total_records is None
+
+    def test_flat_records_load_on_first_access(self, temp_data_dir):
+        """Test that only the summary is read at construction."""
+        srtr = SRTROutcomesData(organ="kidney", data_dir=temp_data_dir)
+        assert srtr._data is None
+        assert srtr.get_acute_rejection_rate("35-49") > 0
+
+        srtr.get_graft_survival_rate(12, "35-49")
+        assert srtr._data is not None
+
     def test_init_unsupported_organ(self, temp_data_dir):
         """Test initialization fails with unsupported organ."""
         with pytest.raises(ValueError, match="Unsupported organ"):
@@ -126,8 +142,9 @@ class TestSRTROutcomesData:
         """Test initialization with missing data files."""
         with tempfile.TemporaryDirectory() as tmpdir:
             srtr = SRTROutcomesData(organ="kidney", data_dir=tmpdir)
-            assert srtr._data is None
+            assert srtr.data is None
             assert srtr._summary is None
+            assert srtr.has_data is False
 
     def test_get_acute_rejection_rate_specific_age(self, temp_data_dir):
         """Test getting rejection rate for specific age group."""
@@ -226,6 +243,14 @@ class TestSRTROutcomesData:
         assert multiplier == 1.1
         assert "Slight risk" in explanation
 
+    def test_get_risk_multiplier_band_edges(self, temp_data_dir):
+        """Test that a dose exactly on a threshold stays in the lower band."""
+        srtr = SRTROutcomesData(organ="kidney", data_dir=temp_data_dir)
+
+        multipliers = [srtr.get_risk_multiplier(h, "35-49")[0] for h in (2, 6, 12, 12.01)]
+
+        assert multipliers == [1.0, 1.1, 1.2, 1.5]
+
 
 class TestGetSRTRDataFunction:
     """Test suite for get_srtr_data() singleton function."""
@@ -0,0 +1,152 @@
+"""Unit tests for the missed-dose Cloud Run service helpers (services/missed-dose/main.py)."""
+
+import importlib.util
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("flask_cors")
+
+_MAIN_PATH = Path(__file__).resolve().parents[2] / "services" / "missed-dose" / "main.py"
+
+
+@pytest.fixture(scope="module")
+def service():
+    """Import main.py, which lives in a directory that isn't a valid package name."""
+    spec = importlib.util.spec_from_file_location("missed_dose_main", _MAIN_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def firestore(service):
+    """Route Firestore writes to a mock client that hands out a new batch per call."""
+    batches = []
+
+    def _new_batch():
+        batch = MagicMock()
+        batches.append(batch)
+        return batch
+
+    client = MagicMock()
+    client.batch.side_effect = _new_batch
+    service.pending_interactions.clear()
+    with patch.object(service, "firestore_client", return_value=client):
+        yield batches
+    service.pending_interactions.clear()
+
+
+def _strptime_minutes(value):
+    parsed = datetime.strptime(value, "%I:%M %p")
+    return parsed.hour * 60 + parsed.minute
+
+
+class TestClockMinutes:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "12:00 AM",
+            "12:59 AM",
+            "12:00 PM",
+            "12:30 PM",
+            "1:05 AM",
+            "8:00 am",
+            "9:15 pm",
+            "11:59 Pm",
+            "08:00 AM",
+            "8:5 AM",
+            "8:00  AM",
+        ],
+    )
+    def test_matches_strptime(self, service, value):
+        assert service.clock_minutes(value) == _strptime_minutes(value)
+
+    @pytest.mark.parametrize(
+        "value",
+        ["", "8:00", "8 AM", "13:00 PM", "0:30 AM", "012:00 PM", "8:60 AM", "8:00 XM"],
+    )
+    def test_malformed_input_raises_strptime_value_error(self, service, value):
+        with pytest.raises(ValueError):
+            _strptime_minutes(value)
+        with pytest.raises(ValueError):
+            service.clock_minutes(value)
+
+    def test_non_string_raises_type_error(self, service):
+        with pytest.raises(TypeError):
+            service.clock_minutes(None)
+
+
+class TestRecordInteraction:
+    def test_queues_entry_with_timestamp_and_ttl(self, service, firestore):
+        now = datetime(2025, 1, 15, 9, 30)
+
+        service.record_interaction("p1", "missed_dose", {"medication": "tacrolimus"}, now=now)
+
+        assert list(service.pending_interactions) == [
+            {
+                "patient_id": "p1",
+                "timestamp": now,
+                "interaction_type": "missed_dose",
+                "data": {"medication": "tacrolimus"},
+                "ttl": now + timedelta(days=90),
+            }
+        ]
+        assert firestore == []
+
+    def test_full_batch_is_written_by_the_request_that_fills_it(self, service, firestore):
+        with patch.object(service, "INTERACTION_BATCH_SIZE", 2):
+            service.record_interaction("p1", "missed_dose", {})
+            service.record_interaction("p2", "missed_dose", {})
+
+        assert not service.pending_interactions
+        assert sum(batch.set.call_count for batch in firestore) == 2
+        assert all(batch.commit.called for batch in firestore)
+
+
+class TestFlushInteractions:
+    def test_commits_in_batches_of_at_most_batch_size(self, service, firestore):
+        service.pending_interactions.extend({"patient_id": f"p{i}"} for i in range(5))
+
+        with patch.object(service, "INTERACTION_BATCH_SIZE", 2):
+            service.flush_interactions()
+
+        assert not service.pending_interactions
+        assert sum(batch.set.call_count for batch in firestore) == 5
+        assert all(batch.set.call_count <= 2 for batch in firestore)
+        assert all(batch.commit.call_count == 1 for batch in firestore)
+
+    def test_failed_commit_is_logged_and_remaining_batches_still_written(
+        self, service, firestore, caplog
+    ):
+        service.pending_interactions.extend({"patient_id": f"p{i}"} for i in range(4))
+        failing = MagicMock()
+        failing.commit.side_effect = RuntimeError("unavailable")
+        service.firestore_client().batch.side_effect = [failing, MagicMock()]
+
+        with patch.object(service, "INTERACTION_BATCH_SIZE", 2):
+            service.flush_interactions()
+
+        assert not service.pending_interactions
+        assert "Error recording 2 interactions: unavailable" in caplog.text
+
+
+class TestInfrastructureMetadata:
+    @pytest.mark.parametrize(
+        ("name", "agent"),
+        [
+            ("MEDICATION_ADVISOR_INFRASTRUCTURE", "MedicationAdvisor"),
+            ("REJECTION_RISK_INFRASTRUCTURE", "RejectionRiskAnalyzer"),
+            ("DRUG_INTERACTION_INFRASTRUCTURE", "DrugInteractionChecker"),
+        ],
+    )
+    def test_every_endpoint_reports_the_same_deployment(self, service, name, agent):
+        assert getattr(service, name) == {
+            **service._INFRASTRUCTURE_BASE,
+            "agent_used": agent,
+            "region": service._REGION,
+        }
+        assert getattr(service, name)["database"] == "Firestore"